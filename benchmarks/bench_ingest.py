@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# benchmarks/bench_ingest.py
+
+"""
+Benchmark del camino de ingesta de telemetría (sin hardware).
+
+Genera paquetes sintéticos de 31 campos, los parte en bloques como los
+entregaría readyRead y los pasa por SerialWorker.on_ready_read. Reporta en
+JSON: paquetes/s, µs por paquete, latencia por bloque (p50/p99/peor) y
+memoria por paquete según tracemalloc: pico durante la ingesta y bytes y
+objetos que siguen vivos al terminar (historial, buffers que crecen).
+
+Modos: "paquete" (línea por línea), "lotes" (siempre el camino por
+bloques), "auto" (lo que hace el worker por defecto: lotes solo desde
+SerialWorker.BATCH_MIN_LINES líneas por readyRead) y "binario".
+
+--check falla si, en los bloques donde el worker usa lotes, el camino por
+lotes no es al menos tan rápido como el de paquete por paquete (con
+--tolerance de margen por ruido). Medido con 20000 paquetes de ~150 bytes,
+µs por paquete (paquete / lotes):
+
+    256 B   59 / 233      4 KB   44 / 21
+    753 B   47 /  72     16 KB   44 / 17
+    2 KB    52 /  35     64 KB   48 / 19
+
+A 500 paquetes/s y un readyRead cada 10 ms (~750 B) gana paquete por
+paquete; los lotes solo convienen cuando se acumulan lecturas.
+
+Uso:
+    python -m benchmarks.bench_ingest --packets 20000 --rate 500 --modes paquete lotes binario
+    python -m benchmarks.bench_ingest --chunk-bytes 64 4096 --json resultados.json
+    python -m benchmarks.bench_ingest --baseline anterior.json --tolerance 0.2
+    python -m benchmarks.bench_ingest --modes paquete lotes --chunk-bytes 753 4096 16384 --check
+"""
+
+import argparse
+import contextlib
+import gc
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+from PySide6.QtCore import QByteArray
+
+from core.binary_protocol import encode_packet
+from core.packet_schema import row_to_dict
+from core.batch_parser import parse_block
+from core.serial_worker import SerialWorker
+
+
+class FakeSerialPort:
+    """Sustituto de QSerialPort: cada readAll() entrega el siguiente bloque."""
+
+    def __init__(self):
+        self.chunk = b""
+
+    def readAll(self):
+        return QByteArray(self.chunk)
+
+    def isOpen(self):
+        return False
+
+
+def synthetic_packets(n: int, rate: float, seed: int = 0) -> list:
+    """Paquetes CSV (bytes, sin salto de línea) de un vuelo sintético a 'rate' paquetes/s."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(1, n + 1) / rate
+    alt = np.maximum(0.0, 120.0 * t - 4.9 * t ** 2) + rng.normal(0, 0.5, n)
+    imu = rng.normal(0, 3, (n, 7))
+    lines = []
+    for i in range(n):
+        ax, ay, az, pitch, roll, yaw, compass = imu[i]
+        hora = int(t[i])
+        lines.append((
+            f"{ax:.3f},{ay:.3f},{az:.3f},{pitch:.2f},{roll:.2f},{yaw:.2f},{compass % 360:.1f},"
+            f"{19.4284 + i * 1e-7:.6f},{-99.1276 + i * 1e-7:.6f},{alt[i] + 2:.2f},"
+            f"12:{hora // 60 % 60:02d}:{hora % 60:02d},95,88,{t[i] + 30:.2f},{t[i]:.3f},{i + 1},"
+            f"24.5,{101.3 - alt[i] / 120:.3f},{alt[i]:.2f},120,410,38.5,1,1,0,0,1,1,1,0,0"
+        ).encode())
+    return lines
+
+
+def make_stream(lines: list, mode: str) -> bytes:
+    if mode == "binario":
+        block, _, _ = parse_block(lines)
+        return b''.join(encode_packet(row_to_dict(row)) for row in block)
+    return b'\n'.join(lines) + b'\n'
+
+
+def split_chunks(stream: bytes, chunk_bytes: int) -> list:
+    return [stream[i:i + chunk_bytes] for i in range(0, len(stream), chunk_bytes)]
+
+
+def make_worker(mode: str, log_dir: str = None) -> SerialWorker:
+    worker = SerialWorker(protocol="binario" if mode == "binario" else "texto")
+    if mode == "paquete":
+        worker.batch_mode = False
+    elif mode == "lotes":
+        worker.BATCH_MIN_LINES = 1  # Siempre el camino por lotes, sin importar el bloque
+    worker.serial_port = FakeSerialPort()
+    worker.reset_session_data()
+    if log_dir:
+        worker.log_dir = log_dir
+        worker.open_csv_file()
+    return worker
+
+
+def drive(worker: SerialWorker, chunks: list) -> np.ndarray:
+    """Entrega todos los bloques y devuelve la latencia de cada uno (ns)."""
+    port = worker.serial_port
+    latencies = np.empty(len(chunks), dtype=np.int64)
+    clock = time.perf_counter_ns
+    for i, chunk in enumerate(chunks):
+        port.chunk = chunk
+        start = clock()
+        worker.on_ready_read()
+        latencies[i] = clock() - start
+    return latencies
+
+
+def retained_memory(before, after) -> tuple:
+    """(bytes, objetos) que quedaron vivos entre dos snapshots de tracemalloc."""
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    diff = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), 'filename')
+    return sum(d.size_diff for d in diff), sum(d.count_diff for d in diff)
+
+
+def run_case(mode: str, lines: list, chunk_bytes: int, log: bool, mem_packets: int) -> dict:
+    stream = make_stream(lines, mode)
+    chunks = split_chunks(stream, chunk_bytes)
+
+    with tempfile.TemporaryDirectory() as log_dir, \
+            open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        # --- Tiempo ---
+        worker = make_worker(mode, log_dir if log else None)
+        gc.collect()
+        start = time.perf_counter()
+        latencies = drive(worker, chunks)
+        elapsed = time.perf_counter() - start
+        received = worker.gs_packet_count
+        worker.close_csv_file()
+
+        # --- Memoria (corrida aparte, tracemalloc distorsiona el tiempo) ---
+        mem_lines = lines[:mem_packets]
+        mem_chunks = split_chunks(make_stream(mem_lines, mode), chunk_bytes)
+        worker = make_worker(mode, log_dir if log else None)
+        drive(worker, mem_chunks[:max(1, len(mem_chunks) // 10)])  # calentamiento
+        rest = mem_chunks[max(1, len(mem_chunks) // 10):]
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        received_before = worker.gs_packet_count
+        drive(worker, rest)
+        _, peak = tracemalloc.get_traced_memory()
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        mem_received = max(1, worker.gs_packet_count - received_before)
+        worker.close_csv_file()
+        retained = retained_memory(before, after)
+
+    lat_ms = latencies / 1e6
+    per_packet = elapsed / received * 1e6 if received else math.nan
+    return {
+        'mode': mode,
+        'chunk_bytes': chunk_bytes,
+        'chunks': len(chunks),
+        'packets_sent': len(lines),
+        'packets_received': received,
+        'packets_per_s': received / elapsed if elapsed else math.nan,
+        'us_per_packet': per_packet,
+        'chunk_latency_ms': {
+            'p50': float(np.percentile(lat_ms, 50)),
+            'p99': float(np.percentile(lat_ms, 99)),
+            'max': float(lat_ms.max()),
+        },
+        'peak_bytes_per_packet': (peak - base) / mem_received,
+        'retained_bytes_per_packet': retained[0] / mem_received,
+        'retained_objects_per_packet': retained[1] / mem_received,
+        'logging': log,
+    }
+
+
+def compare(results: list, baseline_path: str, tolerance: float) -> list:
+    """Regresiones de µs/paquete respecto a un JSON anterior."""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = {(r['mode'], r['chunk_bytes'], r['logging']): r for r in json.load(f)['results']}
+    regressions = []
+    for r in results:
+        old = baseline.get((r['mode'], r['chunk_bytes'], r['logging']))
+        if old and r['us_per_packet'] > old['us_per_packet'] * (1.0 + tolerance):
+            regressions.append({
+                'mode': r['mode'], 'chunk_bytes': r['chunk_bytes'], 'logging': r['logging'],
+                'us_per_packet': r['us_per_packet'], 'baseline_us_per_packet': old['us_per_packet'],
+            })
+    return regressions
+
+
+def check_batch(results: list, avg_len: float, tolerance: float) -> list:
+    """Bloques con lotes habilitados (>= BATCH_MIN_LINES líneas) donde lotes es más lento."""
+    per_packet = {(r['chunk_bytes'], r['logging']): r for r in results if r['mode'] == 'paquete'}
+    failures = []
+    for r in results:
+        old = per_packet.get((r['chunk_bytes'], r['logging']))
+        if r['mode'] != 'lotes' or old is None:
+            continue
+        if r['chunk_bytes'] / avg_len < SerialWorker.BATCH_MIN_LINES:
+            continue
+        if r['us_per_packet'] > old['us_per_packet'] * (1.0 + tolerance):
+            failures.append({
+                'chunk_bytes': r['chunk_bytes'], 'logging': r['logging'],
+                'lotes_us_per_packet': r['us_per_packet'], 'paquete_us_per_packet': old['us_per_packet'],
+            })
+    return failures
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark de ingesta de SerialWorker")
+    parser.add_argument('--packets', type=int, default=20000)
+    parser.add_argument('--rate', type=float, default=500.0, help="Paquetes por segundo simulados")
+    parser.add_argument('--read-interval-ms', type=float, default=10.0,
+                        help="Cada cuánto llega un readyRead (define el bloque si no se da --chunk-bytes)")
+    parser.add_argument('--chunk-bytes', type=int, nargs='*', help="Tamaños de bloque a probar")
+    parser.add_argument('--modes', nargs='*', default=['paquete', 'lotes', 'binario'],
+                        choices=['paquete', 'lotes', 'auto', 'binario'])
+    parser.add_argument('--log', action='store_true', help="Incluir los logs CSV y binario")
+    parser.add_argument('--mem-packets', type=int, default=5000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', help="Archivo de salida (por defecto stdout)")
+    parser.add_argument('--baseline', help="JSON anterior para detectar regresiones")
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    parser.add_argument('--check', action='store_true',
+                        help="Fallar si lotes es más lento que paquete donde el worker usa lotes")
+    args = parser.parse_args(argv)
+
+    lines = synthetic_packets(args.packets, args.rate, args.seed)
+    avg_len = sum(len(line) + 1 for line in lines) / len(lines)
+    chunk_sizes = args.chunk_bytes or [
+        max(1, int(args.rate * args.read_interval_ms / 1000.0 * avg_len))
+    ]
+
+    results = [
+        run_case(mode, lines, chunk, args.log, args.mem_packets)
+        for mode in args.modes for chunk in chunk_sizes
+    ]
+    report = {
+        'benchmark': 'ingest',
+        'config': vars(args) | {'chunk_sizes': chunk_sizes, 'avg_packet_bytes': avg_len},
+        'environment': {'python': platform.python_version(), 'numpy': np.__version__,
+                        'machine': platform.machine()},
+        'results': results,
+    }
+    status = 0
+    if args.baseline:
+        report['regressions'] = compare(results, args.baseline, args.tolerance)
+        status = 1 if report['regressions'] else 0
+    if args.check:
+        report['batch_slower'] = check_batch(results, avg_len, args.tolerance)
+        status = 1 if report['batch_slower'] else status
+
+    output = json.dumps(report, indent=2)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# core/batch_parser.py
+
+import re
+
+import numpy as np
+
+from core.packet_schema import NUMBER_WIDTH, PACKET_DTYPE, PACKET_FIELDS, PACKET_FIELD_COUNT, PACKET_TOKEN_WIDTHS
+from core.validation import CAMPOS, NUMERIC_INDEX, NUMERIC_KEYS
+
+_NUMBER = re.compile(rb'\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*')
+_COMMA = ord(',')
+_HORA_GPS = [key for _, key, _ in PACKET_FIELDS].index('hora_gps')
+# Columnas (de NUMERIC_KEYS) que se redondean a entero ('i' y 'b')
+_INTEGER_COLUMNS = [j for j, i in enumerate(NUMERIC_INDEX) if PACKET_FIELDS[i][2] in 'ib']
+_INTEGER_POSITION = {j: pos for pos, j in enumerate(_INTEGER_COLUMNS)}
+_NEWLINE = ord('\n')
+_WIDTHS = np.array(PACKET_TOKEN_WIDTHS)
+
+
+def _tokens_to_float(tokens: np.ndarray) -> np.ndarray:
+    """
+    Convierte tokens de texto a float64 sin excepciones: NaN donde el token
+    no es un número (solo se usa si la conversión directa del bloque falla).
+    """
+    flat = tokens.ravel()
+    ok = np.array([_NUMBER.fullmatch(token) is not None for token in flat.tolist()], dtype=bool)
+    values = np.full(flat.shape, np.nan)
+    values[ok] = flat[ok].astype(np.float64)
+    return values.reshape(tokens.shape)
+
+
+def parse_block(lines, validator=None) -> tuple:
+    """
+    Decodifica de una sola vez todas las líneas completas de un bloque.
+
+    Devuelve (bloque, lineas_validas, descartados):
+      - bloque: arreglo estructurado PACKET_DTYPE, un renglón por paquete.
+      - lineas_validas: lista de bytes con el texto original de cada renglón.
+      - descartados: número de líneas con cantidad de campos, anchos o números
+        inválidos (y fuera de rango, si se da un PacketValidator que además
+        los cuenta).
+    Un token más ancho que PACKET_TOKEN_WIDTHS descarta su línea (el arreglo
+    de tokens tiene ancho fijo y lo recortaría en silencio).
+    """
+    if not lines:
+        return np.empty(0, dtype=PACKET_DTYPE), [], 0
+
+    # --- 1. Conteo de campos por línea (vectorizado) ---
+    joined = b'\n'.join(lines) + b'\n'
+    raw = np.frombuffer(joined, dtype=np.uint8)
+    commas = np.cumsum(raw == _COMMA)
+    ends = np.flatnonzero(raw == _NEWLINE)
+    per_line = np.diff(commas[ends], prepend=0)
+    good = per_line == (PACKET_FIELD_COUNT - 1)
+
+    if good.all():
+        good_lines = joined[:-1].split(b'\n')
+    else:
+        good_lines = [bytes(line) for line, ok in zip(lines, good) if ok]
+    n = len(good_lines)
+    discarded = len(lines) - n
+    if validator and discarded:
+        validator.count(CAMPOS, discarded)
+    if n == 0:
+        return np.empty(0, dtype=PACKET_DTYPE), [], discarded
+
+    # --- 2. Tokens en una matriz (n, 31), sin recortar ninguno ---
+    parts = b','.join(good_lines).split(b',')
+    lengths = np.fromiter(map(len, parts), dtype=np.int64, count=len(parts)).reshape(n, PACKET_FIELD_COUNT)
+    tokens = np.array(parts, dtype=f'S{NUMBER_WIDTH}').reshape(n, PACKET_FIELD_COUNT)
+    fits = validator.check_lengths(lengths) if validator else ~(lengths > _WIDTHS).any(axis=1)
+    if not fits.all():
+        tokens = tokens[fits]
+        good_lines = [line for line, ok in zip(good_lines, fits.tolist()) if ok]
+        discarded += n - len(good_lines)
+        n = len(good_lines)
+        if n == 0:
+            return np.empty(0, dtype=PACKET_DTYPE), [], discarded
+
+    # --- 3. Conversión de todos los campos numéricos de una vez ---
+    numeric = tokens[:, NUMERIC_INDEX]
+    try:
+        values = numeric.astype(np.float64)
+    except ValueError:
+        # Caso raro (algún token corrupto): solo aquí se revisa token por token
+        values = _tokens_to_float(numeric)
+
+    # --- 4. Validación (números finitos y rangos) ---
+    if validator:
+        valid = validator.check_matrix(values)
+    else:
+        valid = np.isfinite(values).all(axis=1)
+    if not valid.all():
+        values = values[valid]
+        tokens = tokens[valid]
+
+    block = np.empty(len(values), dtype=PACKET_DTYPE)
+    block['hora_gps'] = np.char.strip(tokens[:, _HORA_GPS])
+    rounded = np.rint(values[:, _INTEGER_COLUMNS]).astype(np.int64)
+    for j, key in enumerate(NUMERIC_KEYS):
+        if j in _INTEGER_POSITION:
+            block[key] = rounded[:, _INTEGER_POSITION[j]]
+        else:
+            block[key] = values[:, j]
+
+    if not valid.all():
+        discarded += int((~valid).sum())
+        good_lines = [line for line, ok in zip(good_lines, valid) if ok]
+
+    return block, good_lines, discarded
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# core/binary_protocol.py
+
+import binascii
+import struct
+
+import numpy as np
+
+from core.packet_schema import PACKET_DTYPE
+
+# Trama binaria compacta (little-endian, sin relleno):
+#   versión | 7 x f32 IMU | lat, lon f64 | alt_gps f32 | hora_gps u32 (hhmmss)
+#   | baterías 2 x u8 | t_encendido, t_mision f32 | no_paquete u32
+#   | temp, pres, alt_baro, tvoc, co2, hum f32 | LEDs u8 (bits) | etapa u8
+#   | error u16 | comando u16 | CRC-16/CCITT u16
+# Cada trama se codifica con COBS y termina en 0x00.
+FRAME_VERSION = 0xC1
+FRAME_DELIMITER = b'\x00'
+
+FRAME_DTYPE = np.dtype([
+    ('version', 'u1'),
+    ('ax', '<f4'), ('ay', '<f4'), ('az', '<f4'),
+    ('pitch', '<f4'), ('roll', '<f4'), ('yaw', '<f4'), ('compass', '<f4'),
+    ('lat', '<f8'), ('lon', '<f8'), ('alt_gps', '<f4'),
+    ('hora_gps', '<u4'),
+    ('bat_control', 'u1'), ('bat_camara', 'u1'),
+    ('t_encendido', '<f4'), ('t_mision', '<f4'),
+    ('no_paquete_enviado', '<u4'),
+    ('temp', '<f4'), ('pres', '<f4'), ('alt_baro', '<f4'),
+    ('tvoc', '<f4'), ('co2', '<f4'), ('hum', '<f4'),
+    ('leds', 'u1'), ('etapa_id', 'u1'),
+    ('error', '<u2'), ('comando', '<u2'),
+    ('crc', '<u2'),
+])
+FRAME_SIZE = FRAME_DTYPE.itemsize
+
+_FRAME_STRUCT = struct.Struct('<B7f2dfIBBffI6fBBHH')
+
+# Orden de los bits del byte de LEDs
+LED_KEYS = ['led_lanz', 'led_p1', 'led_p2', 'led_p3', 'led_cam', 'led_sd']
+
+# Campos que se copian tal cual de la trama al bloque
+_DIRECT_KEYS = [
+    'ax', 'ay', 'az', 'pitch', 'roll', 'yaw', 'compass', 'lat', 'lon', 'alt_gps',
+    'bat_control', 'bat_camara', 't_encendido', 't_mision', 'no_paquete_enviado',
+    'temp', 'pres', 'alt_baro', 'tvoc', 'co2', 'hum', 'etapa_id', 'error', 'comando',
+]
+
+
+def crc16(data) -> int:
+    """CRC-16/CCITT-FALSE (polinomio 0x1021, valor inicial 0xFFFF)."""
+    return binascii.crc_hqx(data, 0xFFFF)
+
+
+def cobs_encode(data: bytes) -> bytes:
+    out = bytearray()
+    for block in bytes(data).split(b'\x00'):
+        # Bloques de más de 254 bytes se parten con el código 0xFF
+        while len(block) >= 254:
+            out.append(0xFF)
+            out += block[:254]
+            block = block[254:]
+        out.append(len(block) + 1)
+        out += block
+    return bytes(out)
+
+
+def cobs_decode(data) -> bytes:
+    """Decodifica una trama COBS (sin el 0x00 final). Devuelve None si es inválida."""
+    data = bytes(data)
+    out = bytearray()
+    i = 0
+    n = len(data)
+    while i < n:
+        code = data[i]
+        if code == 0 or i + code > n:
+            return None
+        out += data[i + 1:i + code]
+        i += code
+        if code != 0xFF and i < n:
+            out.append(0)
+    return bytes(out)
+
+
+def encode_packet(data: dict) -> bytes:
+    """Codifica un paquete (dict con las llaves de PACKET_KEYS) como trama COBS."""
+    hora = str(data.get('hora_gps', '0')).replace(':', '')
+    leds = 0
+    for bit, key in enumerate(LED_KEYS):
+        if data[key]:
+            leds |= 1 << bit
+    payload = _FRAME_STRUCT.pack(
+        FRAME_VERSION,
+        data['ax'], data['ay'], data['az'], data['pitch'], data['roll'], data['yaw'], data['compass'],
+        data['lat'], data['lon'], data['alt_gps'],
+        int(hora) if hora.isdigit() else 0,
+        data['bat_control'], data['bat_camara'],
+        data['t_encendido'], data['t_mision'],
+        data['no_paquete_enviado'],
+        data['temp'], data['pres'], data['alt_baro'], data['tvoc'], data['co2'], data['hum'],
+        leds, data['etapa_id'], data['error'], data['comando'],
+    )
+    payload += struct.pack('<H', crc16(payload))
+    return cobs_encode(payload) + FRAME_DELIMITER
+
+
+def decode_frames(frames) -> tuple:
+    """
+    Decodifica una lista de tramas COBS (sin delimitador) a un bloque PACKET_DTYPE.
+    Devuelve (bloque, descartados). Se descartan tramas con tamaño,
+    versión o CRC inválidos.
+    """
+    payloads = []
+    discarded = 0
+    for frame in frames:
+        if not len(frame):
+            continue
+        payload = cobs_decode(frame)
+        if (payload is None or len(payload) != FRAME_SIZE
+                or payload[0] != FRAME_VERSION
+                or crc16(payload[:-2]) != int.from_bytes(payload[-2:], 'little')):
+            discarded += 1
+            continue
+        payloads.append(payload)
+
+    if not payloads:
+        return np.empty(0, dtype=PACKET_DTYPE), discarded
+
+    frames_arr = np.frombuffer(b''.join(payloads), dtype=FRAME_DTYPE)
+    block = np.empty(len(frames_arr), dtype=PACKET_DTYPE)
+    for key in _DIRECT_KEYS:
+        block[key] = frames_arr[key]
+    for bit, key in enumerate(LED_KEYS):
+        block[key] = (frames_arr['leds'] >> bit) & 1
+
+    # hhmmss -> "hh:mm:ss"
+    block['hora_gps'] = [
+        f"{h // 10000:02d}:{h // 100 % 100:02d}:{h % 100:02d}".encode()
+        for h in frames_arr['hora_gps'].tolist()
+    ]
+    return block, discarded
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# core/columnar_log.py
+
+import json
+import os
+import struct
+
+import numpy as np
+
+from core.flight_logger import AsyncFileWriter
+from core.packet_schema import PACKET_CSV_NAMES, PACKET_DTYPE, PACKET_KEYS
+
+# Formato del log binario por columnas (.clog):
+#   Encabezado: b'CENTCLG1' | u32 largo del JSON | JSON (columnas, tamaño de bloque)
+#               relleno hasta múltiplo de 64 bytes
+#   Bloques de tamaño fijo: u32 magic | u32 renglones | una columna tras otra,
+#               cada una con 'chunk_rows' valores (los sobrantes en cero)
+# Índice (.clog.idx): un registro INDEX_DTYPE por bloque sellado.
+FILE_MAGIC = b'CENTCLG1'
+CHUNK_MAGIC = 0x4B4E4843  # "CHNK"
+HEADER_ALIGN = 64
+
+# Mismas columnas que SerialWorker.CSV_HEADER
+LOG_COLUMNS = (
+    [('Contador_Paquetes_GS', np.dtype('<i8'))]
+    + [(name, PACKET_DTYPE[key]) for name, key in zip(PACKET_CSV_NAMES, PACKET_KEYS)]
+    + [('Velocidad_Calculada_Z', np.dtype('<f8'))]
+)
+
+INDEX_DTYPE = np.dtype([
+    ('offset', '<u8'), ('nrows', '<u4'), ('reserved', '<u4'),
+    ('t_first', '<f8'), ('t_last', '<f8'),
+    ('pkt_first', '<i8'), ('pkt_last', '<i8'),
+])
+
+_TIME_COLUMN = 'Tiempo_Mision'
+_PACKET_COLUMN = 'No_Paquete_Enviado'
+
+
+def chunk_dtype(columns, chunk_rows: int) -> np.dtype:
+    return np.dtype(
+        [('magic', '<u4'), ('nrows', '<u4')]
+        + [(name, dtype, (chunk_rows,)) for name, dtype in columns]
+    )
+
+
+def _header_bytes(columns, chunk_rows: int) -> bytes:
+    meta = json.dumps({
+        'version': 1,
+        'chunk_rows': chunk_rows,
+        'columns': [[name, dtype.str] for name, dtype in columns],
+    }).encode('utf-8')
+    header = FILE_MAGIC + struct.pack('<I', len(meta)) + meta
+    return header + b'\0' * (-len(header) % HEADER_ALIGN)
+
+
+class ColumnarLogWriter(AsyncFileWriter):
+    """
+    Log de vuelo binario por columnas, escrito desde un hilo propio.
+
+    Los renglones se acumulan en un bloque de tamaño fijo; al llenarse se
+    escribe y se agrega su entrada al índice. En cada flush el bloque
+    parcial también se escribe en su lugar, así un corte de energía pierde
+    a lo más el último intervalo de flush.
+    """
+
+    def __init__(self, filename: str, chunk_rows: int = 256, columns=LOG_COLUMNS, **kwargs):
+        kwargs.setdefault('batch_size', 64)
+        super().__init__(filename, **kwargs)
+        self.columns = list(columns)
+        self.chunk_rows = chunk_rows
+        self._chunk_dtype = chunk_dtype(self.columns, chunk_rows)
+
+        header = _header_bytes(self.columns, chunk_rows)
+        self._file.write(header)
+        self._data_offset = len(header)
+        self._index_file = open(filename + '.idx', 'wb')
+
+        self._chunk = np.zeros(1, dtype=self._chunk_dtype)
+        self._chunk['magic'] = CHUNK_MAGIC
+        self._chunk_no = 0
+        self._filled = 0
+        self._dirty = False
+        self.start()
+
+    def write_block(self, block: np.ndarray, first_count: int, velocities) -> bool:
+        """Encola un bloque PACKET_DTYPE con su contador GS inicial y velocidades."""
+        return self.submit([(block, first_count, np.asarray(velocities, dtype=np.float64))], len(block))
+
+    # --- Hilo escritor ---
+    def _chunk_offset(self) -> int:
+        return self._data_offset + self._chunk_no * self._chunk_dtype.itemsize
+
+    def _write_chunk(self) -> int:
+        self._chunk['nrows'] = self._filled
+        self._file.seek(self._chunk_offset())
+        data = self._chunk.tobytes()
+        self._file.write(data)
+        return len(data)
+
+    def _seal_chunk(self) -> int:
+        size = self._write_chunk()
+        n = self._filled
+        entry = np.zeros(1, dtype=INDEX_DTYPE)
+        entry['offset'] = self._chunk_offset()
+        entry['nrows'] = n
+        entry['t_first'] = self._chunk[_TIME_COLUMN][0, 0]
+        entry['t_last'] = self._chunk[_TIME_COLUMN][0, n - 1]
+        entry['pkt_first'] = self._chunk[_PACKET_COLUMN][0, 0]
+        entry['pkt_last'] = self._chunk[_PACKET_COLUMN][0, n - 1]
+        self._index_file.write(entry.tobytes())
+
+        self._chunk_no += 1
+        self._filled = 0
+        self._dirty = False
+        for name, _ in self.columns:
+            self._chunk[name] = 0
+        return size
+
+    def _batch_rows(self, batch: list) -> int:
+        return sum(len(block) for block, _, _ in batch)
+
+    def _write_batch(self, batch: list) -> tuple:
+        rows = 0
+        size = 0
+        for block, first_count, velocities in batch:
+            n = len(block)
+            columns = {
+                'Contador_Paquetes_GS': np.arange(first_count, first_count + n),
+                'Velocidad_Calculada_Z': velocities,
+            }
+            for name, key in zip(PACKET_CSV_NAMES, PACKET_KEYS):
+                columns[name] = block[key]
+
+            pos = 0
+            while pos < n:
+                take = min(n - pos, self.chunk_rows - self._filled)
+                for name, _ in self.columns:
+                    self._chunk[name][0, self._filled:self._filled + take] = columns[name][pos:pos + take]
+                self._filled += take
+                self._dirty = True
+                pos += take
+                if self._filled == self.chunk_rows:
+                    size += self._seal_chunk()
+            rows += n
+        return rows, size
+
+    def _flush(self):
+        if self._dirty:
+            self._write_chunk()
+            self._dirty = False
+        self._file.flush()
+        self._index_file.flush()
+
+    def _fsync(self):
+        super()._fsync()
+        os.fsync(self._index_file.fileno())
+
+    def _close(self):
+        if self._filled:
+            self._seal_chunk()
+        self._file.close()
+        self._index_file.close()
+
+
+class ColumnarLogReader:
+    """
+    Lector del log binario por columnas usando np.memmap.
+
+    Tolera archivos cortados a media escritura: se ignoran los bytes de un
+    bloque incompleto al final y cualquier bloque con encabezado inválido.
+    Si el índice falta o está incompleto se reconstruye desde los bloques.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            head = f.read(len(FILE_MAGIC) + 4)
+            if len(head) < len(FILE_MAGIC) + 4 or head[:len(FILE_MAGIC)] != FILE_MAGIC:
+                raise ValueError(f"{path} no es un log por columnas")
+            (meta_len,) = struct.unpack('<I', head[len(FILE_MAGIC):])
+            meta = json.loads(f.read(meta_len).decode('utf-8'))
+
+        self.chunk_rows = meta['chunk_rows']
+        self.columns = [(name, np.dtype(dt)) for name, dt in meta['columns']]
+        self.column_names = [name for name, _ in self.columns]
+        self._chunk_dtype = chunk_dtype(self.columns, self.chunk_rows)
+        data_offset = len(_header_bytes(self.columns, self.chunk_rows))
+
+        size = os.path.getsize(path)
+        n_chunks = max(0, (size - data_offset) // self._chunk_dtype.itemsize)
+        if n_chunks:
+            chunks = np.memmap(path, dtype=self._chunk_dtype, mode='r',
+                               offset=data_offset, shape=(n_chunks,))
+            ok = (chunks['magic'] == CHUNK_MAGIC) & (chunks['nrows'] <= self.chunk_rows)
+            bad = np.flatnonzero(~ok)
+            n_chunks = int(bad[0]) if len(bad) else n_chunks
+            chunks = chunks[:n_chunks]
+        else:
+            chunks = np.empty(0, dtype=self._chunk_dtype)
+
+        self.chunks = chunks
+        self.chunk_nrows = np.asarray(chunks['nrows'], dtype=np.int64)
+        self.n_rows = int(self.chunk_nrows.sum())
+        self._data_offset = data_offset
+        self.index = self._load_index()
+
+    def __len__(self):
+        return self.n_rows
+
+    def _load_index(self) -> np.ndarray:
+        entries = np.empty(0, dtype=INDEX_DTYPE)
+        idx_path = self.path + '.idx'
+        if os.path.exists(idx_path):
+            raw = open(idx_path, 'rb').read()
+            raw = raw[:len(raw) - len(raw) % INDEX_DTYPE.itemsize]
+            entries = np.frombuffer(raw, dtype=INDEX_DTYPE)[:len(self.chunks)]
+
+        missing = len(self.chunks) - len(entries)
+        if missing <= 0:
+            return entries
+
+        # Reconstruir las entradas faltantes (bloques no sellados o índice cortado)
+        rebuilt = np.zeros(missing, dtype=INDEX_DTYPE)
+        for j, i in enumerate(range(len(entries), len(self.chunks))):
+            n = int(self.chunk_nrows[i])
+            rebuilt[j]['offset'] = self._data_offset + i * self._chunk_dtype.itemsize
+            rebuilt[j]['nrows'] = n
+            if n:
+                t = self.chunks[i][_TIME_COLUMN]
+                p = self.chunks[i][_PACKET_COLUMN]
+                rebuilt[j]['t_first'], rebuilt[j]['t_last'] = t[0], t[n - 1]
+                rebuilt[j]['pkt_first'], rebuilt[j]['pkt_last'] = p[0], p[n - 1]
+        return np.concatenate((entries, rebuilt))
+
+    def chunk_column(self, chunk: int, name: str) -> np.ndarray:
+        """Vista (memmap, sin copia) de una columna dentro de un bloque."""
+        return self.chunks[chunk][name][:self.chunk_nrows[chunk]]
+
+    def column(self, name: str, start: int = 0, stop: int = None) -> np.ndarray:
+        """Columna completa (o el rango [start, stop) de renglones)."""
+        stop = self.n_rows if stop is None else min(stop, self.n_rows)
+        if stop <= start:
+            return np.empty(0, dtype=dict(self.columns)[name])
+        ends = np.cumsum(self.chunk_nrows)
+        first = int(np.searchsorted(ends, start, side='right'))
+        last = int(np.searchsorted(ends, stop - 1, side='right'))
+        data = self.chunks[name][first:last + 1]
+        if (self.chunk_nrows[first:last] == self.chunk_rows).all():
+            # Todos los bloques llenos salvo quizá el último: un solo reshape
+            flat = data.reshape(-1)
+        else:
+            flat = np.concatenate([data[i][:self.chunk_nrows[first + i]] for i in range(len(data))])
+        base = int(ends[first] - self.chunk_nrows[first])
+        return flat[start - base:stop - base]
+
+    def columns_dict(self, start: int = 0, stop: int = None) -> dict:
+        return {name: self.column(name, start, stop) for name in self.column_names}
+
+    def _row_of(self, chunk: int, offset: int) -> int:
+        return int(self.chunk_nrows[:chunk].sum()) + offset
+
+    def rows_for_time(self, t0: float, t1: float) -> tuple:
+        """Rango de renglones [inicio, fin) con Tiempo_Mision entre t0 y t1 (tiempo creciente)."""
+        if not len(self.index):
+            return 0, 0
+        c0 = max(0, int(np.searchsorted(self.index['t_last'], t0, side='left')))
+        c1 = min(len(self.index) - 1, int(np.searchsorted(self.index['t_first'], t1, side='right')) - 1)
+        if c0 >= len(self.index) or c1 < c0:
+            return 0, 0
+        start = self._row_of(c0, int(np.searchsorted(self.chunk_column(c0, _TIME_COLUMN), t0, side='left')))
+        stop = self._row_of(c1, int(np.searchsorted(self.chunk_column(c1, _TIME_COLUMN), t1, side='right')))
+        return start, stop
+
+    def find_packet(self, packet_no: int) -> int:
+        """Renglón del paquete con ese No_Paquete_Enviado, o -1 si no está."""
+        hits = np.flatnonzero((self.index['pkt_first'] <= packet_no) & (self.index['pkt_last'] >= packet_no))
+        for chunk in hits:
+            found = np.flatnonzero(self.chunk_column(int(chunk), _PACKET_COLUMN) == packet_no)
+            if len(found):
+                return self._row_of(int(chunk), int(found[0]))
+        return -1
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# core/diversity.py
+
+import time
+
+import numpy as np
+
+
+class SequenceWindow:
+    """
+    Ventana deslizante de números de paquete ya vistos (mapa de bits).
+
+    El bit 0 es el número más alto visto ('head'); el bit k, head - k.
+    Avanzar la ventana es un corrimiento del entero de 'size' bits, así
+    que agregar un número cuesta lo mismo sin importar cuántos lleguen.
+    Un número más viejo que la ventana se toma como reinicio del contador
+    del vehículo: se empieza de nuevo (las pérdidas previas se conservan).
+    Con repeats_restart (ventana de un solo receptor, que nunca recibe dos
+    veces el mismo número) también un número ya visto es un reinicio: el
+    vehículo pudo reiniciarse antes de llegar a 'size' paquetes.
+
+    Pérdidas = números que faltan entre el primero y el más alto vistos;
+    un paquete que llega tarde (fuera de orden) deja de contar como perdido.
+    """
+
+    def __init__(self, size: int = 1024, repeats_restart: bool = False):
+        self.size = size
+        self.repeats_restart = repeats_restart
+        self._mask = (1 << size) - 1
+        self.reset()
+
+    def reset(self):
+        self.head = None
+        self.first = None
+        self.bits = 0
+        self.count = 0        # Números distintos vistos desde el último reinicio
+        self.lost_before = 0  # Pérdidas acumuladas antes de reinicios del contador
+        self.received_before = 0  # Números distintos vistos antes de esos reinicios
+        self.restarts = 0
+
+    @property
+    def lost(self) -> int:
+        if self.head is None:
+            return self.lost_before
+        return self.lost_before + (self.head - self.first + 1 - self.count)
+
+    @property
+    def received(self) -> int:
+        """Números distintos vistos en total (también antes de reinicios)."""
+        return self.received_before + self.count
+
+    @property
+    def expected(self) -> int:
+        """Paquetes que el vehículo envió según los números vistos."""
+        return self.received + self.lost
+
+    def add(self, seq: int) -> bool:
+        """Marca 'seq'; True si es la primera vez que se ve."""
+        if self.head is None:
+            self.head = self.first = seq
+            self.bits = 1
+            self.count = 1
+            return True
+        d = seq - self.head
+        if d > 0:
+            self.bits = ((self.bits << d) | 1) & self._mask if d < self.size else 1
+            self.head = seq
+        elif -d < self.size:
+            bit = 1 << -d
+            if self.bits & bit:
+                if self.repeats_restart:
+                    self.restart(seq)
+                    return True
+                return False
+            self.bits |= bit
+            if seq < self.first:
+                self.first = seq
+        else:
+            # Mucho más viejo que la ventana: el vehículo reinició su contador
+            self.restart(seq)
+            return True
+        self.count += 1
+        return True
+
+    def restart(self, seq: int):
+        """El contador del vehículo volvió a empezar en 'seq'."""
+        self.lost_before = self.lost
+        self.received_before += self.count
+        self.restarts += 1
+        self.head = self.first = seq
+        self.bits = 1
+        self.count = 1
+
+
+class DiversityMerger:
+    """
+    Combina los paquetes de varios receptores del mismo vehículo.
+
+    Cada receptor entrega sus paquetes ya validados; se conserva la primera
+    copia de cada No_Paquete_Enviado (la que pasó la validación primero) y
+    se descartan las repetidas. Por receptor se lleva su propia ventana
+    (pérdida de ese enlace) y cuántos paquetes aportó que nadie más tenía
+    primero; la ventana combinada da la pérdida efectiva.
+    Los reinicios del contador del vehículo se detectan en la ventana de
+    cada receptor (ahí un número repetido solo puede ser un reinicio) y el
+    primero que lo ve reinicia también la combinada; en la combinada un
+    número repetido es la copia de otro receptor.
+    Costo constante por paquete; vive en el hilo del worker principal.
+    """
+
+    def __init__(self, window: int = 1024, interval: float = 5.0):
+        self.window = window
+        self.interval = interval
+        self.reset()
+
+    def reset(self):
+        self.combined = SequenceWindow(self.window)
+        self.receivers = {}  # nombre -> [SequenceWindow, primeras copias, repetidos]
+        self._last_report = time.monotonic()
+
+    def _receiver(self, name: str) -> list:
+        entry = self.receivers.get(name)
+        if entry is None:
+            entry = self.receivers[name] = [SequenceWindow(self.window, repeats_restart=True), 0, 0]
+        return entry
+
+    @property
+    def lost(self) -> int:
+        return self.combined.lost
+
+    def accept(self, name: str, seq: int) -> bool:
+        """True si es la primera copia de 'seq' (hay que procesarla)."""
+        entry = self._receiver(name)
+        window = entry[0]
+        window.add(seq)
+        if window.restarts > self.combined.restarts:
+            # Primer receptor que ve el reinicio del vehículo
+            self.combined.restart(seq)
+            entry[1] += 1
+            return True
+        if self.combined.add(seq):
+            entry[1] += 1
+            return True
+        entry[2] += 1
+        return False
+
+    def accept_block(self, name: str, seqs: np.ndarray) -> np.ndarray:
+        """accept() para un bloque; devuelve la máscara de renglones a procesar."""
+        accept = self.accept
+        return np.fromiter((accept(name, seq) for seq in seqs.tolist()), dtype=bool, count=len(seqs))
+
+    def stats(self) -> dict:
+        """{'combinado': {...}, nombre: {...}} con recibidos, perdidos y % de pérdida."""
+        def loss(window):
+            expected = window.expected
+            return {'recibidos': window.received, 'perdidos': window.lost,
+                    'perdida_pct': 100.0 * window.lost / expected if expected else 0.0}
+        result = {'combinado': loss(self.combined)}
+        for name, (window, first, duplicates) in self.receivers.items():
+            result[name] = dict(loss(window), primeros=first, repetidos=duplicates)
+        return result
+
+    def report(self, now: float = None):
+        """Resumen de la pérdida por receptor y combinada cada 'interval' s (o None)."""
+        now = time.monotonic() if now is None else now
+        if now - self._last_report < self.interval or not self.receivers:
+            return None
+        self._last_report = now
+        stats = self.stats()
+        combined = stats.pop('combinado')
+        text = f"Diversidad: combinado {combined['perdida_pct']:.1f} % perdidos ({combined['perdidos']})"
+        for name, s in stats.items():
+            text += f" | {name} {s['perdida_pct']:.1f} % (primeros {s['primeros']})"
+        return text
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# core/estimator.py
+
+import argparse
+import csv
+import math
+import sys
+
+import numpy as np
+
+
+class AltitudeEstimator:
+    """
+    Estimador de altitud y velocidad vertical (filtro de Kalman de 3 estados).
+
+    Estado: [altitud h, velocidad v, sesgo del acelerómetro b].
+      - Predicción con Acc_z como entrada: a = az - b. El sesgo absorbe la
+        gravedad y el error de montaje; se inicia con la primera lectura
+        (cohete en la rampa, a = 0) y después solo deriva lentamente.
+      - Corrección con Altitud_Barometro en cada paquete y con Altitud_GPS
+        solo cuando llega un dato nuevo (el GPS se repite entre fijas y 0
+        significa sin fija). El GPS se lleva al marco del barómetro restando
+        un desfase que se sigue con un promedio lento ('gps_offset_tau').
+      - Mediciones a más de 'gate' sigmas se ignoran (picos del barómetro);
+        tras 'max_rejects' rechazos seguidos se reinicia la altitud.
+
+    Todo son operaciones escalares sobre la covarianza 3x3 guardada en
+    variables: costo constante por paquete, sin ventanas ni listas.
+    update() devuelve (altitud, velocidad, sigma_altitud, sigma_velocidad).
+    """
+
+    def __init__(self, sigma_accel: float = None, sigma_bias: float = 0.05,
+                 sigma_baro: float = 1.5, sigma_gps: float = 8.0,
+                 use_accel: bool = True, gate: float = 5.0, max_rejects: int = 10,
+                 gps_offset_tau: float = 30.0):
+        # Sin acelerómetro la aceleración real (motor, paracaídas) es ruido del modelo
+        self.sigma_accel = sigma_accel if sigma_accel is not None else (2.0 if use_accel else 30.0)
+        self.sigma_bias = sigma_bias
+        self.r_baro = sigma_baro ** 2
+        self.r_gps = sigma_gps ** 2
+        self.use_accel = use_accel
+        self.gate2 = gate ** 2
+        self.max_rejects = max_rejects
+        self.gps_offset_tau = gps_offset_tau
+        self.reset()
+
+    def reset(self):
+        self.initialized = False
+        self.last_t = 0.0
+        self.last_gps = 0.0
+        self.gps_offset = None
+        self.rejects = 0
+        self.h = self.v = self.b = 0.0
+        # Covarianza simétrica: p00 p01 p02 / p11 p12 / p22
+        self.p00 = self.p01 = self.p02 = self.p11 = self.p12 = self.p22 = 0.0
+
+    @property
+    def altitude(self) -> float:
+        return self.h
+
+    @property
+    def velocity(self) -> float:
+        return self.v
+
+    @property
+    def sigma_altitude(self) -> float:
+        return math.sqrt(max(self.p00, 0.0))
+
+    @property
+    def sigma_velocity(self) -> float:
+        return math.sqrt(max(self.p11, 0.0))
+
+    def state(self) -> tuple:
+        return self.h, self.v, self.sigma_altitude, self.sigma_velocity
+
+    # --- Filtro ---
+    def _start(self, t: float, alt_baro: float, az: float):
+        self.initialized = True
+        self.last_t = t
+        self.h = alt_baro
+        self.v = 0.0
+        self.b = az if self.use_accel else 0.0
+        self.p00 = self.r_baro
+        self.p01 = self.p02 = self.p12 = 0.0
+        self.p11 = 25.0
+        self.p22 = 1.0
+        self.rejects = 0
+
+    def _predict(self, dt: float, az: float):
+        dt2 = dt * dt
+        if self.use_accel:
+            # F = [[1, dt, -dt²/2], [0, 1, -dt], [0, 0, 1]], entrada az
+            a = az - self.b
+            self.h += self.v * dt + 0.5 * a * dt2
+            self.v += a * dt
+            c = -0.5 * dt2
+            p00, p01, p02, p11, p12, p22 = self.p00, self.p01, self.p02, self.p11, self.p12, self.p22
+            # P' = F P Fᵀ
+            r0 = (p00 + dt * p01 + c * p02, p01 + dt * p11 + c * p12, p02 + dt * p12 + c * p22)
+            r1 = (p01 - dt * p02, p11 - dt * p12, p12 - dt * p22)
+            self.p00 = r0[0] + dt * r0[1] + c * r0[2]
+            self.p01 = r0[1] - dt * r0[2]
+            self.p02 = r0[2]
+            self.p11 = r1[1] - dt * r1[2]
+            self.p12 = r1[2]
+            self.p22 = p22 + self.sigma_bias ** 2 * dt
+        else:
+            # Velocidad constante; la aceleración entra solo como ruido
+            self.h += self.v * dt
+            self.p00 += dt * (2.0 * self.p01 + dt * self.p11)
+            self.p01 += dt * self.p11
+        # Ruido de la aceleración (modelo de aceleración constante por tramo)
+        q = self.sigma_accel ** 2
+        self.p00 += 0.25 * dt2 * dt2 * q
+        self.p01 += 0.5 * dt2 * dt * q
+        self.p11 += dt2 * q
+
+    def _correct(self, z: float, r: float) -> bool:
+        """Corrección escalar con una medición de altitud; False si se rechazó."""
+        y = z - self.h
+        s = self.p00 + r
+        if y * y > self.gate2 * s:
+            return False
+        k0, k1, k2 = self.p00 / s, self.p01 / s, self.p02 / s
+        self.h += k0 * y
+        self.v += k1 * y
+        self.b += k2 * y
+        p00, p01, p02 = self.p00, self.p01, self.p02
+        # P' = (I - K H) P con H = [1, 0, 0]
+        self.p00 -= k0 * p00
+        self.p01 -= k0 * p01
+        self.p02 -= k0 * p02
+        self.p11 -= k1 * p01
+        self.p12 -= k1 * p02
+        self.p22 -= k2 * p02
+        return True
+
+    def _step(self, dt: float, alt_baro: float, gps, az: float):
+        if dt > 0:
+            self._predict(dt, az)
+        if self._correct(alt_baro, self.r_baro):
+            self.rejects = 0
+        else:
+            self.rejects += 1
+            if self.rejects >= self.max_rejects:
+                # El barómetro lleva rato lejos del modelo: se confía en él
+                self.h = alt_baro
+                self.p00 = self.r_baro
+                self.p01 = self.p02 = 0.0
+                self.p11 += 100.0
+                self.rejects = 0
+        if gps is not None:
+            if self.gps_offset is None:
+                self.gps_offset = gps - self.h
+            else:
+                self._correct(gps - self.gps_offset, self.r_gps)
+                alpha = min(max(dt, 0.0) / self.gps_offset_tau, 1.0) if self.gps_offset_tau > 0 else 0.0
+                self.gps_offset += alpha * (gps - self.h - self.gps_offset)
+
+    def update(self, t: float, alt_baro: float, alt_gps: float = 0.0, az: float = 0.0) -> tuple:
+        """Incorpora un paquete y devuelve (altitud, velocidad, sigma_h, sigma_v)."""
+        if not self.initialized:
+            self._start(t, alt_baro, az)
+            self.last_gps = alt_gps
+            return self.state()
+        dt = t - self.last_t
+        if dt > 0:
+            self.last_t = t  # Un paquete atrasado (otro receptor) no retrocede el reloj
+        gps = alt_gps if alt_gps != self.last_gps and alt_gps != 0.0 else None
+        self.last_gps = alt_gps
+        self._step(dt, alt_baro, gps, az)
+        return self.state()
+
+    def update_block(self, t, alt_baro, alt_gps=None, az=None) -> tuple:
+        """
+        Incorpora un bloque de paquetes; devuelve arreglos (altitud, velocidad,
+        sigma_h, sigma_v), uno por paquete, iguales a llamar update() uno a uno.
+
+        La recursión es secuencial por naturaleza: los intervalos, las
+        máscaras de GPS nuevo y las conversiones se calculan vectorizados y
+        el lazo solo hace la aritmética escalar del filtro.
+        """
+        t = np.asarray(t, dtype=np.float64)
+        n = len(t)
+        out = np.empty((4, n), dtype=np.float64)
+        if n == 0:
+            return out[0], out[1], out[2], out[3]
+        alt_baro = np.asarray(alt_baro, dtype=np.float64)
+        alt_gps = np.zeros(n) if alt_gps is None else np.asarray(alt_gps, dtype=np.float64)
+        az = np.zeros(n) if az is None else np.asarray(az, dtype=np.float64)
+
+        start = 0
+        if not self.initialized:
+            self._start(float(t[0]), float(alt_baro[0]), float(az[0]))
+            self.last_gps = float(alt_gps[0])
+            out[:, 0] = self.h, self.v, self.p00, self.p11
+            start = 1
+        # Intervalo respecto al reloj del filtro (que no retrocede con paquetes atrasados)
+        # (fmax: un tiempo NaN no contamina el reloj, igual que en update())
+        clock = np.fmax.accumulate(np.concatenate(([self.last_t], t[start:])))
+        dt = t[start:] - clock[:-1]
+        prev_gps = np.concatenate(([self.last_gps], alt_gps[start:-1]))
+        new_gps = (alt_gps[start:] != prev_gps) & (alt_gps[start:] != 0.0)
+        gps = np.where(new_gps, alt_gps[start:], np.nan).tolist()
+
+        step = self._step
+        for i, dt_i, baro_i, gps_i, az_i in zip(range(start, n), dt.tolist(), alt_baro[start:].tolist(),
+                                                gps, az[start:].tolist()):
+            step(dt_i, baro_i, None if gps_i != gps_i else gps_i, az_i)
+            out[0, i] = self.h
+            out[1, i] = self.v
+            out[2, i] = self.p00
+            out[3, i] = self.p11
+        np.sqrt(np.maximum(out[2:], 0.0, out=out[2:]), out=out[2:])
+        self.last_t = float(clock[-1])
+        self.last_gps = float(alt_gps[-1])
+        return out[0], out[1], out[2], out[3]
+
+
+def reprocess(t, alt_baro, alt_gps=None, az=None, **params) -> tuple:
+    """
+    Reprocesamiento posterior al vuelo: corre un estimador nuevo sobre las
+    columnas completas del log y devuelve (altitud, velocidad, sigma_h, sigma_v).
+    'params' son los del constructor de AltitudeEstimator.
+    """
+    return AltitudeEstimator(**params).update_block(t, alt_baro, alt_gps, az)
+
+
+def _load_columns(path: str) -> dict:
+    """Columnas del log (.clog o .csv) que usa el estimador, como arreglos."""
+    names = ('Tiempo_Mision', 'Altitud_Barometro', 'Altitud_GPS', 'Acc_z')
+    if path.endswith('.clog'):
+        from core.columnar_log import ColumnarLogReader
+        reader = ColumnarLogReader(path)
+        return {name: np.asarray(reader.column(name), dtype=np.float64) for name in names}
+    columns = {name: [] for name in names}
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            try:
+                values = [float(row[name]) for name in names]
+            except (KeyError, TypeError, ValueError):
+                continue
+            for name, value in zip(names, values):
+                columns[name].append(value)
+    return {name: np.array(values, dtype=np.float64) for name, values in columns.items()}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Reprocesa la altitud y velocidad vertical de un log de vuelo")
+    parser.add_argument('log', help="log_vuelo_*.csv o log_vuelo_*.clog")
+    parser.add_argument('-o', '--output', help="CSV de salida (por omisión <log>.estimacion.csv)")
+    parser.add_argument('--sin-acelerometro', action='store_true', help="No usar Acc_z en la predicción")
+    parser.add_argument('--sigma-baro', type=float, default=1.5)
+    parser.add_argument('--sigma-gps', type=float, default=8.0)
+    parser.add_argument('--sigma-accel', type=float, default=None)
+    args = parser.parse_args(argv)
+
+    cols = _load_columns(args.log)
+    t = cols['Tiempo_Mision']
+    if not len(t):
+        print(f"{args.log}: sin paquetes válidos")
+        return 1
+    h, v, sigma_h, sigma_v = reprocess(
+        t, cols['Altitud_Barometro'], cols['Altitud_GPS'], cols['Acc_z'],
+        sigma_baro=args.sigma_baro, sigma_gps=args.sigma_gps, sigma_accel=args.sigma_accel,
+        use_accel=not args.sin_acelerometro,
+    )
+    output = args.output or args.log.rsplit('.', 1)[0] + '.estimacion.csv'
+    np.savetxt(
+        output, np.column_stack((t, h, v, sigma_h, sigma_v)), fmt='%.3f', delimiter=',',
+        header='Tiempo_Mision,Altitud_Filtrada,Velocidad_Z,Sigma_Altitud,Sigma_Velocidad_Z', comments='',
+    )
+    k = int(np.argmax(h))
+    print(f"{len(t)} paquetes -> {output} | apogeo {h[k]:.1f} m (±{sigma_h[k]:.1f}) en t={t[k]:.2f} s, "
+          f"velocidad máx. {np.max(v):.1f} m/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
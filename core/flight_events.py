@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# core/flight_events.py
+
+import math
+from typing import NamedTuple
+
+import numpy as np
+
+G = 9.80665
+
+# Fases del vuelo según la estación (independientes de Etapa_mision)
+EN_RAMPA = "EN RAMPA"
+PROPULSADO = "PROPULSADO"
+COSTEO = "COSTEO"
+DESCENSO = "DESCENSO"
+PARACAIDAS = "PARACAIDAS"
+ATERRIZADO = "ATERRIZADO"
+FASES = (EN_RAMPA, PROPULSADO, COSTEO, DESCENSO, PARACAIDAS, ATERRIZADO)
+
+# Eventos: (nombre, fase a la que lleva)
+DESPEGUE = "DESPEGUE"
+FIN_MOTOR = "FIN DE MOTOR"
+APOGEO = "APOGEO"
+DROGUE = "DROGUE"
+ATERRIZAJE = "ATERRIZAJE"
+_NEXT_PHASE = {DESPEGUE: PROPULSADO, FIN_MOTOR: COSTEO, APOGEO: DESCENSO,
+               DROGUE: PARACAIDAS, ATERRIZAJE: ATERRIZADO}
+
+
+class FlightEvent(NamedTuple):
+    """Evento detectado: tiempo de misión y altitud/velocidad en ese momento."""
+    name: str
+    t: float
+    alt: float
+    vel: float
+
+
+class ApogeePrediction(NamedTuple):
+    """Fase actual y apogeo previsto (tiempo restante en s, altitud en m)."""
+    phase: str
+    time_to_apogee: float
+    apogee_alt: float
+    max_alt: float
+
+
+class FlightEventDetector:
+    """
+    Detección de eventos del vuelo y predicción del apogeo a partir de la
+    altitud y velocidad filtradas (core.estimator).
+
+    Máquina de estados con costo constante por paquete:
+      EN RAMPA   -> DESPEGUE:   velocidad > 'liftoff_vel' y altitud sobre
+                                la rampa > 'liftoff_alt'.
+      PROPULSADO -> FIN MOTOR:  la velocidad cae 'burnout_drop' por debajo
+                                de su máximo (se reporta el instante del máximo).
+      COSTEO     -> APOGEO:     'apogee_samples' paquetes seguidos bajando
+                                o la altitud 'apogee_drop' m bajo su máximo.
+      DESCENSO   -> DROGUE:     bajando con aceleración mayor a -g/2 (ya no
+                                es caída libre) durante 'drogue_hold' s.
+      (DESCENSO o PARACAIDAS) -> ATERRIZAJE: |velocidad| < 'landing_vel'
+                                durante 'landing_hold' s.
+
+    La aceleración vertical es un promedio exponencial de dv/dt; en el
+    costeo da el coeficiente de arrastre efectivo k (a = -g - k v²) y con
+    él el apogeo en forma cerrada.
+    """
+
+    def __init__(self, liftoff_vel: float = 10.0, liftoff_alt: float = 10.0,
+                 burnout_drop: float = 3.0, apogee_samples: int = 3,
+                 apogee_drop: float = 5.0, drogue_hold: float = 1.0,
+                 drogue_min_speed: float = 5.0, landing_vel: float = 2.0,
+                 landing_hold: float = 3.0, accel_tau: float = 0.3, pad_tau: float = 10.0):
+        self.liftoff_vel = liftoff_vel
+        self.liftoff_alt = liftoff_alt
+        self.burnout_drop = burnout_drop
+        self.apogee_samples = apogee_samples
+        self.apogee_drop = apogee_drop
+        self.drogue_hold = drogue_hold
+        self.drogue_min_speed = drogue_min_speed
+        self.landing_vel = landing_vel
+        self.landing_hold = landing_hold
+        self.accel_tau = accel_tau
+        self.pad_tau = pad_tau
+        self.reset()
+
+    def reset(self):
+        self.phase = EN_RAMPA
+        self.events = []
+        self.pad_alt = None
+        self.last_t = self.last_v = None
+        self.accel = 0.0
+        self.alt = self.vel = 0.0
+        # Máximos del vuelo (valor, tiempo, altitud)
+        self.max_vel = (-math.inf, 0.0, 0.0)
+        self.max_alt = (-math.inf, 0.0)
+        self.descending = 0
+        # Inicio de las condiciones sostenidas (None = no se cumple)
+        self.drogue_since = None
+        self.landing_since = None
+
+    def _event(self, name: str, t: float, alt: float, vel: float) -> FlightEvent:
+        event = FlightEvent(name, t, alt, vel)
+        self.events.append(event)
+        self.phase = _NEXT_PHASE[name]
+        return event
+
+    @staticmethod
+    def _since(condition: bool, since, t: float):
+        """Nuevo inicio de una condición sostenida (None si no se cumple)."""
+        if not condition:
+            return None
+        return t if since is None else since
+
+    def update(self, t: float, alt: float, vel: float):
+        """Incorpora un paquete; devuelve el evento detectado o None."""
+        dt = 0.0 if self.last_t is None else t - self.last_t
+        if dt > 0:
+            alpha = min(dt / self.accel_tau, 1.0)
+            self.accel += alpha * ((vel - self.last_v) / dt - self.accel)
+        self.last_t, self.last_v = t, vel
+        self.alt, self.vel = alt, vel
+        if alt > self.max_alt[0]:
+            self.max_alt = (alt, t)
+
+        phase = self.phase
+        if phase == EN_RAMPA:
+            # La referencia de la rampa sigue la deriva lenta del barómetro
+            if self.pad_alt is None:
+                self.pad_alt = alt
+            else:
+                self.pad_alt += min(max(dt, 0.0) / self.pad_tau, 1.0) * (alt - self.pad_alt)
+            if vel > self.liftoff_vel and alt - self.pad_alt > self.liftoff_alt:
+                self.max_vel = (vel, t, alt)
+                self.max_alt = (alt, t)
+                return self._event(DESPEGUE, t, alt, vel)
+
+        elif phase == PROPULSADO:
+            if vel > self.max_vel[0]:
+                self.max_vel = (vel, t, alt)
+            elif vel < self.max_vel[0] - self.burnout_drop:
+                v_max, t_max, alt_max = self.max_vel
+                return self._event(FIN_MOTOR, t_max, alt_max, v_max)
+
+        elif phase == COSTEO:
+            self.descending = self.descending + 1 if vel < 0 else 0
+            if self.descending >= self.apogee_samples or alt < self.max_alt[0] - self.apogee_drop:
+                alt_max, t_max = self.max_alt
+                return self._event(APOGEO, t_max, alt_max, 0.0)
+
+        if phase in (DESCENSO, PARACAIDAS):
+            if phase == DESCENSO:
+                self.drogue_since = self._since(
+                    vel < -self.drogue_min_speed and self.accel > -0.5 * G, self.drogue_since, t
+                )
+                if self.drogue_since is not None and t - self.drogue_since >= self.drogue_hold:
+                    return self._event(DROGUE, self.drogue_since, alt, vel)
+            self.landing_since = self._since(abs(vel) < self.landing_vel, self.landing_since, t)
+            if self.landing_since is not None and t - self.landing_since >= self.landing_hold:
+                return self._event(ATERRIZAJE, self.landing_since, alt, vel)
+        return None
+
+    def update_block(self, t, alt, vel) -> list:
+        """update() para arreglos del mismo largo; devuelve la lista de eventos."""
+        events = []
+        update = self.update
+        for event in map(update, np.asarray(t, dtype=np.float64).tolist(),
+                         np.asarray(alt, dtype=np.float64).tolist(),
+                         np.asarray(vel, dtype=np.float64).tolist()):
+            if event is not None:
+                events.append(event)
+        return events
+
+    # --- Predicción del apogeo ---
+    def predict(self) -> ApogeePrediction:
+        """
+        Apogeo previsto desde el último paquete. Subiendo (v > 0) se usa
+        arrastre cuadrático con k medido en el costeo:
+            h_apogeo = h + ln(1 + k v²/g) / 2k
+            t_apogeo = atan(v √(k/g)) / √(g k)
+        (balístico si k ~ 0). Durante la propulsión es una cota inferior.
+        Ya pasado el apogeo se devuelve el máximo registrado.
+        """
+        alt_max = self.max_alt[0] if self.max_alt[0] > -math.inf else self.alt
+        if self.phase not in (PROPULSADO, COSTEO) or self.vel <= 0:
+            if self.phase in (EN_RAMPA, PROPULSADO, COSTEO):
+                return ApogeePrediction(self.phase, 0.0, self.alt, alt_max)
+            return ApogeePrediction(self.phase, 0.0, alt_max, alt_max)
+
+        v, h = self.vel, self.alt
+        k = 0.0
+        if self.phase == COSTEO and v > 5.0:
+            k = max((-self.accel - G) / (v * v), 0.0)
+        if k > 1e-9:
+            root = math.sqrt(k / G)
+            apogee = h + math.log1p(k * v * v / G) / (2.0 * k)
+            time_to = math.atan(v * root) / (G * root)
+        else:
+            apogee = h + v * v / (2.0 * G)
+            time_to = v / G
+        return ApogeePrediction(self.phase, time_to, apogee, max(alt_max, apogee))
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# core/flight_logger.py
+
+import abc
+import csv
+import io
+import os
+import queue
+import threading
+import time
+
+
+class AsyncFileWriter(abc.ABC):
+    """
+    Base de los escritores asíncronos del log de vuelo.
+
+    El hilo serial solo encola lotes; un hilo dedicado los escribe en
+    lotes más grandes. Así un disco o una SD lenta no detienen la recepción.
+    Si la cola se llena, los lotes se descartan (y se cuentan) en lugar de
+    bloquear. Las subclases implementan _write_batch().
+
+    Un lote que falla (disco, datos inválidos) se cuenta como descartado y
+    el hilo sigue con los siguientes; el último error queda en stats().
+    """
+
+    def __init__(self, filename: str, queue_size: int = 4096,
+                 batch_size: int = 512, flush_interval: float = 1.0,
+                 fsync_interval: float = 10.0):
+        self.filename = filename
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+
+        # Se abre aquí para que un error de archivo llegue a quien lo crea
+        self._file = open(filename, 'wb')
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(target=self._run, name=type(self).__name__, daemon=True)
+
+        # Estadísticas
+        self.rows_written = 0
+        self.bytes_written = 0
+        self.dropped_rows = 0
+        self.last_write_ms = 0.0
+        self.max_write_ms = 0.0
+        self._total_write_ms = 0.0
+        self._writes = 0
+        self.failed_batches = 0
+        self.error = None
+
+    def start(self):
+        self._thread.start()
+
+    def submit(self, items: list, rows: int) -> bool:
+        """Encola un lote. Devuelve False si se descartó."""
+        try:
+            self._queue.put_nowait(items)
+            return True
+        except queue.Full:
+            self.dropped_rows += rows
+            return False
+
+    def close(self, timeout: float = 5.0) -> bool:
+        """
+        Vacía la cola, sincroniza con el disco y cierra el archivo. Espera a
+        lo más 'timeout' segundos en total para que un disco colgado no
+        detenga la salida; si no alcanzó devuelve False y queda en stats().
+        """
+        if not self._thread.is_alive():
+            return True
+        deadline = time.monotonic() + timeout
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            self.error = f"Cola llena al cerrar: {self._queue.qsize()} lotes sin escribir tras {timeout:g} s"
+            return False
+        self._thread.join(max(deadline - time.monotonic(), 0.0))
+        if self._thread.is_alive():
+            self.error = f"El log no terminó de escribirse en {timeout:g} s"
+            return False
+        return True
+
+    def stats(self) -> dict:
+        return {
+            'queue_depth': self._queue.qsize(),
+            'rows_written': self.rows_written,
+            'bytes_written': self.bytes_written,
+            'dropped_rows': self.dropped_rows,
+            'last_write_ms': self.last_write_ms,
+            'max_write_ms': self.max_write_ms,
+            'avg_write_ms': self._total_write_ms / self._writes if self._writes else 0.0,
+            'failed_batches': self.failed_batches,
+            'error': self.error,
+        }
+
+    # --- Para las subclases (se ejecutan en el hilo escritor) ---
+    @abc.abstractmethod
+    def _write_batch(self, batch: list) -> tuple:
+        """Escribe un lote. Devuelve (renglones, bytes) escritos."""
+
+    def _batch_rows(self, batch: list) -> int:
+        """Renglones de un lote (para contar los descartados si falla)."""
+        return len(batch)
+
+    def _flush(self):
+        self._file.flush()
+
+    def _fsync(self):
+        os.fsync(self._file.fileno())
+
+    def _close(self):
+        self._file.close()
+
+    # --- Hilo escritor ---
+    def _run(self):
+        last_flush = last_fsync = time.monotonic()
+        running = True
+
+        while running:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                item = []
+
+            # Juntar lo que ya esté en la cola, hasta batch_size elementos
+            batch = []
+            while item is not None:
+                batch.extend(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if item is None:
+                running = False
+
+            if batch:
+                try:
+                    start = time.perf_counter()
+                    rows, size = self._write_batch(batch)
+                    elapsed = (time.perf_counter() - start) * 1000.0
+
+                    self.rows_written += rows
+                    self.bytes_written += size
+                    self.last_write_ms = elapsed
+                    self.max_write_ms = max(self.max_write_ms, elapsed)
+                    self._total_write_ms += elapsed
+                    self._writes += 1
+                except Exception as e:
+                    self._failed(e, self._batch_rows(batch))
+
+            now = time.monotonic()
+            try:
+                if not running or now - last_flush >= self.flush_interval:
+                    last_flush = now
+                    self._flush()
+                    if not running or now - last_fsync >= self.fsync_interval:
+                        last_fsync = now
+                        self._fsync()
+            except Exception as e:
+                self._failed(e, 0)
+
+        try:
+            self._close()
+        except Exception as e:
+            self._failed(e, 0)
+
+    def _failed(self, error: Exception, rows: int):
+        """Registra un fallo del hilo escritor sin detenerlo."""
+        self.failed_batches += 1
+        self.dropped_rows += rows
+        self.error = f"{type(error).__name__}: {error}"
+
+
+class FlightLogWriter(AsyncFileWriter):
+    """Log de vuelo CSV (log_vuelo_*.csv) escrito desde un hilo propio."""
+
+    def __init__(self, filename: str, header: list, **kwargs):
+        super().__init__(filename, **kwargs)
+        self._text = io.StringIO()
+        self._writer = csv.writer(self._text)
+        self.write_rows([header])
+        self.start()
+
+    def write_row(self, row) -> bool:
+        return self.write_rows([row])
+
+    def write_rows(self, rows) -> bool:
+        rows = list(rows)
+        return self.submit(rows, len(rows))
+
+    def _write_batch(self, batch: list) -> tuple:
+        try:
+            self._writer.writerows(batch)
+            data = self._text.getvalue().encode('utf-8')
+        finally:
+            # Un lote fallido no deja renglones a medias para el siguiente
+            self._text.seek(0)
+            self._text.truncate()
+        self._file.write(data)
+        return len(batch), len(data)
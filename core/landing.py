@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# core/landing.py
+
+import math
+import time
+from typing import NamedTuple
+
+import numpy as np
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+EARTH_RADIUS = 6371000.0
+# Factor de la elipse del 95 % (chi² con 2 grados de libertad)
+CHI2_95 = 5.991
+
+
+class LandingInput(NamedTuple):
+    """Estado al momento de pedir la predicción (inmutable, viaja al hilo del pool)."""
+    lat: float
+    lon: float
+    height: float          # Altura sobre la rampa (m)
+    sigma_height: float
+    descent_rate: float    # Positiva hacia abajo (m/s)
+    sigma_rate: float
+    wind: tuple            # (este, norte) m/s
+    wind_cov: tuple        # (var_e, cov_en, var_n)
+
+
+class LandingPrediction(NamedTuple):
+    """Zona de aterrizaje prevista: centro, elipse del 95 % y polígono para el mapa."""
+    lat: float
+    lon: float
+    semi_major: float      # m
+    semi_minor: float      # m
+    angle: float           # Grados del eje mayor respecto al este
+    time_to_landing: float
+    polygon: list          # [[lat, lon], ...]
+    samples: int
+    elapsed_ms: float
+
+
+class WindEstimator:
+    """
+    Deriva horizontal durante el descenso a partir de las fijas del GPS.
+
+    La velocidad entre fijas consecutivas (plano local este/norte) se
+    promedia con un filtro exponencial de constante 'tau'; su varianza
+    también, para la dispersión del viento. Costo constante por fija.
+    Solo acumula mientras 'descending' es verdadero: en el ascenso el
+    movimiento horizontal es del cohete, no del viento.
+    """
+
+    def __init__(self, tau: float = 10.0):
+        self.tau = tau
+        self.reset()
+
+    def reset(self):
+        self.last_fix = None  # (t, lat, lon)
+        self.samples = 0
+        self.mean_e = self.mean_n = 0.0
+        self.var_e = self.var_n = self.cov_en = 0.0
+
+    def add_fix(self, t: float, lat: float, lon: float, descending: bool) -> bool:
+        """Incorpora una fija; False si es la misma posición o no hay fija (0,0 o NaN)."""
+        if not (math.isfinite(lat) and math.isfinite(lon)) or (lat == 0.0 and lon == 0.0):
+            return False
+        last = self.last_fix
+        if last is not None and lat == last[1] and lon == last[2]:
+            return False
+        self.last_fix = (t, lat, lon)
+        if last is None or not descending:
+            self.samples = 0
+            return True
+        dt = t - last[0]
+        if dt <= 0:
+            return True
+        k = math.pi / 180.0 * EARTH_RADIUS
+        ve = (lon - last[2]) * k * math.cos(math.radians(lat)) / dt
+        vn = (lat - last[1]) * k / dt
+        if self.samples == 0:
+            self.mean_e, self.mean_n = ve, vn
+            self.var_e = self.var_n = self.cov_en = 0.0
+        else:
+            alpha = min(dt / self.tau, 1.0)
+            de, dn = ve - self.mean_e, vn - self.mean_n
+            self.mean_e += alpha * de
+            self.mean_n += alpha * dn
+            self.var_e = (1.0 - alpha) * (self.var_e + alpha * de * de)
+            self.var_n = (1.0 - alpha) * (self.var_n + alpha * dn * dn)
+            self.cov_en = (1.0 - alpha) * (self.cov_en + alpha * de * dn)
+        self.samples += 1
+        return True
+
+    def add_fixes(self, t, lat, lon, descending: bool):
+        """add_fix() para un bloque: solo se recorren los renglones con posición nueva."""
+        if not len(t):
+            return
+        prev = self.last_fix or (0.0, np.nan, np.nan)
+        valid = np.isfinite(lat) & np.isfinite(lon) & ((lat != 0.0) | (lon != 0.0))
+        moved = np.flatnonzero(valid & (
+            (lat != np.concatenate(([prev[1]], lat[:-1]))) | (lon != np.concatenate(([prev[2]], lon[:-1])))
+        ))
+        for t_i, lat_i, lon_i in zip(t[moved].tolist(), lat[moved].tolist(), lon[moved].tolist()):
+            self.add_fix(t_i, lat_i, lon_i, descending)
+
+
+def predict_landing(inp: LandingInput, samples: int = 4000, gust: float = 1.5,
+                    rate_rel_sigma: float = 0.15, seed=None) -> LandingPrediction:
+    """
+    Monte Carlo vectorizado del resto del descenso: cada muestra toma una
+    altura, una velocidad de descenso y un viento (media estimada + su
+    covarianza + ráfagas 'gust', que cubren el cambio del viento con la
+    altura) y deriva la posición actual durante el tiempo que le falta.
+    La velocidad de descenso lleva además un error relativo
+    'rate_rel_sigma' (cambios de paracaídas, densidad del aire).
+    """
+    start = time.perf_counter()
+    rng = np.random.default_rng(seed)
+    z = rng.standard_normal((4, samples))
+
+    height = np.maximum(inp.height + inp.sigma_height * z[0], 0.0)
+    sigma_rate = math.hypot(inp.sigma_rate, rate_rel_sigma * inp.descent_rate)
+    rate = np.maximum(inp.descent_rate + sigma_rate * z[1], 0.5)
+    fall_time = height / rate
+
+    # Viento correlacionado: Cholesky de la covarianza 2x2 (+ ráfagas)
+    var_e, cov_en, var_n = inp.wind_cov
+    var_e += gust * gust
+    var_n += gust * gust
+    l11 = math.sqrt(var_e)
+    l21 = cov_en / l11
+    l22 = math.sqrt(max(var_n - l21 * l21, 0.0))
+    east = (inp.wind[0] + l11 * z[2]) * fall_time
+    north = (inp.wind[1] + l21 * z[2] + l22 * z[3]) * fall_time
+
+    # Elipse del 95 % por la covarianza de las muestras
+    center_e, center_n = float(east.mean()), float(north.mean())
+    cov = np.cov(east, north)
+    eigvals, eigvecs = np.linalg.eigh(cov)
+    scale = np.sqrt(np.maximum(eigvals, 0.0) * CHI2_95)
+    angle = math.atan2(eigvecs[1, 1], eigvecs[0, 1])
+    theta = np.linspace(0.0, 2.0 * math.pi, 49)
+    ring = eigvecs @ (scale[:, None] * np.vstack((np.cos(theta), np.sin(theta))))
+
+    k = math.pi / 180.0 * EARTH_RADIUS
+    cos_lat = max(math.cos(math.radians(inp.lat)), 1e-6)
+    lat = inp.lat + (center_n + ring[1]) / k
+    lon = inp.lon + (center_e + ring[0]) / (k * cos_lat)
+    polygon = np.round(np.column_stack((lat, lon)), 7).tolist()
+
+    return LandingPrediction(
+        inp.lat + center_n / k, inp.lon + center_e / (k * cos_lat),
+        float(scale[1]), float(scale[0]), math.degrees(angle),
+        float(np.median(fall_time)), polygon, samples,
+        (time.perf_counter() - start) * 1000.0,
+    )
+
+
+class LandingSignals(QObject):
+    # (LandingPrediction, sesión del worker que la pidió)
+    finished = Signal(object, int)
+
+
+class LandingTask(QRunnable):
+    """predict_landing() en un hilo del QThreadPool; avisa con signals.finished."""
+
+    def __init__(self, inp: LandingInput, session: int, signals: LandingSignals, samples: int = 4000):
+        super().__init__()
+        self.inp = inp
+        self.session = session
+        self.signals = signals
+        self.samples = samples
+
+    def run(self):
+        try:
+            result = predict_landing(self.inp, self.samples)
+        except Exception:
+            result = None
+        self.signals.finished.emit(result, self.session)
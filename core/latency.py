@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# core/latency.py
+
+import math
+import threading
+import time
+
+# Nivel de frecuencia (throttling) de cada grupo de datos de la GUI
+TIER_GROUPS = {
+    '30hz': ('visor_3d',),
+    '20hz': ('cinematica', 'altimetro', 'paquetes', 'vuelo'),
+    '2hz': ('graficas', 'calidad_aire', 'gps'),
+    '0.2hz': ('baterias', 'estados'),
+}
+
+now_ns = time.monotonic_ns
+
+
+class LatencyHistogram:
+    """
+    Histograma logarítmico de latencias (ns): 16 bins por década entre
+    1 µs y 100 s. Registrar cuesta O(1) y la memoria es fija; los
+    percentiles se aproximan con el límite superior del bin (~15 %).
+    """
+
+    BINS_PER_DECADE = 16
+    MIN_NS = 1_000
+    DECADES = 8
+
+    def __init__(self):
+        self.counts = [0] * (self.BINS_PER_DECADE * self.DECADES + 1)
+        self.count = 0
+        self.max_ns = 0
+        self.total_ns = 0
+
+    def record(self, value_ns: int):
+        if value_ns < 0:
+            value_ns = 0
+        if value_ns <= self.MIN_NS:
+            i = 0
+        else:
+            i = min(len(self.counts) - 1,
+                    int(math.log10(value_ns / self.MIN_NS) * self.BINS_PER_DECADE) + 1)
+        self.counts[i] += 1
+        self.count += 1
+        self.total_ns += value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+
+    def percentile(self, p: float) -> int:
+        if not self.count:
+            return 0
+        target = math.ceil(self.count * p / 100.0)
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= target:
+                upper = int(self.MIN_NS * 10 ** (i / self.BINS_PER_DECADE))
+                return min(upper, self.max_ns)
+        return self.max_ns
+
+    def summary(self) -> dict:
+        return {
+            'count': self.count,
+            'p50_ms': self.percentile(50) / 1e6,
+            'p99_ms': self.percentile(99) / 1e6,
+            'max_ms': self.max_ns / 1e6,
+            'avg_ms': self.total_ns / self.count / 1e6 if self.count else 0.0,
+        }
+
+
+class LatencyTracker:
+    """
+    Mide qué tan viejos son los datos en pantalla, etapa por etapa.
+
+    Cada bloque recibido se marca con el reloj monotónico. El SerialWorker
+    registra recepción -> parseo y, por nivel de frecuencia, el retraso
+    del throttling y la emisión. La GUI marca cuándo recibe el aviso de
+    cada grupo, cuándo se aplica a su panel y cuándo se pinta la ventana.
+    Como el snapshot, cada grupo conserva solo su dato más reciente.
+
+    Etapas (llaves de summary()):
+        parse             recepción -> parseo
+        throttle/<nivel>  paquete más viejo retenido por el nivel -> emisión
+        emit/<nivel>      recepción -> emisión de la señal
+        store/<grupo>     emisión -> la GUI recibe el aviso del snapshot
+        apply/<grupo>     aviso -> panel (tick de la GUI)
+        paint/<grupo>     panel -> ventana pintada
+        total/<grupo>     recepción -> ventana pintada
+
+    Es seguro llamarlo desde el hilo serial y el hilo de la GUI.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._held = {}                                 # nivel -> recepción más vieja retenida
+        self._emitted = {}                              # grupo -> (recepción, emisión)
+        self._stored = {}                               # grupo -> (recepción, aviso)
+        self._applied = {}                              # grupo -> (recepción, panel)
+
+    def _record(self, key: str, value_ns: int):
+        hist = self._histograms.get(key)
+        if hist is None:
+            hist = self._histograms[key] = LatencyHistogram()
+        hist.record(value_ns)
+
+    def record(self, key: str, value_ns: int):
+        with self._lock:
+            self._record(key, value_ns)
+
+    # --- Hilo serial ---
+    def parsed(self, rx_ns: int):
+        self.record('parse', now_ns() - rx_ns)
+
+    def held(self, tier: str, rx_ns: int):
+        """Un paquete no se emitió porque a su nivel todavía no le toca."""
+        with self._lock:
+            self._held.setdefault(tier, rx_ns)
+
+    def emitted(self, tier: str, rx_ns: int):
+        """Llamar justo ANTES de publicar los grupos del nivel."""
+        t = now_ns()
+        with self._lock:
+            oldest = self._held.pop(tier, rx_ns)
+            self._record(f'throttle/{tier}', t - min(oldest, rx_ns))
+            self._record(f'emit/{tier}', t - rx_ns)
+            for group in TIER_GROUPS[tier]:
+                self._emitted[group] = (rx_ns, t)
+
+    # --- Hilo de la GUI ---
+    def stored(self, group: str):
+        t = now_ns()
+        with self._lock:
+            stamp = self._emitted.pop(group, None)
+            if stamp is None:
+                return
+            rx_ns, emit_ns = stamp
+            self._record(f'store/{group}', t - emit_ns)
+            self._stored[group] = (rx_ns, t)
+
+    def applied(self, group: str):
+        """El panel recibió el dato nuevo del grupo."""
+        t = now_ns()
+        with self._lock:
+            stamp = self._stored.pop(group, None)
+            if stamp is None:
+                return
+            rx_ns, store_ns = stamp
+            self._record(f'apply/{group}', t - store_ns)
+            self._applied[group] = (rx_ns, t)
+
+    def painted(self):
+        """La ventana terminó de pintarse: todo lo aplicado ya está en pantalla."""
+        if not self._applied:
+            return
+        t = now_ns()
+        with self._lock:
+            for group, (rx_ns, apply_ns) in self._applied.items():
+                self._record(f'paint/{group}', t - apply_ns)
+                self._record(f'total/{group}', t - rx_ns)
+            self._applied.clear()
+
+    # --- API ---
+    def summary(self) -> dict:
+        """{etapa: {'count', 'p50_ms', 'p99_ms', 'max_ms', 'avg_ms'}}"""
+        with self._lock:
+            return {key: hist.summary() for key, hist in sorted(self._histograms.items())}
+
+    def clear_pending(self):
+        """Olvida los datos en tránsito (nueva sesión); conserva los histogramas."""
+        with self._lock:
+            self._held.clear()
+            self._emitted.clear()
+            self._stored.clear()
+            self._applied.clear()
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._held.clear()
+            self._emitted.clear()
+            self._stored.clear()
+            self._applied.clear()
+
+    def format_report(self) -> str:
+        lines = [f"{'etapa':<22}{'n':>8}{'p50':>10}{'p99':>10}{'max':>10}  (ms)"]
+        for key, s in self.summary().items():
+            lines.append(f"{key:<22}{s['count']:>8}{s['p50_ms']:>10.2f}{s['p99_ms']:>10.2f}{s['max_ms']:>10.2f}")
+        return '\n'.join(lines)
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# core/mission_history.py
+
+import threading
+
+import numpy as np
+
+
+def _ensure_capacity(arr: np.ndarray, size: int, used: int) -> np.ndarray:
+    """Devuelve arr o una copia más grande (capacidad doble) si no cabe 'size'."""
+    if len(arr) >= size:
+        return arr
+    bigger = np.empty(max(size, 2 * len(arr), 1024), dtype=arr.dtype)
+    bigger[:used] = arr[:used]
+    return bigger
+
+
+class MinMaxPyramid:
+    """
+    Niveles de detalle de una columna: el nivel k guarda el mínimo y el
+    máximo de cada grupo de factor**k muestras crudas.
+
+    Se actualiza de forma incremental: solo se recalculan los grupos que
+    cambiaron desde la última vez (el último grupo incompleto y los nuevos),
+    así el costo es proporcional a los datos nuevos y no a toda la misión.
+    """
+
+    def __init__(self, factor: int = 4, min_bins: int = 64):
+        if factor < 2:
+            raise ValueError("El factor debe ser al menos 2")
+        self.factor = factor
+        self.min_bins = min_bins
+        self.clear()
+
+    def clear(self):
+        self._mins = []
+        self._maxs = []
+        self._sizes = []
+        self._built = 0  # Muestras crudas ya incorporadas
+
+    @property
+    def levels(self) -> int:
+        return len(self._sizes)
+
+    def update(self, values: np.ndarray, n: int):
+        """Incorpora values[:n] (las muestras previas no cambian)."""
+        if n <= self._built:
+            return
+        f = self.factor
+        src_min = src_max = values
+        src_n = n
+        start = self._built
+        k = 0
+        # Solo se crea un nivel más grueso si el de abajo todavía es grande
+        while src_n > self.min_bins:
+            size = -(-src_n // f)
+            if k == len(self._sizes):
+                self._mins.append(np.empty(0, dtype=values.dtype))
+                self._maxs.append(np.empty(0, dtype=values.dtype))
+                self._sizes.append(0)
+                start = 0
+            first = start // f
+            used = self._sizes[k]
+            mins = self._mins[k] = _ensure_capacity(self._mins[k], size, used)
+            maxs = self._maxs[k] = _ensure_capacity(self._maxs[k], size, used)
+            offsets = np.arange(0, src_n - first * f, f)
+            # fmin/fmax ignoran NaN (campos inválidos) mientras haya otro valor
+            mins[first:size] = np.fmin.reduceat(src_min[first * f:src_n], offsets)
+            maxs[first:size] = np.fmax.reduceat(src_max[first * f:src_n], offsets)
+            self._sizes[k] = size
+            src_min, src_max, src_n, start = mins, maxs, size, first
+            k += 1
+        self._built = n
+
+    def level(self, k: int):
+        """(mínimos, máximos, muestras por grupo) del nivel k >= 1."""
+        size = self._sizes[k - 1]
+        return self._mins[k - 1][:size], self._maxs[k - 1][:size], self.factor ** k
+
+
+class MissionHistory:
+    """
+    Historial completo de la misión por columnas (tiempo + variables) para
+    las gráficas, con consultas de nivel de detalle.
+
+    El hilo serial agrega muestras con append()/extend(); la GUI pide con
+    query() solo el rango visible con a lo más ~max_points vértices. Si el
+    rango tiene más muestras que eso, se dibuja un par mínimo/máximo por
+    grupo usando la pirámide, así los picos no se pierden y el costo de
+    dibujar no crece con la duración del vuelo.
+
+    query() busca por tiempo con searchsorted, así que solo se guarda una
+    racha en la que el tiempo no baja. Un salto atrás de más de restart_gap
+    segundos (la computadora de vuelo se reinició y t_mision volvió a
+    empezar) descarta la racha anterior y empieza otra; uno menor es un
+    paquete tardío (diversidad, reenvío) y esa muestra no se guarda. Las
+    pirámides se construyen de forma perezosa en el hilo que consulta.
+
+    Reemplaza al buffer circular de MAX_GRAPH_POINTS puntos: lo acotado ya
+    no es la memoria sino lo que se dibuja (max_points por consulta). La
+    memoria crece con el vuelo, ~75 bytes por muestra con las 6 columnas y
+    sus pirámides: una hora a 100 Hz son ~27 MB (hasta el doble justo
+    después de crecer). Los receptores de diversidad y el modo sin
+    interfaz no guardan historial (keep_history=False).
+    """
+
+    def __init__(self, columns, time_column: str = 'time', factor: int = 4,
+                 capacity: int = 4096, restart_gap: float = 2.0):
+        self.columns = list(columns)
+        self._index = {name: i for i, name in enumerate(self.columns)}
+        self.time_column = time_column
+        self._time = self._index[time_column]
+        self.restart_gap = restart_gap
+        self.restarts = 0  # Saltos atrás que reiniciaron el historial
+        self.dropped = 0   # Muestras tardías descartadas
+        self._lock = threading.Lock()
+        self._data = np.empty((len(self.columns), capacity), dtype=np.float64)
+        self._size = 0
+        self._pyramids = {
+            name: MinMaxPyramid(factor) for name in self.columns if name != time_column
+        }
+
+    def __len__(self):
+        return self._size
+
+    def clear(self):
+        with self._lock:
+            self._reset()
+            self.restarts = 0
+            self.dropped = 0
+
+    def _reset(self):
+        self._size = 0
+        for pyramid in self._pyramids.values():
+            pyramid.clear()
+
+    def _last_time(self) -> float:
+        return self._data[self._time, self._size - 1] if self._size else -np.inf
+
+    def _reserve(self, n: int):
+        need = self._size + n
+        if need > self._data.shape[1]:
+            bigger = np.empty((len(self.columns), max(need, 2 * self._data.shape[1])), dtype=np.float64)
+            bigger[:, :self._size] = self._data[:, :self._size]
+            self._data = bigger
+
+    # --- Hilo serial ---
+    def append(self, *values):
+        """Agrega una muestra (un valor por columna, en el orden de 'columns')."""
+        t = values[self._time]
+        with self._lock:
+            last = self._last_time()
+            if not t >= last:  # También descarta t NaN
+                if last - t > self.restart_gap:
+                    self._reset()
+                    self.restarts += 1
+                else:
+                    self.dropped += 1
+                    return
+            self._reserve(1)
+            self._data[:, self._size] = values
+            self._size += 1
+
+    def extend(self, columns: dict):
+        """Agrega un bloque de muestras: {columna: arreglo}, todas del mismo largo."""
+        t = np.asarray(columns[self.time_column], dtype=np.float64)
+        if len(t) == 0:
+            return
+        with self._lock:
+            # Reloj = máximo tiempo visto antes de cada muestra (fmax ignora NaN)
+            start = 0
+            while True:
+                clock = np.fmax.accumulate(np.concatenate(([self._last_time()], t[start:])))[:-1]
+                jumps = np.flatnonzero(clock - t[start:] > self.restart_gap)
+                if not len(jumps):
+                    break
+                start += int(jumps[0])
+                self._reset()
+                self.restarts += 1
+            keep = np.flatnonzero(t[start:] >= clock) + start
+            n = len(keep)
+            self.dropped += len(t) - start - n
+            if n == 0:
+                return
+            if n == len(t):
+                keep = slice(None)
+            self._reserve(n)
+            for name, i in self._index.items():
+                self._data[i, self._size:self._size + n] = np.asarray(columns[name])[keep]
+            self._size += n
+
+    # --- GUI ---
+    def time_range(self):
+        """(primer, último) tiempo registrado, o None si está vacío."""
+        with self._lock:
+            if not self._size:
+                return None
+            t = self._data[self._index[self.time_column]]
+            return float(t[0]), float(t[self._size - 1])
+
+    def query(self, name: str, t0: float, t1: float, max_points: int):
+        """
+        Copia (x, y) de la columna 'name' entre t0 y t1 con a lo más
+        ~max_points vértices. Incluye una muestra a cada lado del rango
+        para que la línea llegue a los bordes de la gráfica.
+        """
+        with self._lock:
+            n = self._size
+            if not n:
+                return np.empty(0), np.empty(0)
+            t = self._data[self._index[self.time_column], :n]
+            values = self._data[self._index[name]]
+            i0 = max(int(np.searchsorted(t, t0, 'left')) - 1, 0)
+            i1 = min(int(np.searchsorted(t, t1, 'right')) + 1, n)
+            count = i1 - i0
+            max_points = max(int(max_points), 2)
+            if count <= max_points:
+                return t[i0:i1].copy(), values[i0:i1].copy()
+
+            # Nivel más fino cuyo número de grupos (2 vértices c/u) quepa
+            pyramid = self._pyramids[name]
+            pyramid.update(values, n)
+            if not pyramid.levels:
+                return t[i0:i1].copy(), values[i0:i1].copy()
+            k = 1
+            while k < pyramid.levels and 2 * -(-count // pyramid.factor ** k) > max_points:
+                k += 1
+            mins, maxs, width = pyramid.level(k)
+            b0 = i0 // width
+            b1 = min(-(-i1 // width), len(mins))
+            starts = np.arange(b0, b1) * width
+            middles = np.minimum(starts + width // 2, n - 1)
+            x = np.empty(2 * (b1 - b0))
+            y = np.empty(2 * (b1 - b0))
+            x[0::2] = t[starts]
+            x[1::2] = t[middles]
+            y[0::2] = mins[b0:b1]
+            y[1::2] = maxs[b0:b1]
+            return x, y
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# core/packet_schema.py
+
+from typing import NamedTuple
+
+import numpy as np
+
+# Campos del paquete de telemetría, en el orden en que llegan por el enlace.
+# (Nombre en el CSV, llave interna, tipo)
+#   'f' -> float, 'i' -> int(round(float(x))), 'b' -> bool(int(round(float(x)))),
+#   's' -> texto sin convertir
+PACKET_FIELDS = [
+    ('Acc_x', 'ax', 'f'), ('Acc_y', 'ay', 'f'), ('Acc_z', 'az', 'f'),
+    ('Pitch', 'pitch', 'f'), ('Roll', 'roll', 'f'), ('Yaw', 'yaw', 'f'),
+    ('Compass', 'compass', 'f'),
+    ('Latitud', 'lat', 'f'), ('Longitud', 'lon', 'f'), ('Altitud_GPS', 'alt_gps', 'f'),
+    ('Hora_GPS', 'hora_gps', 's'),
+    ('Bateria_Control', 'bat_control', 'i'), ('Bateria_Camara', 'bat_camara', 'i'),
+    ('Tiempo_encendido', 't_encendido', 'f'), ('Tiempo_Mision', 't_mision', 'f'),
+    ('No_Paquete_Enviado', 'no_paquete_enviado', 'i'),
+    ('Temperatura', 'temp', 'f'), ('Presion', 'pres', 'f'), ('Altitud_Barometro', 'alt_baro', 'f'),
+    ('TVOC', 'tvoc', 'f'), ('CO2', 'co2', 'f'), ('Humedad', 'hum', 'f'),
+    ('Estado_Launc', 'led_lanz', 'b'), ('Estado_Payload_1', 'led_p1', 'b'),
+    ('Estado_Payload_2', 'led_p2', 'b'), ('Estado_Payload_3', 'led_p3', 'b'),
+    ('Estado_Camara', 'led_cam', 'b'), ('Estado_SD', 'led_sd', 'b'),
+    ('Etapa_mision', 'etapa_id', 'i'),
+    ('Codigo_Error', 'error', 'i'),
+    ('Ultimo_comando', 'comando', 'i'),
+]
+
+PACKET_FIELD_COUNT = len(PACKET_FIELDS)
+PACKET_CSV_NAMES = [name for name, _, _ in PACKET_FIELDS]
+PACKET_KEYS = [key for _, key, _ in PACKET_FIELDS]
+
+# Ancho máximo (bytes) de un campo en el texto del enlace. Un token más
+# largo se rechaza: nunca se recorta a algo que parezca un valor válido.
+TEXT_WIDTH = 16     # Hora_GPS (PACKET_DTYPE la guarda como S16)
+NUMBER_WIDTH = 32
+PACKET_TOKEN_WIDTHS = [TEXT_WIDTH if kind == 's' else NUMBER_WIDTH for _, _, kind in PACKET_FIELDS]
+
+_NUMPY_TYPES = {'f': 'f8', 'i': 'i8', 'b': '?', 's': f'S{TEXT_WIDTH}'}
+
+# Un registro por paquete, una columna por campo del CSV
+PACKET_DTYPE = np.dtype([(key, _NUMPY_TYPES[kind]) for _, key, kind in PACKET_FIELDS])
+
+# Nombre de cada etapa de la misión (Etapa_mision)
+ETAPAS = {0: "NO INICIADA", 1: "IGNICION", 2: "APOGEO", 3: "CAIDA LIBRE", 4: "ATERRIZAJE"}
+
+
+class TelemetryRecord(NamedTuple):
+    """
+    Registro inmutable de un paquete, tal como viaja en las señales hacia la GUI.
+
+    Es una tupla (sin __dict__ por instancia): los 31 campos del enlace en
+    el orden de PACKET_FIELDS, seguidos de los valores que calcula la
+    estación. Cambiar los campos implica subir SCHEMA_VERSION.
+    """
+    SCHEMA_VERSION = 2
+
+    ax: float
+    ay: float
+    az: float
+    pitch: float
+    roll: float
+    yaw: float
+    compass: float
+    lat: float
+    lon: float
+    alt_gps: float
+    hora_gps: str
+    bat_control: int
+    bat_camara: int
+    t_encendido: float
+    t_mision: float
+    no_paquete_enviado: int
+    temp: float
+    pres: float
+    alt_baro: float
+    tvoc: float
+    co2: float
+    hum: float
+    led_lanz: bool
+    led_p1: bool
+    led_p2: bool
+    led_p3: bool
+    led_cam: bool
+    led_sd: bool
+    etapa_id: int
+    error: int
+    comando: int
+    # --- Calculados en la estación ---
+    velocidad_z: float = 0.0
+    lost_packets: int = 0
+    gs_packet_count: int = 0
+    alt_filtrada: float = 0.0   # Altitud estimada (core.estimator)
+    sigma_alt: float = 0.0      # Incertidumbre (1 sigma) de la altitud
+    sigma_vz: float = 0.0       # Incertidumbre (1 sigma) de velocidad_z
+
+    def packet_values(self) -> tuple:
+        """Solo los 31 campos del enlace (para PACKET_DTYPE)."""
+        return self[:PACKET_FIELD_COUNT]
+
+
+assert list(TelemetryRecord._fields[:PACKET_FIELD_COUNT]) == PACKET_KEYS, \
+    "TelemetryRecord no coincide con PACKET_FIELDS"
+
+_HORA_INDEX = PACKET_KEYS.index('hora_gps')
+
+
+def row_to_dict(row) -> dict:
+    """Convierte un renglón del arreglo estructurado al dict por paquete."""
+    data = {}
+    for _, key, kind in PACKET_FIELDS:
+        value = row[key]
+        if kind == 'f':
+            data[key] = float(value)
+        elif kind == 'i':
+            data[key] = int(value)
+        elif kind == 'b':
+            data[key] = bool(value)
+        else:
+            data[key] = value.decode('utf-8', 'replace')
+    return data
+
+
+def row_to_record(row, velocidad_z: float = 0.0, lost_packets: int = 0,
+                  gs_packet_count: int = 0, alt_filtrada: float = 0.0,
+                  sigma_alt: float = 0.0, sigma_vz: float = 0.0) -> TelemetryRecord:
+    """Convierte un renglón del arreglo estructurado a TelemetryRecord."""
+    values = list(row.tolist())
+    values[_HORA_INDEX] = values[_HORA_INDEX].decode('utf-8', 'replace')
+    return TelemetryRecord(*values, velocidad_z, lost_packets, gs_packet_count,
+                           alt_filtrada, sigma_alt, sigma_vz)
+
+
+def format_block(block) -> list:
+    """
+    Genera el texto CSV (bytes, 31 campos) de cada renglón de un bloque.
+    Se usa para registrar paquetes que no llegaron como texto (tramas binarias).
+    Los flotantes se escriben con repr(): el texto más corto que vuelve a
+    dar exactamente el mismo valor (el log de vuelo no pierde dígitos).
+    """
+    kinds = [kind for _, _, kind in PACKET_FIELDS]
+    lines = []
+    for row in block.tolist():
+        fields = []
+        for kind, value in zip(kinds, row):
+            if kind == 'f':
+                fields.append(repr(value))
+            elif kind == 's':
+                fields.append(value.decode('utf-8', 'replace'))
+            else:
+                fields.append(str(int(value)))
+        lines.append(','.join(fields).encode())
+    return lines
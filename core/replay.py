@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# core/replay.py
+
+import csv
+import time
+
+from PySide6.QtCore import QObject, QTimer, Signal, Slot
+
+from core.packet_schema import PACKET_FIELD_COUNT
+
+
+class ReplaySource(QObject):
+    """
+    Fuente de reproducción: lee un log_vuelo_*.csv y entrega sus paquetes
+    al SerialWorker por el mismo camino que los datos del puerto serial
+    (process_chunk / process_packet), así la GUI recibe las mismas señales.
+
+    speed = 1.0 -> tiempo real según Tiempo_Mision
+    speed = N   -> N veces más rápido
+    speed = 0   -> tan rápido como sea posible
+    """
+
+    finished = Signal()
+    progress = Signal(int, int)  # enviados, total
+
+    TICK_MS = 10
+    MAX_BATCH = 2000  # Paquetes por tick en modo "máxima velocidad"
+
+    def __init__(self, worker, path: str, speed: float = 1.0, parent=None):
+        super().__init__(parent)
+        self.worker = worker
+        self.speed = speed
+        self.lines, self.times = self.load_csv(path, worker.CSV_HEADER)
+        self.position = 0
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.on_tick)
+        self._t0_wall = 0.0
+        self._t0_log = 0.0
+
+    @staticmethod
+    def load_csv(path: str, header: list) -> tuple:
+        """Devuelve (líneas de 31 campos en bytes, Tiempo_Mision de cada una)."""
+        t_col = header.index('Tiempo_Mision')
+        lines = []
+        times = []
+        with open(path, newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            for row in reader:
+                if len(row) != len(header) or row[0] == header[0]:
+                    continue
+                try:
+                    t = float(row[t_col])
+                except ValueError:
+                    continue
+                lines.append(','.join(row[1:1 + PACKET_FIELD_COUNT]).encode('utf-8'))
+                times.append(t)
+        return lines, times
+
+    @Slot()
+    def start(self):
+        if not self.lines:
+            self.finished.emit()
+            return
+        self.position = 0
+        self._t0_wall = time.monotonic()
+        self._t0_log = self.times[0]
+        self.timer.start(0 if self.speed <= 0 else self.TICK_MS)
+
+    @Slot()
+    def stop(self):
+        self.timer.stop()
+
+    @Slot()
+    def on_tick(self):
+        total = len(self.lines)
+        start = self.position
+        if self.speed <= 0:
+            end = min(total, start + self.MAX_BATCH)
+        else:
+            # Todo lo que ya "ocurrió" según el reloj de la reproducción
+            t_now = self._t0_log + (time.monotonic() - self._t0_wall) * self.speed
+            end = start
+            while end < total:
+                if end and self.times[end] < self.times[end - 1]:
+                    # El tiempo retrocede (reinicio de la misión): se reajusta el reloj
+                    self._t0_log = t_now = self.times[end]
+                    self._t0_wall = time.monotonic()
+                if self.times[end] > t_now:
+                    break
+                end += 1
+
+        if end > start:
+            self.worker.mark_received()
+            self.worker.feed_lines(self.lines[start:end])
+            self.position = end
+            self.progress.emit(end, total)
+
+        if self.position >= total:
+            self.timer.stop()
+            self.finished.emit()
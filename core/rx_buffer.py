@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# core/rx_buffer.py
+
+
+class RxBuffer:
+    """
+    Buffer circular de recepción basado en bytearray/memoryview.
+    Busca delimitadores una sola vez por bloque recibido y entrega
+    cada línea como una vista (sin copiar) sobre el buffer interno.
+
+    Las vistas entregadas por feed() solo son válidas hasta la
+    siguiente llamada a feed() o clear().
+    """
+
+    def __init__(self, capacity: int = 65536, delimiter: bytes = b'\n',
+                 max_line: int = 4096):
+        self._buf = bytearray(capacity)
+        self._view = memoryview(self._buf)
+        self._start = 0     # Inicio de los datos pendientes
+        self._end = 0       # Fin de los datos escritos
+        self._scan = 0      # Hasta dónde ya se buscó el delimitador
+        self.delimiter = delimiter
+        self.max_line = max_line
+
+        # Estadísticas
+        self.high_water = 0
+        self.overflows = 0
+
+    @property
+    def buffered(self) -> int:
+        """Bytes pendientes (línea incompleta) dentro del buffer."""
+        return self._end - self._start
+
+    @property
+    def capacity(self) -> int:
+        return len(self._buf)
+
+    def clear(self):
+        self._start = self._end = self._scan = 0
+
+    def set_delimiter(self, delimiter: bytes):
+        """Cambia el delimitador y vuelve a buscar en los datos pendientes."""
+        self.delimiter = delimiter
+        self._scan = self._start
+
+    def _reserve(self, size: int):
+        """Garantiza espacio al final del buffer para 'size' bytes."""
+        pending = self._end - self._start
+        if self._end + size <= len(self._buf):
+            return
+        if pending + size <= len(self._buf):
+            # Compactar: mover lo pendiente al inicio (mismo tamaño, sin realocar).
+            # Lo pendiente es a lo más una línea incompleta, la copia es pequeña.
+            self._buf[0:pending] = bytes(self._view[self._start:self._end])
+        else:
+            # Crecer: nuevo bytearray (no se redimensiona el exportado)
+            new_cap = len(self._buf)
+            while new_cap < pending + size:
+                new_cap *= 2
+            new_buf = bytearray(new_cap)
+            new_buf[0:pending] = self._view[self._start:self._end]
+            self._buf = new_buf
+            self._view = memoryview(new_buf)
+        self._scan -= self._start
+        self._start = 0
+        self._end = pending
+
+    def feed(self, data) -> list:
+        """
+        Agrega un bloque recibido y devuelve la lista de líneas completas
+        (memoryview, sin el delimitador).
+        """
+        size = len(data)
+        if size:
+            self._reserve(size)
+            self._buf[self._end:self._end + size] = data
+            self._end += size
+            if self._end - self._start > self.high_water:
+                self.high_water = self._end - self._start
+
+        lines = []
+        buf = self._buf
+        view = self._view
+        delim = self.delimiter
+        dlen = len(delim)
+        start = self._start
+        end = self._end
+        pos = buf.find(delim, self._scan, end)
+        while pos != -1:
+            lines.append(view[start:pos])
+            start = pos + dlen
+            pos = buf.find(delim, start, end)
+
+        # Basura sin delimitador: se descarta para no crecer sin límite
+        if end - start > self.max_line:
+            self.overflows += 1
+            start = end
+
+        self._start = start
+        # Se retrocede len(delim)-1 por si el delimitador quedó partido
+        self._scan = max(start, end - dlen + 1)
+        return lines
+
+    def stats(self) -> dict:
+        return {
+            'buffered': self.buffered,
+            'high_water': self.high_water,
+            'capacity': self.capacity,
+            'overflows': self.overflows,
+        }
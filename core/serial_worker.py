@@ -7,15 +7,35 @@
 
 # core/serial_worker.py
 
-import csv
+import os
 import sys
 import time
 from datetime import datetime
 from PySide6.QtCore import (
-    QObject, Signal, Slot, QIODevice, QFileSystemWatcher, QThread
+    QObject, Signal, Slot, QIODevice, QFileSystemWatcher, QThread, QThreadPool
 )
 from PySide6.QtSerialPort import QSerialPort, QSerialPortInfo
 
+import numpy as np
+
+from core.batch_parser import parse_block
+from core.binary_protocol import FRAME_DELIMITER, decode_frames
+from core.columnar_log import ColumnarLogWriter
+from core.diversity import DiversityMerger
+from core.estimator import AltitudeEstimator
+from core.flight_events import DESCENSO, PARACAIDAS, FlightEventDetector
+from core.flight_logger import FlightLogWriter
+from core.landing import LandingInput, LandingSignals, LandingTask, WindEstimator
+from core.latency import now_ns
+from core.mission_history import MissionHistory
+from core.packet_schema import (
+    PACKET_CSV_NAMES, PACKET_DTYPE, TelemetryRecord, format_block, row_to_record
+)
+from core.replay import ReplaySource
+from core.rx_buffer import RxBuffer
+from core.snapshot import TelemetrySnapshot
+from core.validation import OK, TRAMA, PacketValidator
+
 class SerialWorker(QObject):
     """
     Módulo de lógica que maneja la conexión serial, monitoreo y parseo.
@@ -25,54 +45,93 @@ class SerialWorker(QObject):
     # --- Señales ---
     port_list_updated = Signal(list)
     status_update = Signal(str, str)
-    
-    cinematica_updated = Signal(dict)
-    visor_3d_updated = Signal(float, float, float)
-    gps_data_updated = Signal(dict)
-    altimetro_data_updated = Signal(int)
-    graficas_data_updated = Signal(dict)
-    calidad_aire_updated = Signal(dict)
-    baterias_data_updated = Signal(int, int)
-    paquetes_data_updated = Signal(int, int)
-    estados_data_updated = Signal(dict)
-
-    CSV_HEADER = [
-        'Contador_Paquetes_GS', 
-        'Acc_x', 'Acc_y', 'Acc_z', 'Pitch', 'Roll', 'Yaw', 'Compass', 
-        'Latitud', 'Longitud', 'Altitud_GPS', 'Hora_GPS', 
-        'Bateria_Control', 'Bateria_Camara', 'Tiempo_encendido', 'Tiempo_Mision', 
-        'No_Paquete_Enviado', 'Temperatura', 'Presion', 'Altitud_Barometro', 
-        'TVOC', 'CO2', 'Humedad', 
-        'Estado_Launc', 'Estado_Payload_1', 'Estado_Payload_2', 'Estado_Payload_3', 
-        'Estado_Camara', 'Estado_SD', 'Etapa_mision', 'Codigo_Error', 
-        'Ultimo_comando', 
-        'Velocidad_Calculada_Z'
-    ]
-
-    def __init__(self):
+
+    # Hay datos nuevos en self.snapshot (a lo más un aviso pendiente a la vez)
+    snapshot_updated = Signal()
+    # Evento de vuelo detectado por la estación (FlightEvent), sin esperar a los niveles
+    flight_event = Signal(object)
+    # Receptor de diversidad: bloque ya validado para el worker principal
+    # (nombre del receptor, arreglo PACKET_DTYPE, líneas crudas o None)
+    block_received = Signal(str, object, object)
+
+    CSV_HEADER = ['Contador_Paquetes_GS'] + PACKET_CSV_NAMES + ['Velocidad_Calculada_Z']
+
+    # Líneas mínimas en un readyRead para usar el camino por lotes. Medido con
+    # benchmarks/bench_ingest.py (20000 paquetes de ~150 bytes), µs por paquete
+    # por paquete / por lotes: 256 B 59/233, 753 B 47/72, 2 KB 52/35,
+    # 4 KB 44/21, 16 KB 44/17. Con pocas líneas el costo fijo del bloque
+    # (numpy, señales) pesa más que el ahorro; el cruce está en ~2 KB.
+    BATCH_MIN_LINES = 16
+
+    def __init__(self, batch_mode: bool = True, protocol: str = "auto",
+                 keep_history: bool = True, latency=None, snapshot=None,
+                 forward_only: bool = False):
         super().__init__()
+        # Receptor de diversidad: solo lee y valida; los bloques van al worker
+        # principal por block_received (sin CSV, historial ni cálculos propios)
+        self.forward_only = forward_only
+        self.receiver_name = ""
+        # Combinación de receptores redundantes (None = un solo receptor)
+        self.merger = None
+        # Modo por lotes: todas las líneas de un readyRead se decodifican juntas
+        # cuando son al menos BATCH_MIN_LINES; si no, se procesan una por una
+        self.batch_mode = batch_mode
+        # Protocolo del enlace: "auto", "texto" (CSV) o "binario" (COBS + CRC)
+        self.protocol_mode = protocol
+        self.protocol = None if protocol == "auto" else protocol
         self.serial_port = None
         self.known_port_list = []
         self.port_monitor = None
-        self.serial_buffer = b"" 
+        self.rx_buffer = RxBuffer()
+        self.replay = None
+        self._detect_buffer = bytearray()
+        self.discarded_frames = 0
+        # Validación sin excepciones; los errores se reportan cada 5 s
+        self.validator = PacketValidator(interval=5.0)
+        if self.protocol:
+            self.set_protocol(self.protocol)
         
         # Datos internos
         self.gs_packet_count = 0
         self.last_packet_id = 0
         self.lost_packets = 0
-        self.vel_window = []
+        # Altitud y velocidad vertical filtradas (barómetro + GPS + Acc_z)
+        self.estimator = AltitudeEstimator()
         self.velocidad_z = 0.0
+        # Despegue, fin de motor, apogeo, drogue y aterrizaje + apogeo previsto
+        self.flight_events = FlightEventDetector()
+        # Zona de aterrizaje: viento por GPS en el descenso + Monte Carlo en un
+        # QThreadPool propio. El pool se crea antes que landing_signals: al
+        # destruir el worker se destruye primero y espera a la tarea en curso,
+        # así ninguna emite sobre un LandingSignals ya borrado
+        self.wind = WindEstimator()
+        self.landing_pool = QThreadPool(self)
+        self.landing_pool.setMaxThreadCount(1)
+        self.landing_signals = LandingSignals(self)
+        self.landing_signals.finished.connect(self.on_landing_prediction)
+        self.LANDING_INTERVAL = 1.0  # s entre predicciones
+        self.LANDING_SAMPLES = 4000
+        self.landing_session = 0
+        self._landing_busy = False
+        self._landing_last = 0.0
+        # Último código de error / comando reportado (se avisa solo al cambiar)
+        self.last_error_code = 0
+        self.last_command = 0
         
-        self.MAX_GRAPH_POINTS = 100
-        self.graph_time = []
-        self.graph_pressure = []
-        self.graph_temp = []
-        self.graph_co2 = []
-        self.graph_tvoc = []
-        self.graph_humidity = []
+        # Historial completo de la misión para las gráficas (None sin GUI)
+        self.history = MissionHistory(
+            ['time', 'pres', 'temp', 'co2', 'tvoc', 'hum']
+        ) if keep_history and not forward_only else None
         
-        self.csv_file = None
+        # Escritor asíncrono del CSV (hilo propio)
         self.csv_writer = None
+        # Log binario por columnas (log_vuelo_*.clog) junto al CSV
+        self.columnar_log = True
+        self.column_writer = None
+        self.log_dir = ""  # Carpeta de los logs ("" -> directorio actual)
+        self.log_name = ""  # Vehículo en el nombre del log (varios enlaces a la vez)
+        self.log_flush_interval = 1.0
+        self.log_fsync_interval = 10.0
         
         # --- VARIABLES DE TIEMPO (THROTTLING) ---
         self.last_update_30hz = 0 # 3D
@@ -80,13 +139,20 @@ class SerialWorker(QObject):
         self.last_update_05s = 0  # Gráficas
         self.last_update_5s = 0   # GPS, Textos lentos
 
+        # Último valor de cada grupo para la GUI (compartido con GroundStation)
+        self.snapshot = snapshot if snapshot is not None else TelemetrySnapshot()
+
+        # Medición de latencia (LatencyTracker compartido con la GUI, opcional)
+        self.latency = latency
+        self._rx_ns = 0  # Reloj monotónico al recibir el bloque en proceso
+
     @Slot()
     def init_worker(self):
         self.serial_port = QSerialPort()
         self.serial_port.readyRead.connect(self.on_ready_read)
         self.serial_port.errorOccurred.connect(self.handle_serial_error)
         
-        if sys.platform.startswith("linux"):
+        if sys.platform.startswith("linux") and not self.forward_only:
             print("Iniciando monitor de puertos (Modo Linux)")
             self.port_monitor = QFileSystemWatcher(self)
             self.port_monitor.directoryChanged.connect(self.check_available_ports)
@@ -117,8 +183,10 @@ class SerialWorker(QObject):
         if self.serial_port.open(QIODevice.OpenModeFlag.ReadWrite):
             self.serial_port.clear(QSerialPort.Direction.AllDirections)
             self.status_update.emit(f"Conectado a {port}", "success")
+            self.receiver_name = port
             self.reset_session_data()
-            self.open_csv_file()
+            if not self.forward_only:
+                self.open_csv_file()
         else:
             self.status_update.emit(f"Error al abrir {port}: {self.serial_port.errorString()}", "danger")
 
@@ -128,6 +196,8 @@ class SerialWorker(QObject):
             self.serial_port.close()
             self.status_update.emit("Desconectado.", "info")
         self.close_csv_file()
+        # Una predicción en curso termina antes de que el worker pueda destruirse
+        self.landing_pool.waitForDone()
 
     @Slot(str)
     def send_command_sequence(self, command_str: str):
@@ -142,6 +212,37 @@ class SerialWorker(QObject):
         except Exception as e:
             self.status_update.emit(f"Error enviando: {e}", "danger")
 
+    @Slot(str, float)
+    def start_replay(self, path: str, speed: float):
+        """Reproduce un log_vuelo_*.csv por el mismo camino que los datos en vivo."""
+        if self.serial_port and self.serial_port.isOpen():
+            self.status_update.emit("Error: Desconecte el puerto antes de reproducir.", "danger")
+            return
+        self.stop_replay()
+        try:
+            self.replay = ReplaySource(self, path, speed, self)
+        except Exception as e:
+            self.status_update.emit(f"Error leyendo {path}: {e}", "danger")
+            return
+        self.replay.finished.connect(self.on_replay_finished)
+        self.receiver_name = os.path.basename(path)
+        self.reset_session_data()
+        velocidad = "máxima" if speed <= 0 else f"{speed:g}x"
+        self.status_update.emit(f"Reproduciendo {path} ({len(self.replay.lines)} paquetes, {velocidad})", "info")
+        self.replay.start()
+
+    @Slot()
+    def stop_replay(self):
+        if self.replay:
+            self.replay.stop()
+            self.replay.deleteLater()
+            self.replay = None
+
+    @Slot()
+    def on_replay_finished(self):
+        self.status_update.emit("Reproducción terminada.", "info")
+        self.stop_replay()
+
     @Slot(QSerialPort.SerialPortError)
     def handle_serial_error(self, error):
         if error == QSerialPort.SerialPortError.ResourceError:
@@ -153,146 +254,452 @@ class SerialWorker(QObject):
         if self.port_monitor and sys.platform.startswith("linux"):
             self.port_monitor.removePath("/dev")
 
+    def mark_received(self):
+        """Marca la llegada de un bloque de datos (puerto serial o reproducción)."""
+        self._rx_ns = now_ns()
+
     @Slot()
     def on_ready_read(self):
-        self.serial_buffer += self.serial_port.readAll().data()
-        while b'\n' in self.serial_buffer:
-            packet_bytes, self.serial_buffer = self.serial_buffer.split(b'\n', 1)
+        self.mark_received()
+        data = self.serial_port.readAll().data()
+        if self.protocol is None:
+            data = self.detect_protocol(data)
+            if data is None:
+                return
+
+        lines = self.rx_buffer.feed(data)
+        if self.protocol == "binario":
+            if lines:
+                block, discarded = decode_frames(lines)
+                self.discarded_frames += discarded
+                if discarded:
+                    self.validator.count(TRAMA, discarded)
+                if len(block):
+                    block = block[self.validator.check_block(block)]
+                if self.latency:
+                    self.latency.parsed(self._rx_ns)
+                if len(block):
+                    self.process_block(block)
+            self.report_validation()
+            return
+        self.feed_lines(lines)
+
+    def feed_lines(self, lines: list):
+        """Procesa líneas de texto completas (del puerto serial o de una reproducción)."""
+        if self.forward_only or (self.batch_mode and len(lines) >= self.BATCH_MIN_LINES):
+            if lines:
+                self.process_chunk(lines)
+            self.report_validation()
+            return
+        for packet_bytes in lines:
             try:
-                packet_string = packet_bytes.decode('utf-8').strip()
+                packet_string = str(packet_bytes, 'utf-8').strip()
                 if packet_string:
                     self.process_packet(packet_string)
-                    print(f"[SERIAL]: {packet_string}")
             except UnicodeDecodeError:
                 self.status_update.emit("Error decode UTF-8", "danger")
+        self.report_validation()
+
+    def report_validation(self):
+        """Resumen periódico de paquetes rechazados (en lugar de un aviso por paquete)."""
+        text = self.validator.report()
+        if text:
+            if self.forward_only:
+                text = f"[{self.receiver_name}] {text}"
+            self.status_update.emit(text, "danger")
+        if self.merger is not None:
+            text = self.merger.report()
+            if text:
+                self.status_update.emit(text, "info")
+
+    # --- Diversidad (varios receptores del mismo vehículo) ---
+    def attach_receiver(self, receiver: "SerialWorker"):
+        """
+        Agrega un receptor redundante (SerialWorker con forward_only=True,
+        normalmente en su propio hilo). Sus bloques llegan a este hilo por
+        una conexión en cola y se combinan con los del puerto propio.
+        Solo se llama si de verdad hay un segundo puerto.
+        """
+        self.set_diversity(True)
+        receiver.block_received.connect(self.on_receiver_block)
+
+    @Slot(bool)
+    def set_diversity(self, enabled: bool):
+        """
+        Activa o quita la combinación de receptores (antes de conectar).
+        Sin merger el camino de un solo receptor queda igual: sin
+        deduplicación, pérdida por saltos de No_Paquete y sin reporte.
+        """
+        if not enabled:
+            self.merger = None
+        elif self.merger is None:
+            self.merger = DiversityMerger()
+
+    @Slot(str, object, object)
+    def on_receiver_block(self, name: str, block, raw_lines):
+        if self.merger is None:
+            return  # Bloque en cola de una sesión con diversidad ya terminada
+        self.mark_received()
+        self.process_block(block, raw_lines, name)
+        self.report_validation()
+
+    def detect_protocol(self, data: bytes):
+        """
+        Autodetección del protocolo: el CSV nunca contiene 0x00 y es ASCII;
+        las tramas binarias terminan en 0x00. Mientras no se decide se
+        acumulan los bytes. Devuelve los datos acumulados o None.
+        """
+        self._detect_buffer += data
+        pending = bytes(self._detect_buffer)
+        if FRAME_DELIMITER in pending:
+            self.set_protocol("binario")
+        elif b'\n' in pending and pending.isascii():
+            self.set_protocol("texto")
+        elif len(pending) > self.rx_buffer.max_line:
+            # Ruido sin formato reconocible: se descarta
+            self._detect_buffer.clear()
+            return None
+        else:
+            return None
+        self._detect_buffer.clear()
+        if self.protocol == "binario":
+            # Lo anterior al primer delimitador puede ser una trama incompleta
+            pending = pending[pending.index(FRAME_DELIMITER):]
+            self.status_update.emit("Protocolo binario detectado.", "info")
+        return pending
+
+    def set_protocol(self, protocol: str):
+        self.protocol = protocol
+        self.rx_buffer.clear()
+        self.rx_buffer.set_delimiter(FRAME_DELIMITER if protocol == "binario" else b'\n')
 
     def process_packet(self, packet_string: str):
         parts = packet_string.split(',')
-        if len(parts) != 31:
+        kind, v = self.validator.check_fields(parts, packet_string)
+        if kind != OK:
+            return
+        # Diversidad: solo la primera copia de cada número de paquete (v[14])
+        if self.merger is not None and not self.merger.accept(self.receiver_name, int(round(v[14]))):
             return
 
         try:
             self.gs_packet_count += 1
             now = time.time()
             
-            # --- 1. Extracción ---
-            data = {
-                'ax': float(parts[0]), 'ay': float(parts[1]), 'az': float(parts[2]),
-                'pitch': float(parts[3]), 'roll': float(parts[4]), 'yaw': float(parts[5]),
-                'compass': float(parts[6]),
-                'lat': float(parts[7]), 'lon': float(parts[8]), 'alt_gps': float(parts[9]),
-                'hora_gps': parts[10],
-                'bat_control': int(round(float(parts[11]))), 'bat_camara': int(round(float(parts[12]))),
-                't_encendido': float(parts[13]), 't_mision': float(parts[14]),
-                'no_paquete_enviado': int(round(float(parts[15]))),
-                'temp': float(parts[16]), 'pres': float(parts[17]), 'alt_baro': float(parts[18]),
-                'tvoc': float(parts[19]), 'co2': float(parts[20]), 'hum': float(parts[21]),
-                'led_lanz': bool(int(round(float(parts[22])))), 'led_p1': bool(int(round(float(parts[23])))),
-                'led_p2': bool(int(round(float(parts[24])))), 'led_p3': bool(int(round(float(parts[25])))),
-                'led_cam': bool(int(round(float(parts[26])))), 'led_sd': bool(int(round(float(parts[27])))),
-                'etapa_id': int(round(float(parts[28]))),
-                'error': int(round(float(parts[29]))), 'comando': int(round(float(parts[30])))
-            }
+            # --- 1. Extracción (valores ya validados como números en rango) ---
+            # (v: campos numéricos en el orden del paquete, sin Hora_GPS)
+            data = TelemetryRecord(
+                v[0], v[1], v[2], v[3], v[4], v[5], v[6],
+                v[7], v[8], v[9],
+                parts[10].strip(),
+                int(round(v[10])), int(round(v[11])),
+                v[12], v[13],
+                int(round(v[14])),
+                v[15], v[16], v[17], v[18], v[19], v[20],
+                bool(round(v[21])), bool(round(v[22])),
+                bool(round(v[23])), bool(round(v[24])),
+                bool(round(v[25])), bool(round(v[26])),
+                int(round(v[27])),
+                int(round(v[28])), int(round(v[29])),
+            )
+            if self.latency:
+                self.latency.parsed(self._rx_ns)
 
             # --- 2. Cálculos ---
-            self.vel_window.append((data['t_mision'], data['alt_baro']))
-            if len(self.vel_window) > 20: self.vel_window.pop(0)
-            if len(self.vel_window) > 1:
-                dt = self.vel_window[-1][0] - self.vel_window[0][0]
-                dh = self.vel_window[-1][1] - self.vel_window[0][1]
-                if dt > 0: self.velocidad_z = dh / dt
+            alt, self.velocidad_z, sigma_alt, sigma_vz = self.estimator.update(
+                data.t_mision, data.alt_baro, data.alt_gps, data.az
+            )
+            event = self.flight_events.update(data.t_mision, alt, self.velocidad_z)
+            self.wind.add_fix(data.t_mision, data.lat, data.lon, self.descending)
 
             # --- 3. Buffers y CSV ---
-            self.graph_time.append(data['t_mision'])
-            self.graph_pressure.append(data['pres'])
-            self.graph_temp.append(data['temp'])
-            self.graph_co2.append(data['co2'])
-            self.graph_tvoc.append(data['tvoc'])
-            self.graph_humidity.append(data['hum'])
-            if len(self.graph_time) > self.MAX_GRAPH_POINTS:
-                self.graph_time.pop(0); self.graph_pressure.pop(0); self.graph_temp.pop(0)
-                self.graph_co2.pop(0); self.graph_tvoc.pop(0); self.graph_humidity.pop(0)
-
-            if data['no_paquete_enviado'] > (self.last_packet_id + 1):
-                self.lost_packets += (data['no_paquete_enviado'] - self.last_packet_id - 1)
-            self.last_packet_id = data['no_paquete_enviado']
+            if self.history is not None:
+                self.history.append(
+                    data.t_mision, data.pres, data.temp, data.co2, data.tvoc, data.hum
+                )
+
+            if data.no_paquete_enviado > (self.last_packet_id + 1):
+                self.lost_packets += (data.no_paquete_enviado - self.last_packet_id - 1)
+            self.last_packet_id = data.no_paquete_enviado
+            if self.merger is not None:
+                # Con varios receptores llegan fuera de orden: cuenta la ventana combinada
+                self.lost_packets = self.merger.lost
 
             if self.csv_writer:
                 row = [self.gs_packet_count] + parts + [f"{self.velocidad_z:.3f}"]
-                self.csv_writer.writerow(row)
+                self.csv_writer.write_row(row)
+            if self.column_writer:
+                self.column_writer.write_block(
+                    np.array([data.packet_values()], dtype=PACKET_DTYPE),
+                    self.gs_packet_count, [self.velocidad_z]
+                )
+
+            data = data._replace(
+                velocidad_z=self.velocidad_z, lost_packets=self.lost_packets,
+                gs_packet_count=self.gs_packet_count,
+                alt_filtrada=alt, sigma_alt=sigma_alt, sigma_vz=sigma_vz
+            )
 
             # --- 5. EMISIÓN CONTROLADA ---
-            
-            # A. Simulación 3D (30 Hz -> 0.033s)
-            if (now - self.last_update_30hz) > 0.033:
-                self.visor_3d_updated.emit(data['pitch'], data['roll'], data['yaw'])
-                self.last_update_30hz = now
-
-            # B. UI Rápida (20 Hz -> 0.05s)
-            # Incluye: Brújula, Barras Acel/Vel, Gráfica de Pastel y Altimetro (para suavidad)
-            if (now - self.last_update_20hz) > 0.05:
-                self.cinematica_updated.emit({
-                    'ax': data['ax'], 'ay': data['ay'], 'az': data['az'],
-                    'vel': self.velocidad_z, 'yaw': data['compass']
-                })
-                self.paquetes_data_updated.emit(data['no_paquete_enviado'], self.lost_packets)
-                self.altimetro_data_updated.emit(int(data['alt_baro']))
-                self.last_update_20hz = now
-
-            # C. Gráficas de Líneas (0.5s -> 2 Hz)
-            if (now - self.last_update_05s) > 0.5:
-                self.graficas_data_updated.emit({
-                    'time': self.graph_time, 'temp': self.graph_temp, 'pres': self.graph_pressure
-                })
-                self.calidad_aire_updated.emit({
-                    'time': self.graph_time, 'co2': self.graph_co2, 'tvoc': self.graph_tvoc, 'hum': self.graph_humidity
-                })
-                self.last_update_05s = now
-
-            # D. UI Lenta / Textos / Mapa (5.0s -> 0.2 Hz)
-            if (now - self.last_update_5s) > 5.0:
-                # GPS (Mapa y Texto)
-                self.gps_data_updated.emit({
-                    'location': [data['lat'], data['lon']],
-                    'start_time': data['hora_gps'],
-                    'flight_time': data['t_mision']
-                })
-                # Baterías
-                self.baterias_data_updated.emit(data['bat_control'], data['bat_camara'])
-                
-                # Estados y Etapa
-                etapas = {0: "NO INICIADA", 1: "IGNICION", 2: "APOGEO", 3: "CAIDA LIBRE", 4: "ATERRIZAJE"}
-                etapa_str = etapas.get(data['etapa_id'], "DESCONOCIDO")
-                self.estados_data_updated.emit({
-                    'etapa': etapa_str,
-                    'lanzamiento': data['led_lanz'], 'carga1': data['led_p1'], 
-                    'carga2': data['led_p2'], 'carga3': data['led_p3'], 
-                    'camara': data['led_cam'], 'sd': data['led_sd']
-                })
-                
-                self.last_update_5s = now
+            self.emit_throttled(data, now)
 
             # Eventos inmediatos (Sin retraso)
-            if data['error'].strip() and data['error'] != "0":
-                 self.status_update.emit(f"ERROR COD: {data['error']}", "danger")
-            if data['comando'].strip():
-                 self.status_update.emit(f"CMD CONFIRMADO: {data['comando']}", "info")
+            self.emit_events(data)
+            if event is not None:
+                self.emit_flight_event(event)
+            self.request_landing_prediction(data, now)
 
         except Exception as e:
             self.status_update.emit(f"Error procesando: {e}", "danger")
 
+    def process_chunk(self, lines: list):
+        """
+        Modo por lotes: decodifica todas las líneas completas de un
+        readyRead en un solo arreglo estructurado y lo procesa como bloque.
+        """
+        block, raw_lines, _ = parse_block(lines, self.validator)
+        if self.latency:
+            self.latency.parsed(self._rx_ns)
+        if len(block):
+            self.process_block(block, raw_lines)
+
+    def process_block(self, block: np.ndarray, raw_lines: list = None, receiver: str = None):
+        """
+        Procesa un bloque de paquetes (arreglo PACKET_DTYPE) de una sola vez:
+        velocidad, buffers de gráficas, pérdida de paquetes y CSV.
+        Las señales se emiten con el último paquete del bloque.
+        'receiver' es el receptor de diversidad de origen (None = puerto propio).
+        """
+        if self.forward_only:
+            self.block_received.emit(self.receiver_name, block, raw_lines)
+            return
+        if self.merger is not None:
+            keep = self.merger.accept_block(receiver or self.receiver_name, block['no_paquete_enviado'])
+            if not keep.all():
+                block = block[keep]
+                if raw_lines is not None:
+                    raw_lines = [line for line, k in zip(raw_lines, keep.tolist()) if k]
+            if not len(block):
+                return
+        n = len(block)
+        try:
+            now = time.time()
+            first_count = self.gs_packet_count + 1
+            self.gs_packet_count += n
+            t = block['t_mision']
+
+            # --- 2. Cálculos (mismo estimador que el modo por paquete) ---
+            est_alt, vel, sigma_alt, sigma_vz = self.estimator.update_block(
+                t, block['alt_baro'], block['alt_gps'], block['az']
+            )
+            self.velocidad_z = float(vel[-1])
+            events = self.flight_events.update_block(t, est_alt, vel)
+            self.wind.add_fixes(t, block['lat'], block['lon'], self.descending)
+
+            # --- 3. Buffers y CSV ---
+            if self.history is not None:
+                self.history.extend({
+                    'time': t, 'pres': block['pres'], 'temp': block['temp'],
+                    'co2': block['co2'], 'tvoc': block['tvoc'], 'hum': block['hum']
+                })
+
+            seq = block['no_paquete_enviado']
+            prev = np.concatenate(([self.last_packet_id], seq[:-1]))
+            gaps = seq - prev - 1
+            self.lost_packets += int(gaps[gaps > 0].sum())
+            self.last_packet_id = int(seq[-1])
+            if self.merger is not None:
+                self.lost_packets = self.merger.lost
+
+            if self.csv_writer and raw_lines is None:
+                raw_lines = format_block(block)
+            if self.csv_writer and raw_lines:
+                self.csv_writer.write_rows(
+                    [count] + line.decode('utf-8', 'replace').strip().split(',') + [f"{v:.3f}"]
+                    for count, line, v in zip(range(first_count, first_count + n), raw_lines, vel.tolist())
+                )
+
+            if self.column_writer:
+                self.column_writer.write_block(block, first_count, vel)
+
+            # --- 5. EMISIÓN CONTROLADA (último paquete del bloque) ---
+            data = row_to_record(
+                block[-1], self.velocidad_z, self.lost_packets, self.gs_packet_count,
+                float(est_alt[-1]), float(sigma_alt[-1]), float(sigma_vz[-1])
+            )
+            self.emit_throttled(data, now)
+            self.emit_block_events(block)
+            for event in events:
+                self.emit_flight_event(event)
+            self.request_landing_prediction(data, now)
+
+        except Exception as e:
+            self.status_update.emit(f"Error procesando: {e}", "danger")
+
+    def emit_throttled(self, data: TelemetryRecord, now: float):
+        """
+        Publica en el snapshot los grupos a los que les toca según los cuatro
+        niveles de frecuencia y avisa a la GUI con una sola señal.
+        """
+        snap = self.snapshot
+        published = False
+
+        # A. Simulación 3D (30 Hz -> 0.033s)
+        if (now - self.last_update_30hz) > 0.033:
+            self.mark_tier('30hz', True)
+            snap.publish('visor_3d', (data.pitch, data.roll, data.yaw))
+            self.last_update_30hz = now
+            published = True
+        else:
+            self.mark_tier('30hz', False)
+
+        # B. UI Rápida (20 Hz -> 0.05s)
+        # Incluye: Brújula, Barras Acel/Vel, Gráfica de Pastel y Altimetro (para suavidad)
+        if (now - self.last_update_20hz) > 0.05:
+            self.mark_tier('20hz', True)
+            snap.publish('cinematica', data)
+            snap.publish('paquetes', (data.no_paquete_enviado, data.lost_packets))
+            snap.publish('altimetro', int(data.alt_baro))
+            snap.publish('vuelo', self.flight_events.predict())
+            self.last_update_20hz = now
+            published = True
+        else:
+            self.mark_tier('20hz', False)
+
+        # C. Gráficas de Líneas y posición GPS (0.5s -> 2 Hz)
+        if (now - self.last_update_05s) > 0.5:
+            self.mark_tier('2hz', True)
+            # El historial no se copia: es compartido y protegido con su propio candado
+            snap.publish('graficas', {
+                'history': self.history, 'time': data.t_mision,
+                'pres': data.pres, 'temp': data.temp
+            })
+            snap.publish('calidad_aire', {'history': self.history, 'time': data.t_mision})
+            # El mapa se actualiza por JavaScript, así que aguanta esta frecuencia
+            snap.publish('gps', data)
+            self.last_update_05s = now
+            published = True
+        else:
+            self.mark_tier('2hz', False)
+
+        # D. UI Lenta / Textos (5.0s -> 0.2 Hz)
+        if (now - self.last_update_5s) > 5.0:
+            self.mark_tier('0.2hz', True)
+            snap.publish('baterias', (data.bat_control, data.bat_camara))
+            snap.publish('estados', data)
+            self.last_update_5s = now
+            published = True
+        else:
+            self.mark_tier('0.2hz', False)
+
+        if published and snap.request_notify():
+            self.snapshot_updated.emit()
+
+    def mark_tier(self, tier: str, emitting: bool):
+        """Latencia: el nivel emite ahora (antes de las señales) o retiene el dato."""
+        if not self.latency:
+            return
+        if emitting:
+            self.latency.emitted(tier, self._rx_ns)
+        else:
+            self.latency.held(tier, self._rx_ns)
+
+    def emit_events(self, data: TelemetryRecord):
+        """Avisa solo cuando cambian el código de error o el último comando (0 = ninguno)."""
+        if data.error != self.last_error_code:
+            self.last_error_code = data.error
+            if data.error:
+                self.status_update.emit(f"ERROR COD: {data.error}", "danger")
+        if data.comando != self.last_command:
+            self.last_command = data.comando
+            if data.comando:
+                self.status_update.emit(f"CMD CONFIRMADO: {data.comando}", "info")
+
+    def emit_flight_event(self, event):
+        self.status_update.emit(
+            f"EVENTO {event.name}: t={event.t:.2f} s, alt={event.alt:.1f} m, vel={event.vel:.1f} m/s",
+            "warning"
+        )
+        self.flight_event.emit(event)
+
+    @property
+    def descending(self) -> bool:
+        return self.flight_events.phase in (DESCENSO, PARACAIDAS)
+
+    def request_landing_prediction(self, data: TelemetryRecord, now: float):
+        """
+        En el descenso, cada LANDING_INTERVAL s manda el Monte Carlo de la
+        zona de aterrizaje a landing_pool (a lo más una tarea en curso).
+        """
+        if (not self.descending or self._landing_busy or self.wind.samples < 2
+                or now - self._landing_last < self.LANDING_INTERVAL or -data.velocidad_z < 1.0):
+            return
+        pad = self.flight_events.pad_alt or 0.0
+        inp = LandingInput(
+            data.lat, data.lon, data.alt_filtrada - pad, data.sigma_alt,
+            -data.velocidad_z, data.sigma_vz,
+            (self.wind.mean_e, self.wind.mean_n),
+            (self.wind.var_e, self.wind.cov_en, self.wind.var_n),
+        )
+        self._landing_busy = True
+        self._landing_last = now
+        self.landing_pool.start(
+            LandingTask(inp, self.landing_session, self.landing_signals, self.LANDING_SAMPLES)
+        )
+
+    @Slot(object, int)
+    def on_landing_prediction(self, prediction, session: int):
+        """Resultado del pool (llega al hilo del worker); se descarta si es de otra sesión."""
+        if session != self.landing_session:
+            return
+        self._landing_busy = False
+        if prediction is None:
+            return
+        self.snapshot.publish('aterrizaje', prediction)
+        if self.snapshot.request_notify():
+            self.snapshot_updated.emit()
+
+    def emit_block_events(self, block: np.ndarray):
+        """emit_events() para un bloque: solo se recorren los renglones donde hubo cambio."""
+        for key, attr, text, status in (
+            ('error', 'last_error_code', "ERROR COD", "danger"),
+            ('comando', 'last_command', "CMD CONFIRMADO", "info"),
+        ):
+            column = block[key]
+            changes = np.flatnonzero(np.diff(column, prepend=getattr(self, attr)))
+            for value in column[changes].tolist():
+                if value:
+                    self.status_update.emit(f"{text}: {value}", status)
+            setattr(self, attr, int(column[-1]))
+
     def reset_session_data(self):
+        self.rx_buffer.clear()
+        self._detect_buffer.clear()
+        self.discarded_frames = 0
+        if self.protocol_mode == "auto":
+            self.protocol = None
+        else:
+            self.set_protocol(self.protocol_mode)
         self.last_packet_id = 0
         self.lost_packets = 0
         self.gs_packet_count = 0
-        self.vel_window.clear()
+        self.estimator.reset()
+        self.flight_events.reset()
+        self.wind.reset()
+        # Una predicción todavía en el pool pertenece a la sesión anterior
+        self.landing_session += 1
+        self._landing_busy = False
+        self._landing_last = 0.0
         self.velocidad_z = 0.0
-        self.graph_time.clear()
-        self.graph_pressure.clear()
-        self.graph_temp.clear()
-        self.graph_co2.clear()
-        self.graph_tvoc.clear()
-        self.graph_humidity.clear()
+        self.last_error_code = 0
+        self.last_command = 0
+        self.validator.reset()
+        if self.merger is not None:
+            self.merger.reset()
+        if self.history is not None:
+            self.history.clear()
+        if self.latency:
+            self.latency.clear_pending()
         
         now = time.time()
         self.last_update_30hz = now
@@ -303,17 +710,41 @@ class SerialWorker(QObject):
     def open_csv_file(self):
         self.close_csv_file()
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"log_vuelo_{timestamp}.csv"
+        if self.log_name:
+            timestamp = f"{self.log_name}_{timestamp}"
+        filename = os.path.join(self.log_dir, f"log_vuelo_{timestamp}.csv")
         try:
-            self.csv_file = open(filename, 'w', newline='', encoding='utf-8')
-            self.csv_writer = csv.writer(self.csv_file)
-            self.csv_writer.writerow(self.CSV_HEADER)
+            self.csv_writer = FlightLogWriter(
+                filename, self.CSV_HEADER,
+                flush_interval=self.log_flush_interval,
+                fsync_interval=self.log_fsync_interval,
+            )
             self.status_update.emit(f"Grabando en: {filename}", "success")
         except Exception as e:
             self.status_update.emit(f"Error creando CSV: {e}", "danger")
 
+        if self.columnar_log:
+            filename = os.path.join(self.log_dir, f"log_vuelo_{timestamp}.clog")
+            try:
+                self.column_writer = ColumnarLogWriter(
+                    filename,
+                    flush_interval=self.log_flush_interval,
+                    fsync_interval=self.log_fsync_interval,
+                )
+                self.status_update.emit(f"Log binario en: {filename}", "info")
+            except Exception as e:
+                self.status_update.emit(f"Error creando log binario: {e}", "danger")
+
     def close_csv_file(self):
-        if self.csv_file:
-            self.csv_file.close()
-            self.csv_file = None
-            self.csv_writer = None
+        for writer in (self.csv_writer, self.column_writer):
+            if not writer:
+                continue
+            writer.close()
+            stats = writer.stats()
+            if stats['dropped_rows'] or stats['error']:
+                self.status_update.emit(
+                    f"Log de vuelo ({writer.filename}): {stats['dropped_rows']} renglones descartados. {stats['error'] or ''}",
+                    "danger"
+                )
+        self.csv_writer = None
+        self.column_writer = None
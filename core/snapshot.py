@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# core/snapshot.py
+
+import threading
+
+# Grupos de datos de la GUI (uno por panel o conjunto de widgets)
+SNAPSHOT_GROUPS = (
+    'visor_3d', 'cinematica', 'altimetro', 'paquetes', 'vuelo',
+    'graficas', 'calidad_aire',
+    'gps', 'aterrizaje', 'baterias', 'estados',
+)
+
+
+class TelemetrySnapshot:
+    """
+    Último valor de cada grupo de telemetría, compartido entre el hilo
+    serial (escribe) y la GUI (lee).
+
+    Cada grupo tiene un número de generación que solo crece: la GUI guarda
+    la generación que ya dibujó y redibuja únicamente los grupos que
+    cambiaron. Los valores publicados no deben modificarse después
+    (registros inmutables o copias).
+
+    La notificación a la GUI se agrupa: request_notify() solo devuelve True
+    si la GUI ya atendió el aviso anterior, así hay a lo más una señal en
+    la cola sin importar cuántos paquetes lleguen.
+    """
+
+    def __init__(self, groups=SNAPSHOT_GROUPS):
+        self._lock = threading.Lock()
+        self._values = {name: None for name in groups}
+        self._generations = {name: 0 for name in groups}
+        self._notify_pending = False
+
+    # --- Hilo serial ---
+    def publish(self, group: str, value):
+        with self._lock:
+            self._values[group] = value
+            self._generations[group] += 1
+
+    def request_notify(self) -> bool:
+        """True si hay que emitir la señal (no hay un aviso pendiente)."""
+        with self._lock:
+            if self._notify_pending:
+                return False
+            self._notify_pending = True
+            return True
+
+    # --- GUI ---
+    def acknowledge(self):
+        """La GUI atendió el aviso; el siguiente publish volverá a notificar."""
+        with self._lock:
+            self._notify_pending = False
+
+    def generation(self, group: str) -> int:
+        return self._generations[group]
+
+    def generations(self) -> dict:
+        with self._lock:
+            return dict(self._generations)
+
+    def get(self, group: str) -> tuple:
+        """(generación, valor) del grupo."""
+        with self._lock:
+            return self._generations[group], self._values[group]
+
+    def changed(self, seen: dict, groups=None) -> dict:
+        """
+        {grupo: valor} de los grupos con generación mayor a la de 'seen'
+        (dict grupo -> generación ya dibujada), que se actualiza.
+        """
+        out = {}
+        with self._lock:
+            for group in groups or self._values:
+                gen = self._generations[group]
+                if gen != seen.get(group, 0):
+                    seen[group] = gen
+                    out[group] = self._values[group]
+        return out
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# core/tile_cache.py
+
+"""
+Caché en disco de teselas del mapa (formato MBTiles, SQLite) con límite
+de tamaño LRU, más los archivos JS/CSS que necesita la página del mapa.
+
+Descarga previa (antes de ir al campo, con internet):
+    python -m core.tile_cache --lat 19.4284 --lon -99.1276 --radius-km 5 --zoom 10 18
+    python -m core.tile_cache --bbox 19.40 -99.16 19.46 -99.10 --zoom 12 17 --db sitio.mbtiles
+"""
+
+import argparse
+import math
+import sqlite3
+import sys
+import threading
+import time
+
+TILE_URL = "https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}"
+DEFAULT_CACHE_PATH = "tiles_cache.mbtiles"
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+USER_AGENT = "CENTINELA-GS/1.0"
+
+# Un acceso solo actualiza la marca LRU si la anterior es más vieja que esto (s)
+_TOUCH_INTERVAL = 60
+# Escrituras pendientes antes de confirmar la transacción (flush() confirma antes)
+_COMMIT_EVERY = 64
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS metadata (name TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS tiles (
+    zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER, tile_data BLOB,
+    last_used INTEGER, size INTEGER,
+    PRIMARY KEY (zoom_level, tile_column, tile_row)
+);
+CREATE INDEX IF NOT EXISTS tiles_lru ON tiles (last_used);
+CREATE TABLE IF NOT EXISTS gs_assets (url TEXT PRIMARY KEY, mime TEXT, data BLOB);
+"""
+
+
+def tile_mime(data: bytes) -> str:
+    return "image/png" if data[:4] == b'\x89PNG' else "image/jpeg"
+
+
+def lonlat_to_tile(lon: float, lat: float, zoom: int) -> tuple:
+    """Tesela XYZ (esquema de Leaflet/Google) que contiene el punto."""
+    lat = max(-85.05112878, min(85.05112878, lat))
+    n = 1 << zoom
+    x = int((lon + 180.0) / 360.0 * n)
+    y = int((1.0 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2.0 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+
+def tiles_in_bbox(south: float, west: float, north: float, east: float, zooms) -> list:
+    """Lista de (z, x, y) que cubren el rectángulo en cada nivel de zoom."""
+    tiles = []
+    for z in zooms:
+        x0, y0 = lonlat_to_tile(west, north, z)
+        x1, y1 = lonlat_to_tile(east, south, z)
+        tiles.extend((z, x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1))
+    return tiles
+
+
+class TileCache:
+    """
+    Teselas en un archivo MBTiles. Las filas se guardan en esquema TMS como
+    pide el formato; get()/put() reciben coordenadas XYZ. Al pasar de
+    max_bytes se borran las teselas usadas hace más tiempo hasta quedar
+    en el 90 %. Los archivos de la página (gs_assets) no se desalojan.
+
+    Las escrituras no se confirman una por una: se acumulan en la
+    transacción abierta y se hace commit cada _COMMIT_EVERY, en flush() o
+    en close(). La misma conexión ya ve lo pendiente; si el programa muere
+    antes del commit solo se pierden esas teselas (se vuelven a descargar).
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        # Con WAL basta sincronizar en los checkpoints; un corte solo pierde lo último
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._db.executemany(
+            "INSERT OR IGNORE INTO metadata (name, value) VALUES (?, ?)",
+            [('name', 'Esri World Imagery'), ('format', 'jpg'), ('type', 'baselayer'), ('version', '1')]
+        )
+        self._db.commit()
+        self.total_bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM tiles").fetchone()[0]
+        self.hits = 0
+        self.misses = 0
+        self.pending = 0  # Escrituras sin confirmar
+
+    def close(self):
+        with self._lock:
+            self._commit()
+            self._db.close()
+
+    def flush(self):
+        """Confirma las escrituras pendientes."""
+        with self._lock:
+            self._commit()
+
+    def _written(self):
+        self.pending += 1
+        if self.pending >= _COMMIT_EVERY:
+            self._commit()
+
+    def _commit(self):
+        if self.pending:
+            self._db.commit()
+            self.pending = 0
+
+    # --- Teselas ---
+    def get(self, z: int, x: int, y: int):
+        row = (1 << z) - 1 - y
+        now = int(time.time())
+        with self._lock:
+            found = self._db.execute(
+                "SELECT tile_data, last_used FROM tiles WHERE zoom_level=? AND tile_column=? AND tile_row=?",
+                (z, x, row)
+            ).fetchone()
+            if found is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            if now - found[1] > _TOUCH_INTERVAL:
+                self._db.execute(
+                    "UPDATE tiles SET last_used=? WHERE zoom_level=? AND tile_column=? AND tile_row=?",
+                    (now, z, x, row)
+                )
+                self._written()
+            return found[0]
+
+    def contains(self, z: int, x: int, y: int) -> bool:
+        with self._lock:
+            return self._db.execute(
+                "SELECT 1 FROM tiles WHERE zoom_level=? AND tile_column=? AND tile_row=?",
+                (z, x, (1 << z) - 1 - y)
+            ).fetchone() is not None
+
+    def put(self, z: int, x: int, y: int, data: bytes):
+        row = (1 << z) - 1 - y
+        with self._lock:
+            old = self._db.execute(
+                "SELECT size FROM tiles WHERE zoom_level=? AND tile_column=? AND tile_row=?", (z, x, row)
+            ).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO tiles VALUES (?, ?, ?, ?, ?, ?)",
+                (z, x, row, sqlite3.Binary(data), int(time.time()), len(data))
+            )
+            self.total_bytes += len(data) - (old[0] if old else 0)
+            if self.total_bytes > self.max_bytes:
+                self._evict(int(self.max_bytes * 0.9))
+            self._written()
+
+    def _evict(self, target: int):
+        cursor = self._db.execute("SELECT zoom_level, tile_column, tile_row, size FROM tiles ORDER BY last_used")
+        victims = []
+        for z, x, row, size in cursor:
+            if self.total_bytes <= target:
+                break
+            victims.append((z, x, row))
+            self.total_bytes -= size
+        self._db.executemany(
+            "DELETE FROM tiles WHERE zoom_level=? AND tile_column=? AND tile_row=?", victims
+        )
+
+    # --- Archivos de la página (Leaflet, CSS...) ---
+    def get_asset(self, url: str):
+        """(mime, datos) o None."""
+        with self._lock:
+            return self._db.execute("SELECT mime, data FROM gs_assets WHERE url=?", (url,)).fetchone()
+
+    def put_asset(self, url: str, mime: str, data: bytes):
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO gs_assets VALUES (?, ?, ?)", (url, mime, sqlite3.Binary(data)))
+            self._written()
+
+    def stats(self) -> dict:
+        with self._lock:
+            count = self._db.execute("SELECT COUNT(*) FROM tiles").fetchone()[0]
+        return {'tiles': count, 'bytes': self.total_bytes, 'max_bytes': self.max_bytes,
+                'hits': self.hits, 'misses': self.misses, 'pending': self.pending}
+
+
+def asset_mime(url: str, content_type: str = "") -> str:
+    if content_type:
+        return content_type.split(';')[0].strip()
+    if url.endswith('.css'):
+        return "text/css"
+    if url.endswith('.js'):
+        return "application/javascript"
+    return "application/octet-stream"
+
+
+def map_asset_urls() -> list:
+    """URLs de los JS/CSS que Folium incluye en la página del mapa."""
+    import folium
+    return [url for _, url in folium.Map.default_js + folium.Map.default_css]
+
+
+def prefetch(cache: TileCache, tiles: list, delay: float = 0.05, session=None, log=print) -> dict:
+    """Descarga las teselas que falten (y los archivos de la página)."""
+    import requests
+
+    session = session or requests.Session()
+    session.headers['User-Agent'] = USER_AGENT
+    done = skipped = failed = 0
+
+    for url in map_asset_urls():
+        if cache.get_asset(url) is None:
+            try:
+                r = session.get(url, timeout=20)
+                r.raise_for_status()
+                cache.put_asset(url, asset_mime(url, r.headers.get('Content-Type', '')), r.content)
+            except requests.RequestException as e:
+                log(f"Aviso: no se pudo descargar {url}: {e}")
+
+    for i, (z, x, y) in enumerate(tiles, 1):
+        if cache.contains(z, x, y):
+            skipped += 1
+            continue
+        try:
+            r = session.get(TILE_URL.format(z=z, x=x, y=y), timeout=20)
+            r.raise_for_status()
+            cache.put(z, x, y, r.content)
+            done += 1
+        except requests.RequestException as e:
+            failed += 1
+            log(f"Error z={z} x={x} y={y}: {e}")
+        if i % 100 == 0 or i == len(tiles):
+            log(f"{i}/{len(tiles)} teselas (nuevas {done}, ya en caché {skipped}, errores {failed})")
+        if delay:
+            time.sleep(delay)
+    return {'downloaded': done, 'skipped': skipped, 'failed': failed}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Descarga previa de teselas para uso sin internet")
+    area = parser.add_mutually_exclusive_group(required=True)
+    area.add_argument('--bbox', nargs=4, type=float, metavar=('SUR', 'OESTE', 'NORTE', 'ESTE'))
+    area.add_argument('--lat', type=float, help="Latitud del sitio de lanzamiento (con --lon y --radius-km)")
+    parser.add_argument('--lon', type=float)
+    parser.add_argument('--radius-km', type=float, default=5.0)
+    parser.add_argument('--zoom', nargs=2, type=int, default=[10, 17], metavar=('MIN', 'MAX'))
+    parser.add_argument('--db', default=DEFAULT_CACHE_PATH)
+    parser.add_argument('--max-mb', type=int, default=DEFAULT_MAX_BYTES // 1024 ** 2)
+    parser.add_argument('--max-tiles', type=int, default=50000, help="Abortar si el área requiere más teselas")
+    parser.add_argument('--delay', type=float, default=0.05, help="Pausa entre descargas (s)")
+    args = parser.parse_args(argv)
+
+    if args.bbox:
+        south, west, north, east = args.bbox
+    else:
+        if args.lon is None:
+            parser.error("--lat requiere --lon")
+        dlat = args.radius_km / 111.32
+        dlon = args.radius_km / (111.32 * max(0.01, math.cos(math.radians(args.lat))))
+        south, north = args.lat - dlat, args.lat + dlat
+        west, east = args.lon - dlon, args.lon + dlon
+
+    tiles = tiles_in_bbox(south, west, north, east, range(args.zoom[0], args.zoom[1] + 1))
+    if len(tiles) > args.max_tiles:
+        print(f"El área requiere {len(tiles)} teselas (límite {args.max_tiles}). "
+              "Reduzca el área o el zoom máximo, o suba --max-tiles.")
+        return 1
+
+    cache = TileCache(args.db, args.max_mb * 1024 ** 2)
+    print(f"{len(tiles)} teselas, zoom {args.zoom[0]}-{args.zoom[1]} -> {args.db}")
+    try:
+        result = prefetch(cache, tiles, args.delay)
+        print(f"Listo: {result} | caché: {cache.stats()}")
+    finally:
+        cache.close()  # Confirma lo pendiente también si se interrumpe
+    return 1 if result['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# core/validation.py
+
+import math
+import re
+import time
+
+import numpy as np
+
+from core.packet_schema import NUMBER_WIDTH, PACKET_FIELDS, PACKET_FIELD_COUNT, PACKET_TOKEN_WIDTHS
+
+# Clasificación de un paquete
+OK = 'ok'
+CAMPOS = 'campos'        # Cantidad de campos distinta de 31
+LONGITUD = 'longitud'    # Algún campo excede su ancho máximo (PACKET_TOKEN_WIDTHS)
+NUMERICO = 'numerico'    # Algún campo no es un número finito
+RANGO = 'rango'          # Algún valor fuera del rango físico permitido
+TRAMA = 'trama'          # Trama binaria con tamaño, versión o CRC inválidos
+ERROR_KINDS = (CAMPOS, LONGITUD, NUMERICO, RANGO, TRAMA)
+
+# Rangos permitidos (mínimo, máximo), amplios: solo descartan basura del enlace
+FIELD_RANGES = {
+    'ax': (-1000.0, 1000.0), 'ay': (-1000.0, 1000.0), 'az': (-1000.0, 1000.0),
+    'pitch': (-360.0, 360.0), 'roll': (-360.0, 360.0), 'yaw': (-360.0, 360.0),
+    'compass': (-360.0, 360.0),
+    'lat': (-90.0, 90.0), 'lon': (-180.0, 180.0), 'alt_gps': (-1000.0, 100000.0),
+    'bat_control': (0, 100), 'bat_camara': (0, 100),
+    't_encendido': (0.0, 1e7), 't_mision': (0.0, 1e7),
+    'no_paquete_enviado': (0, 2 ** 31),
+    'temp': (-100.0, 150.0), 'pres': (0.0, 200.0), 'alt_baro': (-1000.0, 100000.0),
+    'tvoc': (0.0, 100000.0), 'co2': (0.0, 100000.0), 'hum': (0.0, 100.0),
+    'led_lanz': (0, 1), 'led_p1': (0, 1), 'led_p2': (0, 1), 'led_p3': (0, 1),
+    'led_cam': (0, 1), 'led_sd': (0, 1),
+    'etapa_id': (0, 255), 'error': (0, 65535), 'comando': (0, 65535),
+}
+
+# Número decimal o en notación científica (sin nan/inf), con espacios alrededor
+_NUMBER_PATTERN = r'\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*'
+_NUMBER = re.compile(_NUMBER_PATTERN)
+# Paquete completo bien formado (31 campos dentro de su ancho, todos los
+# numéricos válidos) en una sola comparación
+_PACKET = re.compile(','.join(
+    f'[^,]{{0,{width}}}' if kind == 's' else f'(?=[^,]{{0,{NUMBER_WIDTH}}}(?:,|$)){_NUMBER_PATTERN}'
+    for (_, _, kind), width in zip(PACKET_FIELDS, PACKET_TOKEN_WIDTHS)
+))
+
+# Campos numéricos (todos menos Hora_GPS): índice en el paquete, llave y tipo
+NUMERIC_INDEX = [i for i, (_, _, kind) in enumerate(PACKET_FIELDS) if kind != 's']
+NUMERIC_KEYS = [PACKET_FIELDS[i][1] for i in NUMERIC_INDEX]
+
+
+class PacketValidator:
+    """
+    Validación de paquetes sin excepciones.
+
+    Cada paquete se clasifica como OK o como el primer tipo de error que
+    presenta (campos, numérico, rango; 'trama' para el protocolo binario).
+    Se cuentan paquetes por tipo de error y errores por campo; en lugar de
+    avisar por cada paquete, report() resume lo ocurrido cada 'interval'
+    segundos (solo si hubo errores).
+    """
+
+    def __init__(self, interval: float = 5.0, ranges: dict = None):
+        self.interval = interval
+        ranges = FIELD_RANGES if ranges is None else ranges
+        limits = [ranges.get(key, (-np.inf, np.inf)) for key in NUMERIC_KEYS]
+        self._checks = [(i, key, lo, hi) for i, key, (lo, hi) in zip(NUMERIC_INDEX, NUMERIC_KEYS, limits)]
+        # Límites como vectores para revisar un bloque completo de una vez
+        self._lo = np.array([lo for lo, _ in limits], dtype=np.float64)
+        self._hi = np.array([hi for _, hi in limits], dtype=np.float64)
+        self._lo_list = self._lo.tolist()
+        self._hi_list = self._hi.tolist()
+        self._widths = np.array(PACKET_TOKEN_WIDTHS)
+        self.reset()
+
+    def reset(self):
+        self.packets_ok = 0
+        self.kinds = {kind: 0 for kind in ERROR_KINDS}
+        self.fields = {key: {LONGITUD: 0, NUMERICO: 0, RANGO: 0} for _, key, _ in PACKET_FIELDS}
+        self._reported_ok = 0
+        self._reported_kinds = dict(self.kinds)
+        self._reported_fields = {key: dict(c) for key, c in self.fields.items()}
+        self._last_report = time.monotonic()
+
+    @property
+    def rejected(self) -> int:
+        return sum(self.kinds.values())
+
+    def count(self, kind: str, n: int = 1):
+        """Suma n paquetes rechazados por 'kind' (p. ej. tramas con CRC inválido)."""
+        self.kinds[kind] += n
+
+    # --- Un paquete (modo por paquete) ---
+    def check_fields(self, parts: list, line: str = None):
+        """
+        Valida los 31 textos de un paquete. Devuelve (clasificación, valores):
+        valores es la lista de los campos numéricos como float (en el orden
+        de NUMERIC_KEYS) si el paquete es OK, o None si se rechazó.
+        Con 'line' (el texto completo) un paquete bien formado se revisa con
+        una sola expresión regular; token por token solo si algo falla.
+        """
+        if len(parts) != PACKET_FIELD_COUNT:
+            self.kinds[CAMPOS] += 1
+            return CAMPOS, None
+        if line is not None and _PACKET.fullmatch(line) is not None:
+            values = [float(parts[i]) for i in NUMERIC_INDEX]
+            if all(lo <= x <= hi for x, lo, hi in zip(values, self._lo_list, self._hi_list)):
+                self.packets_ok += 1
+                return OK, values
+
+        # Camino lento: se identifica qué campo falló y por qué
+        if not self.check_widths(parts):
+            return LONGITUD, None
+        values = []
+        kind = OK
+        for i, key, lo, hi in self._checks:
+            token = parts[i]
+            # float() desborda a inf con exponentes grandes ('1e400'): no es finito
+            value = float(token) if _NUMBER.fullmatch(token) is not None else math.nan
+            if not math.isfinite(value):
+                self.fields[key][NUMERICO] += 1
+                kind = NUMERICO
+                continue
+            if not lo <= value <= hi:
+                self.fields[key][RANGO] += 1
+                if kind == OK:
+                    kind = RANGO
+            values.append(value)
+        if kind != OK:
+            self.kinds[kind] += 1
+            return kind, None
+        self.packets_ok += 1
+        return OK, values
+
+    def check_widths(self, parts: list) -> bool:
+        """False (y cuenta LONGITUD por campo) si algún token excede su ancho."""
+        long_fields = [key for (_, key, _), token, width in zip(PACKET_FIELDS, parts, PACKET_TOKEN_WIDTHS)
+                       if len(token) > width]
+        if not long_fields:
+            return True
+        for key in long_fields:
+            self.fields[key][LONGITUD] += 1
+        self.kinds[LONGITUD] += 1
+        return False
+
+    # --- Bloques (modo por lotes y binario) ---
+    def check_lengths(self, lengths: np.ndarray) -> np.ndarray:
+        """
+        check_widths() para un bloque: 'lengths' es la matriz (n, 31) del
+        largo de cada token. Devuelve la máscara de renglones que caben.
+        """
+        too_long = lengths > self._widths
+        long_rows = too_long.any(axis=1)
+        if long_rows.any():
+            counts = too_long.sum(axis=0)
+            for j in np.flatnonzero(counts).tolist():
+                self.fields[PACKET_FIELDS[j][1]][LONGITUD] += int(counts[j])
+            self.kinds[LONGITUD] += int(np.count_nonzero(long_rows))
+        return ~long_rows
+
+    def check_matrix(self, values: np.ndarray) -> np.ndarray:
+        """
+        Valida un bloque ya convertido a números: matriz (n, len(NUMERIC_KEYS))
+        con NaN donde un token no era numérico. Devuelve la máscara de
+        renglones OK. Todo el bloque se revisa con operaciones vectorizadas.
+        """
+        nonfinite = ~np.isfinite(values)
+        # ±inf ya cuenta como numérico, no también como fuera de rango
+        out_of_range = ((values < self._lo) | (values > self._hi)) & ~nonfinite
+        numeric_rows = nonfinite.any(axis=1)
+        range_rows = out_of_range.any(axis=1) & ~numeric_rows
+        bad_rows = numeric_rows | range_rows
+        if bad_rows.any():
+            for counts, kind in ((nonfinite.sum(axis=0), NUMERICO), (out_of_range.sum(axis=0), RANGO)):
+                for j in np.flatnonzero(counts).tolist():
+                    self.fields[NUMERIC_KEYS[j]][kind] += int(counts[j])
+            self.kinds[NUMERICO] += int(np.count_nonzero(numeric_rows))
+            self.kinds[RANGO] += int(np.count_nonzero(range_rows))
+        ok = ~bad_rows
+        self.packets_ok += len(values) - int(np.count_nonzero(bad_rows))
+        return ok
+
+    def check_block(self, block: np.ndarray) -> np.ndarray:
+        """check_matrix() para un bloque PACKET_DTYPE (p. ej. del protocolo binario)."""
+        values = np.empty((len(block), len(NUMERIC_KEYS)), dtype=np.float64)
+        for j, key in enumerate(NUMERIC_KEYS):
+            values[:, j] = block[key]
+        return self.check_matrix(values)
+
+    # --- Reporte periódico ---
+    def report(self, now: float = None):
+        """
+        Resumen de los errores desde el reporte anterior si ya pasó el
+        intervalo y hubo errores; si no, None.
+        """
+        now = time.monotonic() if now is None else now
+        if now - self._last_report < self.interval:
+            return None
+        elapsed = now - self._last_report
+        self._last_report = now
+        kinds = {k: v - self._reported_kinds[k] for k, v in self.kinds.items() if v != self._reported_kinds[k]}
+        accepted = self.packets_ok - self._reported_ok
+        self._reported_ok = self.packets_ok
+        self._reported_kinds = dict(self.kinds)
+        if not kinds:
+            return None
+
+        fields = []
+        for key, counts in self.fields.items():
+            previous = self._reported_fields[key]
+            for kind, value in counts.items():
+                if value != previous[kind]:
+                    fields.append((value - previous[kind], key, kind))
+        self._reported_fields = {key: dict(c) for key, c in self.fields.items()}
+        fields.sort(reverse=True)
+
+        rejected = sum(kinds.values())
+        text = f"Validación ({elapsed:.0f} s): {rejected} rechazados, {accepted} OK ("
+        text += ", ".join(f"{kind}={count}" for kind, count in kinds.items()) + ")"
+        if fields:
+            text += " | " + ", ".join(f"{key}({kind}) x{count}" for count, key, kind in fields[:6])
+        return text
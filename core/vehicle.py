@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# core/vehicle.py
+
+import re
+import unicodedata
+
+from PySide6.QtCore import QMetaObject, QObject, Qt, QThread, Signal, Slot
+
+from core.serial_worker import SerialWorker
+from core.snapshot import TelemetrySnapshot
+
+
+def log_name(name: str) -> str:
+    """Nombre apto para archivos: 'Carga útil' -> 'carga_util'."""
+    text = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii')
+    return re.sub(r'[^a-z0-9]+', '_', text.lower()).strip('_')
+
+
+class VehicleLink(QObject):
+    """
+    Un vehículo (booster, carga útil...) con su propio enlace.
+
+    Cada vehículo tiene su SerialWorker en su propio QThread, su snapshot,
+    su historial, sus logs (log_vuelo_<nombre>_*.csv) y su estadística de
+    pérdida, más un receptor de diversidad opcional en otro hilo. Nada se
+    comparte entre vehículos: un segundo enlace no agrega trabajo al hilo
+    del primero.
+
+    El objeto vive en el hilo de la GUI. Las peticiones de la ventana se
+    emiten por sus señales (conexiones en cola hacia el worker) y los
+    avisos del worker se reenvían con el vehículo como primer argumento.
+    """
+
+    # GUI -> worker
+    conexion_solicitada = Signal(str, int)
+    conexion_diversidad_solicitada = Signal(str, int)
+    diversidad_solicitada = Signal(bool)
+    desconexion_solicitada = Signal()
+    comando_solicitado = Signal(str)
+    reproduccion_solicitada = Signal(str, float)
+    detener_reproduccion_solicitada = Signal()
+
+    # Worker -> GUI (con el vehículo de origen)
+    status_update = Signal(object, str, str)
+    receiver_status = Signal(object, str, str)
+    snapshot_updated = Signal(object)
+    flight_event = Signal(object, object)
+
+    def __init__(self, name: str, latency=None, parent=None):
+        super().__init__(parent)
+        self.name = name
+        self.latency = latency
+        self.snapshot = TelemetrySnapshot()
+
+        self.thread = QThread()
+        self.worker = SerialWorker(latency=latency, snapshot=self.snapshot)
+        self.worker.log_name = log_name(name)
+        self.worker.moveToThread(self.thread)
+        # Receptor de diversidad (segundo radio). Solo se combina con el
+        # worker (merger y block_received) cuando se conecta un segundo puerto
+        self.receiver_thread = QThread()
+        self.receiver = SerialWorker(keep_history=False, forward_only=True)
+        self.receiver.moveToThread(self.receiver_thread)
+        self.diversity = False
+
+        # Estado de la conexión para la barra de herramientas
+        self.connected = False   # Conexión pedida (hasta desconectar)
+        self.online = False      # El puerto confirmó la conexión
+        self.flight_timer = False  # Ya se envió "Comenzar Tiempo de Vuelo"
+        self.port = ""
+        self.port_2 = ""
+        self.baud = ""
+        # Eventos del vuelo en curso (para reconstruir la lista al cambiar de vehículo)
+        self.events = []
+
+        self.conexion_solicitada.connect(self.worker.start_connection)
+        self.conexion_diversidad_solicitada.connect(self.receiver.start_connection)
+        self.diversidad_solicitada.connect(self.worker.set_diversity)
+        self.desconexion_solicitada.connect(self.worker.stop_connection)
+        self.desconexion_solicitada.connect(self.receiver.stop_connection)
+        self.comando_solicitado.connect(self.worker.send_command_sequence)
+        self.reproduccion_solicitada.connect(self.worker.start_replay)
+        self.detener_reproduccion_solicitada.connect(self.worker.stop_replay)
+
+        self.worker.status_update.connect(self.on_status)
+        self.worker.snapshot_updated.connect(self.on_snapshot_updated)
+        self.worker.flight_event.connect(self.on_flight_event)
+        self.receiver.status_update.connect(self.on_receiver_status)
+
+        self.thread.started.connect(self.worker.init_worker)
+        self.receiver_thread.started.connect(self.receiver.init_worker)
+        self.thread.finished.connect(self.worker.deleteLater)
+        self.thread.finished.connect(self.thread.deleteLater)
+        self.receiver_thread.finished.connect(self.receiver.deleteLater)
+        self.receiver_thread.finished.connect(self.receiver_thread.deleteLater)
+
+    def start(self):
+        self.thread.start()
+        self.receiver_thread.start()
+
+    def request_connection(self):
+        """Conecta self.port (y self.port_2 si se eligió uno) a self.baud."""
+        diversity = bool(self.port_2)
+        if diversity != self.diversity:
+            if diversity:
+                self.receiver.block_received.connect(self.worker.on_receiver_block)
+            else:
+                self.receiver.block_received.disconnect(self.worker.on_receiver_block)
+            self.diversity = diversity
+        # En cola, en orden: el merger existe (o no) antes de abrir el puerto
+        self.diversidad_solicitada.emit(diversity)
+        self.conexion_solicitada.emit(self.port, int(self.baud))
+        if diversity:
+            self.conexion_diversidad_solicitada.emit(self.port_2, int(self.baud))
+
+    def stop(self):
+        """Cierra puertos y logs en el hilo de cada worker y termina los hilos."""
+        for worker, thread in ((self.receiver, self.receiver_thread), (self.worker, self.thread)):
+            if thread.isRunning():
+                QMetaObject.invokeMethod(worker, "stop_connection", Qt.ConnectionType.BlockingQueuedConnection)
+                QMetaObject.invokeMethod(worker, "stop_monitoring", Qt.ConnectionType.BlockingQueuedConnection)
+                thread.quit()
+                thread.wait()
+
+    # --- Avisos del worker (llegan en cola al hilo de la GUI) ---
+    @Slot(str, str)
+    def on_status(self, message: str, status_type: str):
+        self.status_update.emit(self, message, status_type)
+
+    @Slot(str, str)
+    def on_receiver_status(self, message: str, status_type: str):
+        self.receiver_status.emit(self, message, status_type)
+
+    @Slot()
+    def on_snapshot_updated(self):
+        self.snapshot_updated.emit(self)
+
+    @Slot(object)
+    def on_flight_event(self, event):
+        if event.name == "DESPEGUE":
+            self.events = []
+        self.events.append(event)
+        self.flight_event.emit(self, event)
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# headless.py
+
+"""
+Estación terrena sin interfaz gráfica.
+
+Corre solo el SerialWorker bajo un QCoreApplication (sin Qt3D, QtWebEngine
+ni pyqtgraph): registra el log de vuelo e imprime el estado en la consola.
+Pensado para la laptop de respaldo y para pruebas de larga duración.
+
+Ejemplos:
+    python headless.py --list-ports
+    python headless.py --port ttyUSB0 --baud 115200 --log-dir logs
+    python headless.py --port ttyUSB0 --command 66 --command 30 --reconnect 2
+    python headless.py --replay log_vuelo_20250101_120000.csv --speed 0
+    python headless.py --port ttyACM0 --duration 14400 --stats-interval 60
+    python headless.py --port ttyUSB0 --diversidad ttyUSB1 --diversidad ttyUSB2
+    python headless.py --port ttyUSB0 --vehiculo Booster & python headless.py --port ttyUSB1 --vehiculo "Carga útil"
+"""
+
+import argparse
+import os
+import signal
+import sys
+import time
+from datetime import datetime
+
+from PySide6.QtCore import Q_ARG, QCoreApplication, QMetaObject, Qt, QThread, QTimer
+from PySide6.QtSerialPort import QSerialPortInfo
+
+from core.latency import LatencyTracker
+from core.serial_worker import SerialWorker
+from core.vehicle import log_name
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def memory_mb() -> float:
+    """Memoria residente máxima del proceso (MB), si el sistema la reporta."""
+    if resource is None:
+        return float('nan')
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024.0 * 1024.0) if sys.platform == "darwin" else rss / 1024.0
+
+
+class HeadlessStation:
+    """Conecta el SerialWorker a la consola: estado, estadísticas, comandos y reconexión."""
+
+    def __init__(self, app: QCoreApplication, worker: SerialWorker, args):
+        self.app = app
+        self.worker = worker
+        self.args = args
+        self.commands = list(args.command or [])
+        self.exit_code = 0
+        self.start_time = time.monotonic()
+        self._last_stats_time = self.start_time
+        self._last_stats_count = 0
+
+        worker.status_update.connect(self.on_status)
+
+        self.stats_timer = QTimer()
+        self.stats_timer.timeout.connect(self.print_stats)
+        self.command_timer = QTimer()
+        self.command_timer.timeout.connect(self.send_next_command)
+        self.reconnect_timer = QTimer()
+        self.reconnect_timer.timeout.connect(self.check_connection)
+
+        # Receptores de diversidad: cada uno en su hilo, combinados por el worker
+        self.receivers = []  # (puerto, SerialWorker, QThread)
+        for port in args.diversidad or []:
+            receiver = SerialWorker(protocol=args.protocol, keep_history=False, forward_only=True)
+            thread = QThread()
+            receiver.moveToThread(thread)
+            thread.started.connect(receiver.init_worker)
+            receiver.status_update.connect(self.on_status)
+            worker.attach_receiver(receiver)
+            thread.start()
+            self.receivers.append((port, receiver, thread))
+
+    def log(self, text: str):
+        print(f"[{datetime.now().strftime('%H:%M:%S')}] {text}", flush=True)
+
+    def on_status(self, message: str, level: str):
+        self.log(f"{level.upper()}: {message}")
+
+    def start(self):
+        args = self.args
+        if args.stats_interval > 0:
+            self.stats_timer.start(int(args.stats_interval * 1000))
+        if args.duration > 0:
+            QTimer.singleShot(int(args.duration * 1000), self.app.quit)
+
+        if args.replay:
+            self.worker.start_replay(args.replay, args.speed)
+            if self.worker.replay is None:
+                self.exit_code = 1
+                QTimer.singleShot(0, self.app.quit)
+            elif args.duration <= 0:
+                self.worker.replay.finished.connect(self.app.quit)
+            return
+
+        self.worker.start_connection(args.port, args.baud)
+        for port, receiver, _ in self.receivers:
+            self.connect_receiver(receiver, port)
+        if not self.worker.serial_port.isOpen() and args.reconnect <= 0:
+            self.exit_code = 1
+            QTimer.singleShot(0, self.app.quit)
+            return
+        if args.reconnect > 0:
+            self.reconnect_timer.start(int(args.reconnect * 1000))
+        if self.commands:
+            self.command_timer.start(int(args.command_interval * 1000))
+
+    def connect_receiver(self, receiver: SerialWorker, port: str):
+        # El receptor vive en otro hilo: la llamada se encola en su event loop
+        QMetaObject.invokeMethod(receiver, "start_connection", Qt.ConnectionType.QueuedConnection,
+                                 Q_ARG(str, port), Q_ARG(int, self.args.baud))
+
+    def check_connection(self):
+        if not self.worker.serial_port.isOpen():
+            self.log(f"Reintentando conexión a {self.args.port}...")
+            self.worker.start_connection(self.args.port, self.args.baud)
+        for port, receiver, _ in self.receivers:
+            if receiver.serial_port is not None and not receiver.serial_port.isOpen():
+                self.log(f"Reintentando conexión a {port}...")
+                self.connect_receiver(receiver, port)
+
+    def send_next_command(self):
+        if not self.commands:
+            self.command_timer.stop()
+            return
+        if not self.worker.serial_port.isOpen():
+            return  # Se reintenta en el siguiente intervalo
+        self.worker.send_command_sequence(f"{self.commands.pop(0)}\n")
+
+    def print_stats(self):
+        now = time.monotonic()
+        count = self.worker.gs_packet_count
+        # El contador se reinicia con cada conexión
+        delta = count - self._last_stats_count if count >= self._last_stats_count else count
+        rate = delta / (now - self._last_stats_time) if now > self._last_stats_time else 0.0
+        self._last_stats_time = now
+        self._last_stats_count = count
+
+        text = (f"paquetes={count} ({rate:.1f}/s) perdidos={self.worker.lost_packets} "
+                f"tramas_descartadas={self.worker.discarded_frames} "
+                f"rechazados={self.worker.validator.rejected} "
+                f"rx_buffer={self.worker.rx_buffer.buffered}B mem={memory_mb():.1f}MB")
+        if self.worker.merger is not None:
+            for name, stats in self.worker.merger.stats().items():
+                text += f" {name or self.args.port}[perdida={stats['perdida_pct']:.1f}%"
+                if 'primeros' in stats:
+                    text += f" primeros={stats['primeros']} repetidos={stats['repetidos']}"
+                text += "]"
+        for name, writer in (("csv", self.worker.csv_writer), ("clog", self.worker.column_writer)):
+            if writer:
+                stats = writer.stats()
+                text += (f" {name}[cola={stats['queue_depth']} escritos={stats['rows_written']}"
+                         f" descartados={stats['dropped_rows']} max={stats['max_write_ms']:.1f}ms]")
+        self.log(text)
+        if self.worker.latency:
+            print(self.worker.latency.format_report(), flush=True)
+
+    def shutdown(self):
+        self.stats_timer.stop()
+        self.command_timer.stop()
+        self.reconnect_timer.stop()
+        self.print_stats()
+        self.worker.stop_replay()
+        self.worker.stop_connection()
+        self.worker.stop_monitoring()
+        for _, receiver, thread in self.receivers:
+            QMetaObject.invokeMethod(receiver, "stop_connection", Qt.ConnectionType.BlockingQueuedConnection)
+            thread.quit()
+            thread.wait()
+        self.log(f"Fin. Duración {time.monotonic() - self.start_time:.1f} s")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Estación terrena CENTINELA sin interfaz gráfica")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--port', help="Puerto serial (ej. ttyUSB0, COM3)")
+    source.add_argument('--replay', help="Reproducir un log_vuelo_*.csv en lugar del puerto")
+    source.add_argument('--list-ports', action='store_true', help="Listar puertos y salir")
+
+    parser.add_argument('--baud', type=int, default=115200)
+    parser.add_argument('--speed', type=float, default=1.0, help="Velocidad de reproducción (0 = máxima)")
+    parser.add_argument('--protocol', choices=['auto', 'texto', 'binario'], default='auto')
+    parser.add_argument('--per-packet', action='store_true', help="Procesar paquete por paquete (sin lotes)")
+    parser.add_argument('--diversidad', action='append', metavar='PUERTO',
+                        help="Receptor adicional del mismo vehículo (repetible); se combinan sin duplicados")
+
+    parser.add_argument('--log-dir', default="", help="Carpeta para los logs de vuelo")
+    parser.add_argument('--vehiculo', default="", help="Nombre del vehículo en los logs (varios enlaces a la vez)")
+    parser.add_argument('--no-clog', action='store_true', help="No escribir el log binario por columnas")
+    parser.add_argument('--flush-interval', type=float, default=1.0)
+    parser.add_argument('--fsync-interval', type=float, default=10.0)
+
+    parser.add_argument('--command', action='append', help="Comando a enviar tras conectar (repetible)")
+    parser.add_argument('--command-interval', type=float, default=1.0, help="Segundos entre comandos")
+    parser.add_argument('--reconnect', type=float, default=0.0,
+                        help="Reintentar la conexión cada N segundos si se pierde (0 = no)")
+    parser.add_argument('--duration', type=float, default=0.0, help="Terminar tras N segundos (0 = sin límite)")
+    parser.add_argument('--latency', action='store_true', help="Reportar latencias recepción -> emisión")
+    parser.add_argument('--stats-interval', type=float, default=10.0, help="Segundos entre reportes (0 = nunca)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    app = QCoreApplication(sys.argv[:1])
+
+    if args.list_ports:
+        for port in QSerialPortInfo.availablePorts():
+            print(f"{port.portName()}\t{port.description()}")
+        return 0
+
+    if args.log_dir:
+        os.makedirs(args.log_dir, exist_ok=True)
+
+    # Sin GUI el worker vive en el hilo principal: no hay nada que bloquee su event loop
+    # Sin gráficas no hace falta guardar el historial de la misión en memoria
+    worker = SerialWorker(batch_mode=not args.per_packet, protocol=args.protocol,
+                          keep_history=False,
+                          latency=LatencyTracker() if args.latency else None)
+    worker.log_dir = args.log_dir
+    worker.log_name = log_name(args.vehiculo)
+    worker.columnar_log = not args.no_clog
+    worker.log_flush_interval = args.flush_interval
+    worker.log_fsync_interval = args.fsync_interval
+    worker.init_worker()
+
+    station = HeadlessStation(app, worker, args)
+    app.aboutToQuit.connect(station.shutdown)
+
+    # Ctrl+C / SIGTERM cierran limpio (los logs se vacían y sincronizan)
+    signal.signal(signal.SIGINT, lambda *_: app.quit())
+    signal.signal(signal.SIGTERM, lambda *_: app.quit())
+    # El intérprete solo atiende señales cuando recupera el control
+    signal_timer = QTimer()
+    signal_timer.timeout.connect(lambda: None)
+    signal_timer.start(200)
+
+    QTimer.singleShot(0, station.start)
+    app.exec()
+    return station.exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,26 +1,61 @@
 # main.py
 
+import argparse
 import os
 import sys
 
-from PySide6.QtCore import QThread
 from PySide6.QtGui import QFont, QFontDatabase
 from PySide6.QtWidgets import QApplication
 
-from core.serial_worker import SerialWorker
-from ui.main_window import GroundStation
+from core.latency import LatencyTracker
+from core.tile_cache import TileCache
+from core.vehicle import VehicleLink, log_name
+
+
+def parse_args(argv=None):
+    """Opciones propias; lo demás (opciones de Qt como -platform) pasa a QApplication."""
+    parser = argparse.ArgumentParser(description="Estación terrena CENTINELA")
+    parser.add_argument('--vehiculo', action='append', metavar='NOMBRE',
+                        help="Un enlace (puerto, hilo y logs propios) por vehículo en vuelo; "
+                             "repetible, ej. --vehiculo Booster --vehiculo 'Carga útil'. "
+                             "Por omisión un solo enlace")
+    args, qt_args = parser.parse_known_args(argv)
+    names = args.vehiculo or [""]
+    # El nombre va en los logs (log_vuelo_<nombre>_*.csv): no pueden chocar
+    if len({log_name(name) for name in names}) != len(names):
+        parser.error("los nombres de --vehiculo deben ser distintos")
+    args.vehiculo = names
+    return args, qt_args
+
+
+def setup_tile_cache(app):
+    """Teselas del mapa desde la caché en disco (funciona sin internet)."""
+    from ui.tile_scheme import TileSchemeHandler
+    try:
+        cache = TileCache()
+        handler = TileSchemeHandler(cache, parent=app)
+        handler.install()
+        app.aboutToQuit.connect(cache.close)  # Confirma las teselas pendientes
+    except Exception as e:
+        print(f"Aviso: caché de teselas no disponible ({e}). El mapa usará internet.")
 
-# Importamos los módulos de Interfaz (Vista) y Lógica (Modelo)
-from ui.theme import PALETTE, get_stylesheet, set_dark_palette
 
-os.environ["QT_QPA_PLATFORM"] = "xcb"
-os.environ["QT_XCB_GL_INTEGRATION"] = "xcb_glx"
-os.environ["QTWEBENGINE_DISABLE_SANDBOX"] = "1"
+def main():
+    args, qt_args = parse_args(sys.argv[1:])
 
+    os.environ["QT_QPA_PLATFORM"] = "xcb"
+    os.environ["QT_XCB_GL_INTEGRATION"] = "xcb_glx"
+    os.environ["QTWEBENGINE_DISABLE_SANDBOX"] = "1"
 
-def main():
-    # 1. Iniciar la Aplicación
-    app = QApplication(sys.argv)
+    # Importamos los módulos de Interfaz (Vista) hasta aquí: cargan QtWebEngine,
+    # que parse_args y --help no necesitan
+    from ui.main_window import GroundStation
+    from ui.theme import get_stylesheet, set_dark_palette
+    from ui.tile_scheme import register_tile_scheme
+
+    # 1. Iniciar la Aplicación (el esquema de teselas se registra antes)
+    register_tile_scheme()
+    app = QApplication(sys.argv[:1] + qt_args)
 
     # --- Configuración Visual (Tema y Fuente) ---
     app.setStyle("Fusion")
@@ -40,126 +75,27 @@ def main():
     app.setStyleSheet(get_stylesheet(family_name))
 
     # --- 2. Crear los Objetos Principales ---
-    window = GroundStation()  # La Ventana (GUI)
-    serial_thread = QThread()  # El Hilo Secundario
-    serial_worker = SerialWorker()  # El Trabajador (Lógica)
-
-    # Mover la lógica al hilo secundario
-    serial_worker.moveToThread(serial_thread)
-
-    # --- 3. Conectar Señales (Lógica -> GUI) ---
-    # Estas conexiones permiten que el worker actualice la interfaz
-
-    # Estado y Conexión
-    serial_worker.port_list_updated.connect(window.update_port_list)
-    serial_worker.status_update.connect(window.on_connection_status)
-
-    # Datos de Telemetría
-    serial_worker.cinematica_updated.connect(window.on_cinematica_updated)
-    serial_worker.visor_3d_updated.connect(window.on_visor_3d_updated)
-    serial_worker.gps_data_updated.connect(window.on_gps_data_updated)
-    serial_worker.altimetro_data_updated.connect(window.on_altimetro_data_updated)
-    serial_worker.graficas_data_updated.connect(window.on_graficas_data_updated)
-    serial_worker.calidad_aire_updated.connect(window.on_calidad_aire_updated)
-    serial_worker.baterias_data_updated.connect(window.on_baterias_data_updated)
-    serial_worker.paquetes_data_updated.connect(window.on_paquetes_data_updated)
-    serial_worker.estados_data_updated.connect(window.on_estados_data_updated)
-
-    # --- 4. Conectar Señales (GUI -> Lógica) ---
-    # Estas conexiones permiten que los botones controlen al worker
-
-    window.actualizar_puertos_solicitado.connect(serial_worker.check_available_ports)
-    window.conexion_solicitada.connect(serial_worker.start_connection)
-    window.desconexion_solicitada.connect(serial_worker.stop_connection)
-    window.comando_solicitado.connect(serial_worker.send_command_sequence)
-
-    # --- 5. Gestión del Hilo ---
-
-    # Iniciar el worker cuando el hilo arranque
-    serial_thread.started.connect(serial_worker.init_worker)
-
-    # Limpieza correcta al cerrar la app
-    app.aboutToQuit.connect(serial_worker.stop_monitoring)
-    app.aboutToQuit.connect(serial_thread.quit)
-    serial_thread.finished.connect(serial_worker.deleteLater)
-    serial_thread.finished.connect(serial_thread.deleteLater)
-
-    # Arrancar el hilo
-    serial_thread.start()
-
-    # --- 6. Ejecutar ---
-    window.show()
-    sys.exit(app.exec())
-
-
-if __name__ == "__main__":
-    main()  # main.py
-
-import sys
-
-from PySide6.QtCore import QThread
-from PySide6.QtGui import QFont, QFontDatabase
-from PySide6.QtWidgets import QApplication
-
-from core.serial_worker import SerialWorker
-from ui.main_window import GroundStation
-from ui.theme import PALETTE, get_stylesheet, set_dark_palette
-
-
-def main():
-    app = QApplication(sys.argv)
-
-    # (Configuración de tema/fuente igual que antes...)
-    app.setStyle("Fusion")
-    font_id = QFontDatabase.addApplicationFont("Gotham-Book.otf")
-    if font_id == -1:
-        family_name = "sans-serif"
-    else:
-        family_name = QFontDatabase.applicationFontFamilies(font_id)[0]
-        app.setFont(QFont(family_name, 10))
-    stylesheet = get_stylesheet(family_name)
-    set_dark_palette(app)
-    app.setStyleSheet(stylesheet)
-
-    window = GroundStation()
-
-    serial_thread = QThread()
-    serial_worker = SerialWorker()
-    serial_worker.moveToThread(serial_thread)
-
-    # --- Conexiones Lógica -> GUI ---
-    serial_worker.port_list_updated.connect(window.update_port_list)
-    serial_worker.status_update.connect(window.on_connection_status)
-
-    serial_worker.cinematica_updated.connect(window.on_cinematica_updated)
-    serial_worker.visor_3d_updated.connect(window.on_visor_3d_updated)
-    serial_worker.gps_data_updated.connect(window.on_gps_data_updated)
-    serial_worker.altimetro_data_updated.connect(window.on_altimetro_data_updated)
-    serial_worker.graficas_data_updated.connect(window.on_graficas_data_updated)
-    serial_worker.calidad_aire_updated.connect(window.on_calidad_aire_updated)
-    serial_worker.baterias_data_updated.connect(window.on_baterias_data_updated)
-    serial_worker.paquetes_data_updated.connect(window.on_paquetes_data_updated)
-    serial_worker.estados_data_updated.connect(window.on_estados_data_updated)
-
-    # --- Conexiones GUI -> Lógica ---
-    window.actualizar_puertos_solicitado.connect(serial_worker.check_available_ports)
-    window.conexion_solicitada.connect(serial_worker.start_connection)
-    window.desconexion_solicitada.connect(serial_worker.stop_connection)
-
-    # --- ¡NUEVA CONEXIÓN! ---
-    # Conecta el comando de la UI al envío en el worker
-    window.comando_solicitado.connect(serial_worker.send_command_sequence)
-    # ------------------------
-
-    serial_thread.started.connect(serial_worker.init_worker)
-
-    app.aboutToQuit.connect(serial_worker.stop_monitoring)
-    app.aboutToQuit.connect(serial_thread.quit)
-    serial_thread.finished.connect(serial_worker.deleteLater)
-    serial_thread.finished.connect(serial_thread.deleteLater)
-
-    serial_thread.start()
-
+    setup_tile_cache(app)
+    latency = LatencyTracker()  # Latencias por etapa (F12 en la ventana)
+    # Un VehicleLink por vehículo: su Trabajador (Lógica) en su propio Hilo
+    # Secundario, con su snapshot (último dato de cada grupo, Lógica -> GUI)
+    vehicles = [VehicleLink(name, latency if i == 0 else None) for i, name in enumerate(args.vehiculo)]
+    window = GroundStation(vehicles)  # La Ventana (GUI)
+
+    # --- 3. Conectar Señales ---
+    # Estado, datos y eventos de cada vehículo los conecta la ventana;
+    # la lista de puertos es la misma para todos (la da el primer worker)
+    vehicles[0].worker.port_list_updated.connect(window.update_port_list)
+    window.actualizar_puertos_solicitado.connect(vehicles[0].worker.check_available_ports)
+
+    # --- 4. Gestión de los Hilos ---
+    for vehicle in vehicles:
+        # Limpieza correcta al cerrar la app (cierra puertos y logs, espera al hilo)
+        app.aboutToQuit.connect(vehicle.stop)
+        # Arrancar los hilos
+        vehicle.start()
+
+    # --- 5. Ejecutar ---
     window.show()
     sys.exit(app.exec())
 
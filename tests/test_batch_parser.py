@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# tests/test_batch_parser.py
+
+import numpy as np
+
+from core.batch_parser import parse_block
+from core.packet_schema import PACKET_FIELD_COUNT, TEXT_WIDTH
+from core.serial_worker import SerialWorker
+from core.validation import CAMPOS, LONGITUD, NUMERICO, OK, PacketValidator
+
+PAQUETE = ("0.1,0.2,9.8,0,0,0,10,19.4284123,-99.1276456,148.3,12:00:00,95,80,"
+           "100,5,7,25,101.3,100,120,400,40,1,0,1,0,1,1,1,0,0")
+
+
+def paquete(**cambios) -> bytes:
+    """PAQUETE con algunos campos reemplazados por índice (c<índice>=texto)."""
+    partes = PAQUETE.split(',')
+    for llave, valor in cambios.items():
+        partes[int(llave[1:])] = valor
+    return ','.join(partes).encode()
+
+
+def test_bloque_valido():
+    block, lines, discarded = parse_block([paquete(c15=str(i)) for i in range(1, 6)])
+    assert discarded == 0
+    assert len(lines) == 5
+    assert block['no_paquete_enviado'].tolist() == [1, 2, 3, 4, 5]
+    assert block['lat'][0] == 19.4284123
+    assert block['hora_gps'][0] == b"12:00:00"
+    assert block['led_lanz'][0] and not block['led_p1'][0]
+
+
+def test_bloque_vacio():
+    block, lines, discarded = parse_block([])
+    assert len(block) == 0 and lines == [] and discarded == 0
+
+
+def test_descarta_campos_y_numeros_invalidos():
+    validator = PacketValidator()
+    lines = [paquete(), b"1,2,3", paquete(c0="abc"), paquete(c15="2")]
+    block, good, discarded = parse_block(lines, validator)
+    assert discarded == 2
+    assert good == [lines[0], lines[3]]
+    assert validator.kinds[CAMPOS] == 1
+    assert validator.kinds[NUMERICO] == 1
+    assert validator.fields['ax'][NUMERICO] == 1
+
+
+def test_token_largo_se_rechaza_no_se_recorta():
+    # Recortado a 32 bytes este token se vería como un número válido
+    largo = "7" + "0" * 40 + "x"
+    validator = PacketValidator()
+    lines = [paquete(c15=largo), paquete(c10="12:00:00" + "Z" * TEXT_WIDTH), paquete()]
+    block, good, discarded = parse_block(lines, validator)
+    assert len(block) == 1 and good == [lines[2]]
+    assert discarded == 2
+    assert validator.kinds[LONGITUD] == 2
+    assert validator.fields['no_paquete_enviado'][LONGITUD] == 1
+    assert validator.fields['hora_gps'][LONGITUD] == 1
+
+
+def test_misma_clasificacion_que_por_paquete():
+    lines = [paquete(), b"1,2", paquete(c1="x"), paquete(c15="9" * 40), paquete(c7="95")]
+    por_bloque = PacketValidator()
+    parse_block(lines, por_bloque)
+    por_paquete = PacketValidator()
+    kinds = []
+    for line in lines:
+        text = line.decode()
+        kinds.append(por_paquete.check_fields(text.split(','), text)[0])
+    assert kinds[0] == OK
+    assert por_bloque.kinds == por_paquete.kinds
+    assert por_bloque.fields == por_paquete.fields
+
+
+def test_columnas_enteras_redondeadas():
+    block, _, _ = parse_block([paquete(c11="94.6", c28="2.4")])
+    assert block['bat_control'][0] == 95
+    assert block['etapa_id'][0] == 2
+    assert len(block.dtype.names) == PACKET_FIELD_COUNT
+    assert np.issubdtype(block['bat_control'].dtype, np.integer)
+
+
+def test_lotes_solo_con_suficientes_lineas(monkeypatch):
+    worker = SerialWorker(keep_history=False)
+    calls = []
+    monkeypatch.setattr(worker, 'process_chunk', lambda lines: calls.append(('lotes', len(lines))))
+    monkeypatch.setattr(worker, 'process_packet', lambda text: calls.append(('paquete', 1)))
+    few = [paquete(c15=str(i)) for i in range(SerialWorker.BATCH_MIN_LINES - 1)]
+    worker.feed_lines(few)
+    assert calls == [('paquete', 1)] * len(few)
+    calls.clear()
+    worker.feed_lines(few + [paquete()])
+    assert calls == [('lotes', SerialWorker.BATCH_MIN_LINES)]
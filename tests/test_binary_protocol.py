@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# tests/test_binary_protocol.py
+
+import numpy as np
+
+from core.batch_parser import parse_block
+from core.binary_protocol import (
+    FRAME_DELIMITER, FRAME_SIZE, cobs_decode, cobs_encode, crc16, decode_frames, encode_packet,
+)
+from core.packet_schema import PACKET_FIELDS, format_block
+
+DATOS = {
+    'ax': 0.25, 'ay': -0.5, 'az': 9.75, 'pitch': 1.5, 'roll': -2.0, 'yaw': 30.0, 'compass': 181.5,
+    'lat': 19.4284123, 'lon': -99.1276456, 'alt_gps': 2240.5, 'hora_gps': "12:34:56",
+    'bat_control': 95, 'bat_camara': 80, 't_encendido': 100.5, 't_mision': 12345.25,
+    'no_paquete_enviado': 70000, 'temp': 25.5, 'pres': 101.25, 'alt_baro': 2238.75,
+    'tvoc': 120.0, 'co2': 400.0, 'hum': 40.5,
+    'led_lanz': True, 'led_p1': False, 'led_p2': True, 'led_p3': False, 'led_cam': True, 'led_sd': True,
+    'etapa_id': 2, 'error': 513, 'comando': 66,
+}
+
+
+def frames_of(stream: bytes) -> list:
+    """Parte un flujo en tramas (sin el delimitador final)."""
+    return stream.split(FRAME_DELIMITER)[:-1]
+
+
+def test_crc16_ccitt_false():
+    # Valor de referencia de CRC-16/CCITT-FALSE
+    assert crc16(b"123456789") == 0x29B1
+
+
+def test_cobs_ida_y_vuelta():
+    rng = np.random.default_rng(1)
+    casos = [b"", b"\x00", b"\x00\x00", b"abc", bytes(300), bytes(range(256)) * 2,
+             rng.integers(0, 256, 1000, dtype=np.uint8).tobytes()]
+    for data in casos:
+        encoded = cobs_encode(data)
+        assert b"\x00" not in encoded
+        assert cobs_decode(encoded) == data
+
+
+def test_cobs_invalida():
+    assert cobs_decode(b"\x05ab") is None
+    assert cobs_decode(b"\x02a\x00") is None
+
+
+def test_trama_ida_y_vuelta():
+    stream = encode_packet(DATOS)
+    assert stream.endswith(FRAME_DELIMITER) and stream.count(FRAME_DELIMITER) == 1
+    block, discarded = decode_frames(frames_of(stream))
+    assert discarded == 0 and len(block) == 1
+    row = block[0]
+    for key, value in DATOS.items():
+        if key == 'hora_gps':
+            assert row[key] == value.encode()
+        else:
+            assert row[key] == value, key
+
+
+def test_descarta_crc_version_y_tamano():
+    buena = frames_of(encode_packet(DATOS))[0]
+    payload = bytearray(cobs_decode(buena))
+    assert len(payload) == FRAME_SIZE
+    crc_malo = bytearray(payload); crc_malo[5] ^= 0x01
+    version_mala = bytearray(payload); version_mala[0] = 0x00
+    frames = [cobs_encode(bytes(crc_malo)), cobs_encode(bytes(version_mala)),
+              cobs_encode(bytes(payload[:-3])), b"", buena]
+    block, discarded = decode_frames(frames)
+    assert len(block) == 1
+    assert discarded == 3
+
+
+def test_format_block_no_pierde_precision():
+    block, _ = decode_frames(frames_of(encode_packet(DATOS)))
+    lines = format_block(block)
+    parsed, _, discarded = parse_block(lines)
+    assert discarded == 0
+    for _, key, _ in PACKET_FIELDS:
+        assert parsed[key][0] == block[key][0], key
+    assert b"19.4284123" in lines[0] and b"-99.1276456" in lines[0]
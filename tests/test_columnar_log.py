@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# tests/test_columnar_log.py
+
+import os
+
+import numpy as np
+import pytest
+
+from core.columnar_log import INDEX_DTYPE, ColumnarLogReader, ColumnarLogWriter
+from core.packet_schema import PACKET_DTYPE
+
+CHUNK = 16
+
+
+def bloque(first: int, n: int) -> np.ndarray:
+    block = np.zeros(n, dtype=PACKET_DTYPE)
+    seq = np.arange(first, first + n)
+    block['no_paquete_enviado'] = seq
+    block['t_mision'] = seq * 0.05
+    block['alt_baro'] = 100.0 + seq
+    block['hora_gps'] = b"12:00:00"
+    return block
+
+
+def escribir(path, sizes) -> int:
+    """Escribe bloques consecutivos de los tamaños dados; devuelve el total."""
+    writer = ColumnarLogWriter(str(path), chunk_rows=CHUNK, flush_interval=0.05)
+    total = 0
+    for n in sizes:
+        writer.write_block(bloque(total + 1, n), total + 1, np.full(n, 2.5))
+        total += n
+    writer.close()
+    assert writer.stats()['error'] is None
+    return total
+
+
+def test_ida_y_vuelta(tmp_path):
+    path = tmp_path / "log.clog"
+    total = escribir(path, [5, 40, 1, 30])
+    reader = ColumnarLogReader(str(path))
+    assert len(reader) == total
+    assert reader.column('No_Paquete_Enviado').tolist() == list(range(1, total + 1))
+    assert reader.column('Contador_Paquetes_GS', 10, 20).tolist() == list(range(11, 21))
+    assert np.allclose(reader.column('Velocidad_Calculada_Z'), 2.5)
+    assert reader.column('Hora_GPS', 0, 1)[0] == b"12:00:00"
+    assert len(reader.index) == -(-total // CHUNK)
+
+
+def test_busqueda_por_tiempo_y_paquete(tmp_path):
+    path = tmp_path / "log.clog"
+    escribir(path, [70])
+    reader = ColumnarLogReader(str(path))
+    start, stop = reader.rows_for_time(1.0, 2.0)
+    t = reader.column('Tiempo_Mision', start, stop)
+    assert t.min() >= 1.0 and t.max() <= 2.0
+    assert stop - start == 21
+    assert reader.find_packet(33) == 32
+    assert reader.find_packet(999) == -1
+
+
+def test_archivo_cortado_se_recupera(tmp_path):
+    path = tmp_path / "log.clog"
+    escribir(path, [CHUNK * 3])
+    chunk_size = ColumnarLogReader(str(path)).chunks.dtype.itemsize
+    # Corte a media escritura del último bloque e índice perdido
+    size = os.path.getsize(path)
+    with open(path, 'r+b') as f:
+        f.truncate(size - chunk_size // 2)
+    os.remove(str(path) + '.idx')
+    reader = ColumnarLogReader(str(path))
+    assert len(reader) == CHUNK * 2
+    assert reader.index['pkt_last'].tolist() == [CHUNK, 2 * CHUNK]
+    assert reader.find_packet(2 * CHUNK) == 2 * CHUNK - 1
+
+
+def test_indice_cortado_se_reconstruye(tmp_path):
+    path = tmp_path / "log.clog"
+    escribir(path, [CHUNK * 3 + 4])
+    idx = str(path) + '.idx'
+    with open(idx, 'r+b') as f:
+        f.truncate(INDEX_DTYPE.itemsize + 7)
+    reader = ColumnarLogReader(str(path))
+    assert len(reader.index) == 4
+    assert reader.index['pkt_first'].tolist() == [1, 17, 33, 49]
+
+
+def test_no_es_log_por_columnas(tmp_path):
+    path = tmp_path / "otro.clog"
+    path.write_bytes(b"hola")
+    with pytest.raises(ValueError):
+        ColumnarLogReader(str(path))
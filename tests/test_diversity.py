@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# tests/test_diversity.py
+
+import numpy as np
+import pytest
+
+from core.diversity import DiversityMerger, SequenceWindow
+
+
+def received_stream(n: int, loss: float, seed: int, shuffle: int = 0, duplicates: float = 0.0) -> list:
+    """Números 1..n con pérdidas, copias repetidas y desorden local (hasta 'shuffle' lugares)."""
+    rng = np.random.default_rng(seed)
+    seqs = [s for s in range(1, n + 1) if rng.random() >= loss]
+    originals = len(seqs)
+    seqs += [s for s in seqs if rng.random() < duplicates]
+    keys = np.array(seqs, dtype=float)
+    keys[originals:] += 0.5  # Las copias llegan justo después
+    if shuffle:
+        keys += rng.uniform(0, shuffle, len(keys))
+    return [seqs[i] for i in np.argsort(keys, kind='stable')]
+
+
+def brute_lost(seqs) -> int:
+    seen = set(seqs)
+    return max(seen) - min(seen) + 1 - len(seen)
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_ventana_igual_a_conjunto(seed):
+    seqs = received_stream(20000, loss=0.2, seed=seed, shuffle=50, duplicates=0.05)
+    window = SequenceWindow(256)
+    seen = set()
+    for seq in seqs:
+        assert window.add(seq) == (seq not in seen)
+        seen.add(seq)
+    assert window.count == len(seen)
+    assert window.lost == brute_lost(seqs)
+    assert window.expected == max(seen) - min(seen) + 1
+    assert window.restarts == 0
+
+
+def test_salto_mayor_que_la_ventana():
+    window = SequenceWindow(64)
+    for seq in (1, 2, 3, 1000, 1001, 5000):
+        assert window.add(seq)
+    assert window.lost == 5000 - 6
+    # Dentro de la ventana un tardío todavía cuenta
+    assert window.add(4990)
+    assert window.lost == 5000 - 7
+
+
+def test_paquete_tardio_deja_de_ser_perdido():
+    window = SequenceWindow(64)
+    for seq in (10, 11, 13, 14):
+        window.add(seq)
+    assert window.lost == 1
+    assert window.add(12)
+    assert window.lost == 0
+    assert window.add(9) and window.lost == 0 and window.first == 9
+    assert not window.add(12)
+
+
+def test_reinicio_del_contador():
+    window = SequenceWindow(64)
+    for seq in range(1000, 1101):
+        if seq != 1050:
+            window.add(seq)
+    assert window.lost == 1
+    # El vehículo se reinició: vuelve a contar desde 1
+    for seq in (1, 2, 4):
+        assert window.add(seq)
+    assert window.restarts == 1
+    assert window.lost == 2
+    assert window.received == 103
+    assert window.expected == 105
+    assert window.count == 3  # Desde el reinicio
+
+
+def test_reinicio_antes_de_llenar_la_ventana():
+    # Un solo receptor nunca repite un número: 1 otra vez es un reinicio
+    window = SequenceWindow(1024, repeats_restart=True)
+    for seq in range(1, 301):
+        window.add(seq)
+    assert all(window.add(seq) for seq in range(1, 301))
+    assert window.restarts == 1
+    assert window.received == 600 and window.lost == 0
+    # Sin repeats_restart (ventana combinada) es una copia repetida
+    window = SequenceWindow(1024)
+    for seq in range(1, 301):
+        window.add(seq)
+    assert not window.add(1)
+    assert window.restarts == 0
+
+
+def test_merger_reinicio_con_dos_receptores():
+    merger = DiversityMerger()
+    first_run = [merger.accept(name, seq) for seq in range(1, 301) for name in ("A", "B")]
+    assert first_run == [True, False] * 300
+    # El vehículo se reinicia; A lo ve primero y B repite con retraso
+    second_run = [merger.accept("A", seq) for seq in range(1, 51)]
+    second_run += [merger.accept("B", seq) for seq in range(1, 51)]
+    assert second_run == [True] * 50 + [False] * 50
+    stats = merger.stats()
+    assert stats['combinado']['recibidos'] == 350
+    assert stats['combinado']['perdidos'] == 0
+    assert merger.combined.restarts == 1
+
+
+def test_combinacion_de_dos_receptores():
+    n = 10000
+    rng = np.random.default_rng(9)
+    lost_a = rng.random(n) < 0.3
+    lost_b = rng.random(n) < 0.3
+    a = [s for s in range(1, n + 1) if not lost_a[s - 1]]
+    b = [s for s in range(1, n + 1) if not lost_b[s - 1]]
+    merger = DiversityMerger(window=512)
+    processed = []
+    # Se alternan bloques de cada receptor, como llegan a la cola del worker
+    for start in range(0, n, 100):
+        for name, seqs in (("A", a), ("B", b)):
+            block = np.array([s for s in seqs if start < s <= start + 100], dtype=np.int64)
+            mask = merger.accept_block(name, block)
+            processed += block[mask].tolist()
+    assert len(processed) == len(set(processed))
+    assert set(processed) == set(a) | set(b)
+
+    stats = merger.stats()
+    both = int(np.count_nonzero(lost_a & lost_b))
+    # Los perdidos al principio o al final no cuentan (no hay referencia)
+    assert abs(stats['combinado']['perdidos'] - both) <= 2
+    assert abs(stats['A']['perdidos'] - int(lost_a.sum())) <= 2
+    assert stats['A']['primeros'] + stats['B']['primeros'] == len(processed)
+    assert stats['A']['repetidos'] + stats['B']['repetidos'] == len(a) + len(b) - len(processed)
+    assert stats['combinado']['perdida_pct'] < stats['A']['perdida_pct'] / 2
+
+
+def test_accept_block_igual_que_accept():
+    seqs = received_stream(3000, loss=0.1, seed=4, shuffle=5, duplicates=0.2)
+    single, block = DiversityMerger(), DiversityMerger()
+    expected = [single.accept("A", s) for s in seqs]
+    mask = np.concatenate([block.accept_block("A", np.array(seqs[i:i + 64])) for i in range(0, len(seqs), 64)])
+    assert mask.tolist() == expected
+    assert block.stats() == single.stats()
+
+
+def test_reporte():
+    merger = DiversityMerger(interval=5.0)
+    assert merger.report(merger._last_report + 10.0) is None  # Sin receptores
+    start = merger._last_report
+    for seq in (1, 2, 4):
+        merger.accept("ttyUSB0", seq)
+    assert merger.report(start + 1.0) is None  # Antes del intervalo
+    text = merger.report(start + 6.0)
+    assert text.startswith("Diversidad: combinado 25.0 % perdidos (1)")
+    assert "ttyUSB0 25.0 % (primeros 3)" in text
+    assert merger.report(start + 7.0) is None
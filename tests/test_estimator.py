@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# tests/test_estimator.py
+
+import numpy as np
+import pytest
+
+from core.estimator import AltitudeEstimator, reprocess
+
+G = 9.81
+
+
+def synthetic_flight(seed: int = 0, rate: float = 20.0, duration: float = 60.0) -> dict:
+    """
+    Vuelo sintético: 3 s en rampa, 4 s de motor a 60 m/s², caída libre y
+    descenso a 8 m/s. Barómetro con ruido, GPS a 1 Hz (repetido entre
+    fijas y 0 antes de la primera) y Acc_z que incluye la gravedad.
+    """
+    rng = np.random.default_rng(seed)
+    t = np.arange(0.0, duration, 1.0 / rate)
+    accel = np.where((t >= 3.0) & (t < 7.0), 60.0, 0.0)
+    v = np.cumsum(accel - np.where(t >= 3.0, G, 0.0)) / rate
+    v = np.where(t < 3.0, 0.0, np.maximum(v, -8.0))
+    h = 100.0 + np.cumsum(v) / rate
+    falling = (t >= 3.0) & (v > -8.0)
+    az = np.where(t < 3.0, G, accel + np.where(falling, 0.0, G))
+    gps = np.where(t >= 2.0, h[np.floor(t).astype(int) * int(rate)] + 35.0, 0.0)
+    return {
+        't': t, 'h': h, 'v': v,
+        'baro': h + rng.normal(0.0, 1.0, len(t)),
+        'gps': gps,
+        'az': az + rng.normal(0.0, 0.3, len(t)),
+    }
+
+
+def run_single(estimator: AltitudeEstimator, flight: dict, order=None) -> np.ndarray:
+    order = range(len(flight['t'])) if order is None else order
+    return np.array([
+        estimator.update(flight['t'][i], flight['baro'][i], flight['gps'][i], flight['az'][i])
+        for i in order
+    ]).T
+
+
+def run_blocks(estimator: AltitudeEstimator, flight: dict, seed: int, order=None) -> np.ndarray:
+    order = np.arange(len(flight['t'])) if order is None else np.asarray(order)
+    rng = np.random.default_rng(seed)
+    parts, start = [], 0
+    while start < len(order):
+        idx = order[start:start + int(rng.integers(1, 40))]
+        parts.append(np.array(estimator.update_block(
+            flight['t'][idx], flight['baro'][idx], flight['gps'][idx], flight['az'][idx])))
+        start += len(idx)
+    return np.concatenate(parts, axis=1)
+
+
+@pytest.mark.parametrize('use_accel', [True, False])
+def test_bloques_iguales_a_paquete_por_paquete(use_accel):
+    flight = synthetic_flight()
+    single = run_single(AltitudeEstimator(use_accel=use_accel), flight)
+    block = run_blocks(AltitudeEstimator(use_accel=use_accel), flight, seed=1)
+    np.testing.assert_allclose(block, single, rtol=1e-12, atol=1e-9)
+
+
+def test_bloques_con_paquetes_atrasados():
+    flight = synthetic_flight(seed=2)
+    flight['t'][100] = np.nan
+    rng = np.random.default_rng(5)
+    order = np.arange(len(flight['t']))
+    # Algunos paquetes llegan un par de lugares tarde (otro receptor)
+    for i in rng.choice(len(order) - 3, 40, replace=False):
+        order[i], order[i + 2] = order[i + 2], order[i]
+    single_est, block_est = AltitudeEstimator(), AltitudeEstimator()
+    single = run_single(single_est, flight, order)
+    block = run_blocks(block_est, flight, seed=3, order=order)
+    np.testing.assert_allclose(block, single, rtol=1e-12, atol=1e-9)
+    assert block_est.last_t == single_est.last_t == flight['t'][-1]
+
+
+@pytest.mark.parametrize('use_accel', [True, False])
+def test_sigue_al_vuelo(use_accel):
+    flight = synthetic_flight(seed=4)
+    h, v, sigma_h, sigma_v = reprocess(flight['t'], flight['baro'], flight['gps'], flight['az'],
+                                       use_accel=use_accel)
+    error_h = np.abs(h - flight['h'])
+    assert np.median(error_h) < 2.0
+    assert abs(np.max(h) - np.max(flight['h'])) < (5.0 if use_accel else 15.0)
+    # Descenso estable: la velocidad converge a -8 m/s (más ruidosa sin acelerómetro)
+    tail = flight['t'] > 50.0
+    assert abs(np.mean(v[tail]) + 8.0) < 0.5
+    assert np.all(np.abs(v[tail] + 8.0) < (1.5 if use_accel else 6.0))
+    assert np.all(sigma_h > 0.0) and np.all(sigma_v > 0.0)
+
+
+def test_pico_del_barometro_se_ignora():
+    estimator = AltitudeEstimator(use_accel=False)
+    for i in range(50):
+        estimator.update(i * 0.05, 100.0)
+    h, *_ = estimator.update(2.5, 5000.0)
+    assert abs(h - 100.0) < 1.0
+    assert estimator.rejects == 1
+
+
+def test_reinicio_tras_rechazos_seguidos():
+    estimator = AltitudeEstimator(use_accel=False, max_rejects=5)
+    for i in range(50):
+        estimator.update(i * 0.05, 100.0)
+    for i in range(5):
+        h, *_ = estimator.update(2.5 + i * 0.05, 3000.0)
+    assert h == 3000.0
+    assert estimator.rejects == 0
+
+
+def test_bloque_vacio_no_cambia_el_estado():
+    estimator = AltitudeEstimator()
+    estimator.update(0.0, 10.0)
+    before = (estimator.state(), estimator.last_t)
+    h, v, sigma_h, sigma_v = estimator.update_block([], [], [], [])
+    assert len(h) == len(v) == len(sigma_h) == len(sigma_v) == 0
+    assert (estimator.state(), estimator.last_t) == before
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# tests/test_flight_events.py
+
+import numpy as np
+import pytest
+
+from core.flight_events import (
+    APOGEO, ATERRIZADO, ATERRIZAJE, COSTEO, DESPEGUE, DROGUE, EN_RAMPA, FIN_MOTOR, G,
+    FlightEventDetector
+)
+
+RATE = 50.0
+
+
+def flight(k: float = 0.0, thrust: float = 80.0, burn: float = 3.0, drogue_vel: float = 20.0,
+           main_vel: float = 6.0) -> dict:
+    """
+    Vuelo simulado (Euler a RATE Hz): 2 s en rampa a 100 m, propulsión,
+    costeo con arrastre a = -g - k v|v|, caída libre hasta drogue_vel,
+    descenso estable con el drogue y luego con el principal, y 5 s en
+    tierra. Devuelve tiempos, altitud y velocidad verdaderas.
+    """
+    dt = 1.0 / RATE
+    t, h, v = 0.0, 100.0, 0.0
+    ts, hs, vs = [], [], []
+    landed_at = None
+    while landed_at is None or t < landed_at + 5.0:
+        ts.append(t)
+        hs.append(h)
+        vs.append(v)
+        t += dt
+        if t < 2.0 or landed_at is not None:
+            continue
+        if t < 2.0 + burn:
+            a = thrust - G - k * v * abs(v)
+        elif v > -drogue_vel:
+            a = -G - k * v * abs(v)
+        else:
+            a = 0.0
+            v = -main_vel if h < 300.0 else -drogue_vel
+        v += a * dt
+        h += v * dt
+        if h <= 100.0 and t > 3.0:
+            h, v, landed_at = 100.0, 0.0, t
+    return {'t': np.array(ts), 'alt': np.array(hs), 'vel': np.array(vs)}
+
+
+def run(detector: FlightEventDetector, data: dict) -> list:
+    return [e for e in map(detector.update, data['t'], data['alt'], data['vel']) if e is not None]
+
+
+def test_secuencia_completa_de_eventos():
+    data = flight(k=0.001)
+    detector = FlightEventDetector()
+    events = run(detector, data)
+    assert [e.name for e in events] == [DESPEGUE, FIN_MOTOR, APOGEO, DROGUE, ATERRIZAJE]
+    assert detector.phase == ATERRIZADO
+    by_name = {e.name: e for e in events}
+
+    # Fin de motor: el instante de la velocidad máxima
+    i_max = int(np.argmax(data['vel']))
+    assert by_name[FIN_MOTOR].t == pytest.approx(data['t'][i_max])
+    assert by_name[FIN_MOTOR].vel == pytest.approx(data['vel'][i_max])
+    # Apogeo: la altitud máxima real
+    i_top = int(np.argmax(data['alt']))
+    assert by_name[APOGEO].alt == pytest.approx(data['alt'][i_top])
+    assert by_name[APOGEO].t == pytest.approx(data['t'][i_top])
+    # Drogue: cuando termina la caída libre (velocidad constante)
+    i_drogue = int(np.argmax(data['vel'] <= -20.0))
+    assert abs(by_name[DROGUE].t - data['t'][i_drogue]) < 0.5
+    # Aterrizaje: reportado al inicio del reposo
+    i_land = int(np.argmax((data['t'] > 3.0) & (data['alt'] <= 100.0)))
+    assert abs(by_name[ATERRIZAJE].t - data['t'][i_land]) < 0.5
+    assert by_name[ATERRIZAJE].alt == pytest.approx(100.0)
+
+
+def test_ruido_en_rampa_no_dispara_despegue():
+    rng = np.random.default_rng(0)
+    t = np.arange(0.0, 120.0, 1.0 / RATE)
+    # Deriva lenta del barómetro (20 m en 2 min) y ruido en la velocidad
+    alt = 100.0 + 20.0 * t / 120.0 + rng.normal(0.0, 1.0, len(t))
+    vel = rng.normal(0.0, 2.0, len(t))
+    detector = FlightEventDetector()
+    assert detector.update_block(t, alt, vel) == []
+    assert detector.phase == EN_RAMPA
+
+
+def test_bloque_igual_que_paquete_por_paquete():
+    data = flight(k=0.002)
+    single = run(FlightEventDetector(), data)
+    detector = FlightEventDetector()
+    blocks = []
+    for start in range(0, len(data['t']), 37):
+        part = slice(start, start + 37)
+        blocks += detector.update_block(data['t'][part], data['alt'][part], data['vel'][part])
+    assert blocks == single
+
+
+@pytest.mark.parametrize('k', [0.0, 0.0005, 0.002])
+def test_prediccion_del_apogeo_en_el_costeo(k):
+    data = flight(k=k)
+    apogee = data['alt'].max()
+    t_apogee = data['t'][int(np.argmax(data['alt']))]
+    detector = FlightEventDetector()
+    checked = 0
+    for t, alt, vel in zip(data['t'], data['alt'], data['vel']):
+        detector.update(t, alt, vel)
+        # Pasado el transitorio del promedio de la aceleración (tau = 0.3 s)
+        if detector.phase == COSTEO and vel > 30.0 and t > detector.events[-1].t + 2.0:
+            prediction = detector.predict()
+            assert prediction.apogee_alt == pytest.approx(apogee, rel=0.02)
+            assert prediction.time_to_apogee == pytest.approx(t_apogee - t, abs=0.5)
+            checked += 1
+    assert checked > 10
+
+
+def test_prediccion_fuera_del_costeo():
+    detector = FlightEventDetector()
+    assert detector.predict().phase == EN_RAMPA
+    data = flight(k=0.001)
+    run(detector, data)
+    prediction = detector.predict()
+    assert prediction.phase == ATERRIZADO
+    assert prediction.time_to_apogee == 0.0
+    assert prediction.apogee_alt == prediction.max_alt == pytest.approx(data['alt'].max())
+
+
+def test_reset():
+    detector = FlightEventDetector()
+    run(detector, flight())
+    detector.reset()
+    assert detector.phase == EN_RAMPA and detector.events == []
+    assert [e.name for e in run(detector, flight())][0] == DESPEGUE
+    assert detector.phase == ATERRIZADO
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# tests/test_flight_logger.py
+
+import csv
+import threading
+import time
+
+import pytest
+
+from core.flight_logger import AsyncFileWriter, FlightLogWriter
+
+
+class Roto:
+    """Valor que no se puede convertir a texto (lote inválido)."""
+
+    def __str__(self):
+        raise ValueError("dato roto")
+
+
+class Lento(AsyncFileWriter):
+    """Escritor cuyo disco se queda colgado hasta que se libera 'disco'."""
+
+    def __init__(self, filename: str, **kwargs):
+        super().__init__(filename, **kwargs)
+        self.disco = threading.Event()
+        self.start()
+
+    def _write_batch(self, batch: list) -> tuple:
+        self.disco.wait()
+        return len(batch), 0
+
+
+def leer(path) -> list:
+    with open(path, newline='') as f:
+        return list(csv.reader(f))
+
+
+def test_base_abstracta(tmp_path):
+    with pytest.raises(TypeError):
+        AsyncFileWriter(str(tmp_path / "x.log"))
+
+
+def test_escribe_encabezado_y_renglones(tmp_path):
+    path = tmp_path / "log_vuelo.csv"
+    writer = FlightLogWriter(str(path), ['a', 'b'], flush_interval=0.05)
+    for i in range(1000):
+        assert writer.write_row([i, i * 0.5])
+    writer.close()
+    rows = leer(path)
+    assert rows[0] == ['a', 'b']
+    assert len(rows) == 1001 and rows[-1] == ['999', '499.5']
+    stats = writer.stats()
+    assert stats['rows_written'] == 1001
+    assert stats['dropped_rows'] == 0 and stats['error'] is None
+
+
+def test_lote_fallido_no_detiene_el_hilo(tmp_path):
+    path = tmp_path / "log_vuelo.csv"
+    writer = FlightLogWriter(str(path), ['a'], batch_size=1, flush_interval=0.05)
+    writer.write_row([1])
+    writer.write_row([Roto()])
+    writer.write_row([3])
+    writer.close()
+    assert leer(path) == [['a'], ['1'], ['3']]
+    stats = writer.stats()
+    assert stats['failed_batches'] == 1
+    assert stats['dropped_rows'] == 1
+    assert "ValueError" in stats['error']
+
+
+def test_cola_llena_descarta_y_cuenta(tmp_path):
+    writer = FlightLogWriter(str(tmp_path / "log.csv"), ['a'], queue_size=1)
+    # Sin tiempo para vaciar la cola algunos lotes se descartan, nunca bloquea
+    results = [writer.write_rows([[i]] * 10) for i in range(200)]
+    writer.close()
+    stats = writer.stats()
+    assert stats['dropped_rows'] == 10 * results.count(False)
+    assert stats['rows_written'] + stats['dropped_rows'] == 1 + 2000
+
+
+@pytest.mark.parametrize('queue_size', [1, 64])
+def test_cerrar_no_espera_a_un_disco_colgado(tmp_path, queue_size):
+    writer = Lento(str(tmp_path / "x.log"), queue_size=queue_size, batch_size=1)
+    writer.submit([1], 1)
+    while writer._queue.qsize():  # El hilo ya está atorado escribiendo
+        time.sleep(0.01)
+    for i in range(queue_size):
+        writer.submit([i], 1)
+    start = time.monotonic()
+    assert not writer.close(timeout=0.2)
+    assert time.monotonic() - start < 1.0
+    assert writer.stats()['error']
+    # Cuando el disco responde, otro close() termina de cerrar
+    writer.disco.set()
+    assert writer.close(timeout=2.0)
+    assert not writer._thread.is_alive()
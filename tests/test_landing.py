@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# tests/test_landing.py
+
+import math
+
+import numpy as np
+import pytest
+from PySide6.QtCore import QCoreApplication
+
+from core.flight_events import DESCENSO
+from core.landing import EARTH_RADIUS, LandingInput, WindEstimator, predict_landing
+from core.packet_schema import PACKET_FIELDS, TelemetryRecord
+from core.serial_worker import SerialWorker
+
+K = math.pi / 180.0 * EARTH_RADIUS
+LAT, LON = 19.4284, -99.1276
+
+
+def entrada(**cambios) -> LandingInput:
+    valores = dict(lat=LAT, lon=LON, height=600.0, sigma_height=2.0, descent_rate=6.0,
+                   sigma_rate=0.3, wind=(3.0, -1.0), wind_cov=(0.2, 0.0, 0.2))
+    valores.update(cambios)
+    return LandingInput(**valores)
+
+
+def test_centro_sigue_al_viento():
+    prediction = predict_landing(entrada(), samples=20000, seed=0)
+    # 600 m a 6 m/s: ~100 s de deriva con viento (3, -1) m/s
+    east = (prediction.lon - LON) * K * math.cos(math.radians(LAT))
+    north = (prediction.lat - LAT) * K
+    assert east == pytest.approx(300.0, rel=0.05)
+    assert north == pytest.approx(-100.0, rel=0.1)
+    assert prediction.time_to_landing == pytest.approx(100.0, rel=0.05)
+    assert prediction.semi_major >= prediction.semi_minor > 0.0
+    assert len(prediction.polygon) == 49
+    assert prediction.polygon[0] == prediction.polygon[-1]
+
+
+def test_elipse_crece_con_la_altura():
+    low = predict_landing(entrada(height=100.0), seed=1)
+    high = predict_landing(entrada(height=800.0), seed=1)
+    assert high.semi_major > 4.0 * low.semi_major
+
+
+def test_misma_semilla_mismo_resultado():
+    assert predict_landing(entrada(), seed=7)[:7] == predict_landing(entrada(), seed=7)[:7]
+
+
+def test_viento_por_fijas_en_descenso():
+    wind = WindEstimator(tau=5.0)
+    # Deriva constante de 4 m/s al este y 2 m/s al sur, una fija por segundo
+    for t in range(30):
+        lat = LAT - 2.0 * t / K
+        lon = LON + 4.0 * t / (K * math.cos(math.radians(lat)))
+        wind.add_fix(float(t), lat, lon, descending=True)
+        wind.add_fix(float(t) + 0.5, lat, lon, descending=True)  # Repetida: se ignora
+    assert wind.samples == 29
+    assert wind.mean_e == pytest.approx(4.0, abs=0.01)
+    assert wind.mean_n == pytest.approx(-2.0, abs=0.01)
+    assert wind.var_e < 1e-4 and wind.var_n < 1e-4
+
+
+def test_fijas_sin_gps_se_ignoran():
+    single, block = WindEstimator(tau=5.0), WindEstimator(tau=5.0)
+    t = np.arange(20.0)
+    lat = LAT - 2.0 * t / K
+    lon = LON + 4.0 * t / (K * math.cos(math.radians(LAT)))
+    # El GPS pierde la fija en pleno descenso: manda 0,0 y luego NaN
+    lat[8], lon[8] = 0.0, 0.0
+    lat[12] = lon[12] = np.nan
+    for i in range(len(t)):
+        single.add_fix(t[i], lat[i], lon[i], descending=True)
+    block.add_fixes(t, lat, lon, descending=True)
+    for wind in (single, block):
+        assert wind.samples == 17
+        assert wind.mean_e == pytest.approx(4.0, abs=0.01)
+        assert wind.mean_n == pytest.approx(-2.0, abs=0.01)
+        assert wind.last_fix[1] == lat[-1]
+
+
+def test_viento_en_bloque_igual_que_por_fija():
+    rng = np.random.default_rng(2)
+    n = 500
+    t = np.arange(n) * 0.1
+    # El GPS se repite entre fijas (5 Hz de fijas, 10 Hz de paquetes)
+    fix = np.repeat(np.arange(n // 2), 2)
+    lat = LAT + np.cumsum(rng.normal(0.0, 1e-5, n // 2))[fix]
+    lon = LON + np.cumsum(rng.normal(0.0, 1e-5, n // 2))[fix]
+    single, block = WindEstimator(), WindEstimator()
+    for i in range(n):
+        single.add_fix(t[i], lat[i], lon[i], descending=i >= 100)
+    block.add_fixes(t[:100], lat[:100], lon[:100], descending=False)
+    for start in range(100, n, 33):
+        part = slice(start, start + 33)
+        block.add_fixes(t[part], lat[part], lon[part], descending=True)
+    assert block.samples == single.samples
+    for attr in ('mean_e', 'mean_n', 'var_e', 'var_n', 'cov_en'):
+        assert getattr(block, attr) == pytest.approx(getattr(single, attr))
+
+
+@pytest.fixture(scope='module')
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def test_detener_espera_la_prediccion_en_curso(app):
+    worker = SerialWorker(keep_history=False)
+    worker.LANDING_SAMPLES = 400000  # Una tarea que tarda lo suficiente
+    worker.flight_events.phase = DESCENSO
+    worker.wind.samples = 5
+    record = TelemetryRecord(**{key: 0.0 for _, key, _ in PACKET_FIELDS}, alt_filtrada=500.0,
+                             sigma_alt=1.0, velocidad_z=-6.0, sigma_vz=0.3)
+    worker.request_landing_prediction(record, now=10.0)
+    assert worker._landing_busy
+    worker.stop_connection()
+    assert worker.landing_pool.activeThreadCount() == 0
+    # La tarea ya emitió antes de que el worker se destruya
+    worker.deleteLater()
+    app.processEvents()
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# tests/test_main.py
+
+import pytest
+
+from main import parse_args
+
+
+def test_por_omision_un_solo_enlace():
+    args, qt_args = parse_args([])
+    assert args.vehiculo == [""]
+    assert qt_args == []
+
+
+def test_vehiculo_repetible_y_opciones_de_qt():
+    args, qt_args = parse_args(['--vehiculo', 'Booster', '-platform', 'offscreen',
+                                '--vehiculo', 'Carga útil'])
+    assert args.vehiculo == ["Booster", "Carga útil"]
+    assert qt_args == ['-platform', 'offscreen']
+
+
+@pytest.mark.parametrize('names', [["Booster", "Booster"], ["Carga útil", "carga util"]])
+def test_nombres_repetidos_es_error(names, capsys):
+    argv = [arg for name in names for arg in ('--vehiculo', name)]
+    with pytest.raises(SystemExit) as exc:
+        parse_args(argv)
+    assert exc.value.code == 2
+    assert "deben ser distintos" in capsys.readouterr().err
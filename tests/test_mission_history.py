@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# tests/test_mission_history.py
+
+import numpy as np
+import pytest
+
+from core.mission_history import MinMaxPyramid, MissionHistory
+
+COLUMNS = ['time', 'pres', 'temp']
+
+
+def brute_level(values: np.ndarray, width: int):
+    """Mínimo y máximo de cada grupo de 'width' muestras, ignorando NaN."""
+    mins, maxs = [], []
+    for i in range(0, len(values), width):
+        group = values[i:i + width]
+        group = group[~np.isnan(group)]
+        mins.append(group.min() if len(group) else np.nan)
+        maxs.append(group.max() if len(group) else np.nan)
+    return np.array(mins), np.array(maxs)
+
+
+@pytest.mark.parametrize('factor', [2, 4, 7])
+def test_piramide_incremental_igual_a_fuerza_bruta(factor):
+    rng = np.random.default_rng(factor)
+    values = rng.normal(size=5000)
+    values[rng.integers(0, len(values), 200)] = np.nan
+    pyramid = MinMaxPyramid(factor, min_bins=16)
+    n = 0
+    while n < len(values):
+        n = min(len(values), n + int(rng.integers(1, 700)))
+        pyramid.update(values, n)
+        assert pyramid.levels >= 1 or n <= 16
+        for k in range(1, pyramid.levels + 1):
+            mins, maxs, width = pyramid.level(k)
+            exp_min, exp_max = brute_level(values[:n], width)
+            np.testing.assert_array_equal(mins, exp_min)
+            np.testing.assert_array_equal(maxs, exp_max)
+
+
+def test_piramide_factor_invalido():
+    with pytest.raises(ValueError):
+        MinMaxPyramid(1)
+
+
+def filled_history(n: int, seed: int = 0) -> tuple:
+    rng = np.random.default_rng(seed)
+    t = np.arange(n) * 0.02
+    pres = np.cumsum(rng.normal(size=n))
+    history = MissionHistory(COLUMNS)
+    history.extend({'time': t, 'pres': pres, 'temp': np.zeros(n)})
+    return history, t, pres
+
+
+def test_query_sin_diezmar_devuelve_el_rango_con_bordes():
+    history, t, pres = filled_history(1000)
+    x, y = history.query('pres', 2.0, 3.0, 1000)
+    i0, i1 = np.searchsorted(t, 2.0) - 1, np.searchsorted(t, 3.0, 'right') + 1
+    np.testing.assert_array_equal(x, t[i0:i1])
+    np.testing.assert_array_equal(y, pres[i0:i1])
+
+
+def test_query_diezmada_conserva_picos():
+    history, t, pres = filled_history(200000)
+    pres[123456] = 1e6
+    history.clear()
+    history.extend({'time': t, 'pres': pres, 'temp': np.zeros(len(t))})
+    x, y = history.query('pres', 0.0, t[-1], 500)
+    assert len(x) <= 500
+    assert np.all(np.diff(x) >= 0)
+    assert y.max() == 1e6
+    assert y.min() == pres.min()
+
+
+def test_append_y_extend_equivalentes():
+    t = np.array([0.0, 0.1, 0.2, 0.15, 0.3, np.nan, 0.4])
+    pres = np.arange(len(t), dtype=float)
+    one = MissionHistory(COLUMNS)
+    for i in range(len(t)):
+        one.append(t[i], pres[i], 0.0)
+    block = MissionHistory(COLUMNS)
+    block.extend({'time': t[:3], 'pres': pres[:3], 'temp': np.zeros(3)})
+    block.extend({'time': t[3:], 'pres': pres[3:], 'temp': np.zeros(4)})
+    for history in (one, block):
+        # El paquete tardío (0.15) y el tiempo NaN no se guardan
+        np.testing.assert_array_equal(history.query('pres', 0.0, 1.0, 100)[1], [0, 1, 2, 4, 6])
+        assert history.dropped == 2
+        assert history.restarts == 0
+
+
+def test_salto_atras_reinicia_el_historial():
+    history = MissionHistory(COLUMNS)
+    history.extend({'time': np.arange(100.0, 110.0), 'pres': np.ones(10), 'temp': np.zeros(10)})
+    # Reinicio de la computadora de vuelo a mitad del bloque
+    t = np.array([110.0, 111.0, 0.5, 1.0, 1.5])
+    history.extend({'time': t, 'pres': np.full(5, 2.0), 'temp': np.zeros(5)})
+    assert history.restarts == 1
+    assert history.time_range() == (0.5, 1.5)
+    x, y = history.query('pres', 0.0, 2.0, 100)
+    np.testing.assert_array_equal(x, [0.5, 1.0, 1.5])
+
+    history.append(0.2, 3.0, 0.0)  # Atrás, pero menos que restart_gap: tardío
+    assert history.restarts == 1 and history.dropped == 1
+    history.append(-50.0, 3.0, 0.0)
+    assert history.restarts == 2
+    assert len(history) == 1
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# tests/test_rx_buffer.py
+
+import numpy as np
+
+from core.rx_buffer import RxBuffer
+
+
+def feed_all(buffer: RxBuffer, chunks) -> list:
+    """Alimenta los bloques y copia cada línea (las vistas caducan con el siguiente feed)."""
+    lines = []
+    for chunk in chunks:
+        lines += [bytes(line) for line in buffer.feed(chunk)]
+    return lines
+
+
+def split_random(data: bytes, seed: int, max_chunk: int = 40) -> list:
+    rng = np.random.default_rng(seed)
+    cuts = np.cumsum(rng.integers(1, max_chunk, len(data)))
+    cuts = [0] + [int(c) for c in cuts if c < len(data)] + [len(data)]
+    return [data[a:b] for a, b in zip(cuts[:-1], cuts[1:])]
+
+
+def test_lineas_completas_y_pendiente():
+    buffer = RxBuffer()
+    assert feed_all(buffer, [b"uno\ndos\ntr"]) == [b"uno", b"dos"]
+    assert buffer.buffered == 2
+    assert feed_all(buffer, [b"es\n"]) == [b"tres"]
+    assert buffer.buffered == 0
+
+
+def test_delimitador_partido_entre_bloques():
+    buffer = RxBuffer(delimiter=b"\r\n")
+    data = b"".join(b"linea %d\r\n" % i for i in range(200))
+    for seed in range(5):
+        buffer.clear()
+        assert feed_all(buffer, split_random(data, seed)) == [b"linea %d" % i for i in range(200)]
+
+
+def test_compacta_y_crece_sin_perder_datos():
+    buffer = RxBuffer(capacity=16, max_line=1 << 20)
+    data = b"".join(b"%d," % i * 7 + b"\n" for i in range(300))
+    lines = feed_all(buffer, split_random(data, 3, max_chunk=100))
+    assert lines == data.split(b"\n")[:-1]
+    assert buffer.capacity >= 16
+
+
+def test_basura_sin_delimitador_se_descarta():
+    buffer = RxBuffer(max_line=64)
+    assert feed_all(buffer, [b"x" * 100]) == []
+    assert buffer.overflows == 1 and buffer.buffered == 0
+    assert feed_all(buffer, [b"ok\n"]) == [b"ok"]
+
+
+def test_cambio_de_delimitador_revisa_lo_pendiente():
+    buffer = RxBuffer()
+    assert feed_all(buffer, [b"trama\x00resto"]) == []
+    buffer.set_delimiter(b"\x00")
+    assert feed_all(buffer, [b""]) == [b"trama"]
+    assert buffer.buffered == len(b"resto")
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# tests/test_tile_cache.py
+
+import sqlite3
+
+from core import tile_cache
+from core.tile_cache import TileCache, lonlat_to_tile
+
+
+def stored_tiles(path) -> int:
+    """Teselas confirmadas, vistas desde otra conexión."""
+    db = sqlite3.connect(path)
+    try:
+        return db.execute("SELECT COUNT(*) FROM tiles").fetchone()[0]
+    finally:
+        db.close()
+
+
+def test_put_get_en_xyz(tmp_path):
+    cache = TileCache(str(tmp_path / "c.mbtiles"))
+    cache.put(3, 2, 1, b"\x89PNG tesela")
+    assert cache.get(3, 2, 1) == b"\x89PNG tesela"
+    assert cache.get(3, 2, 2) is None
+    assert cache.contains(3, 2, 1)
+    # En disco la fila está en esquema TMS
+    row = cache._db.execute("SELECT tile_row FROM tiles").fetchone()[0]
+    assert row == (1 << 3) - 1 - 1
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+    cache.close()
+
+
+def test_escrituras_se_confirman_en_grupo(tmp_path, monkeypatch):
+    monkeypatch.setattr(tile_cache, '_COMMIT_EVERY', 4)
+    path = str(tmp_path / "c.mbtiles")
+    cache = TileCache(path)
+    for x in range(3):
+        cache.put(5, x, 0, b"abc")
+    assert cache.pending == 3
+    assert stored_tiles(path) == 0
+    cache.put(5, 3, 0, b"abc")
+    assert cache.pending == 0
+    assert stored_tiles(path) == 4
+
+    cache.put(5, 4, 0, b"abc")
+    cache.flush()
+    assert stored_tiles(path) == 5
+    cache.put(5, 5, 0, b"abc")
+    cache.close()
+    assert stored_tiles(path) == 6
+
+
+def test_desalojo_lru(tmp_path, monkeypatch):
+    cache = TileCache(str(tmp_path / "c.mbtiles"), max_bytes=1000)
+    clock = iter(range(1000, 100000, 100))
+    monkeypatch.setattr(tile_cache.time, 'time', lambda: next(clock))
+    for x in range(3):
+        cache.put(10, x, 0, bytes(300))
+    # La primera se usó hace poco: no debe salir
+    assert cache.get(10, 0, 0) is not None
+    cache.put(10, 3, 0, bytes(300))
+    assert cache.total_bytes <= 900
+    assert cache.contains(10, 0, 0)
+    assert not cache.contains(10, 1, 0)
+    cache.close()
+
+
+def test_total_bytes_al_reabrir(tmp_path):
+    path = str(tmp_path / "c.mbtiles")
+    cache = TileCache(path)
+    cache.put(1, 0, 0, bytes(10))
+    cache.put(1, 0, 0, bytes(25))  # Reemplazo
+    cache.put_asset("https://x/a.js", "application/javascript", b"js")
+    cache.close()
+    cache = TileCache(path)
+    assert cache.total_bytes == 25
+    assert cache.get_asset("https://x/a.js") == ("application/javascript", b"js")
+    cache.close()
+
+
+def test_lonlat_to_tile():
+    assert lonlat_to_tile(0.0, 0.0, 1) == (1, 1)
+    assert lonlat_to_tile(-180.0, 85.0, 4) == (0, 0)
+    assert lonlat_to_tile(180.0, -90.0, 4) == (15, 15)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# tests/test_validation.py
+
+import numpy as np
+import pytest
+
+from core.batch_parser import parse_block
+from core.packet_schema import PACKET_DTYPE
+from core.validation import (
+    CAMPOS, LONGITUD, NUMERIC_KEYS, NUMERICO, OK, RANGO, TRAMA, PacketValidator
+)
+
+PAQUETE = ("0.1,0.2,9.8,0,0,0,10,19.4284123,-99.1276456,148.3,12:00:00,95,80,"
+           "100,5,7,25,101.3,100,120,400,40,1,0,1,0,1,1,1,0,0")
+
+
+def partes(**cambios) -> list:
+    """Campos de PAQUETE con algunos reemplazados por índice (c<índice>=texto)."""
+    tokens = PAQUETE.split(',')
+    for llave, valor in cambios.items():
+        tokens[int(llave[1:])] = valor
+    return tokens
+
+
+def check(validator: PacketValidator, tokens: list, fast: bool = True):
+    return validator.check_fields(tokens, ','.join(tokens) if fast else None)
+
+
+def test_paquete_valido_por_ambos_caminos():
+    for fast in (True, False):
+        validator = PacketValidator()
+        kind, values = check(validator, partes(), fast)
+        assert kind == OK
+        assert len(values) == len(NUMERIC_KEYS)
+        assert values[NUMERIC_KEYS.index('lat')] == 19.4284123
+        assert validator.packets_ok == 1 and validator.rejected == 0
+
+
+@pytest.mark.parametrize('cambios, kind, key', [
+    ({'c0': 'abc'}, NUMERICO, 'ax'),
+    ({'c0': 'nan'}, NUMERICO, 'ax'),
+    ({'c0': 'inf'}, NUMERICO, 'ax'),
+    ({'c0': '1e'}, NUMERICO, 'ax'),
+    ({'c0': ''}, NUMERICO, 'ax'),
+    ({'c7': '91'}, RANGO, 'lat'),
+    ({'c20': '-1'}, RANGO, 'co2'),
+    ({'c15': '1' * 40}, LONGITUD, 'no_paquete_enviado'),
+    ({'c10': 'X' * 40}, LONGITUD, 'hora_gps'),
+])
+def test_clasificacion_y_conteo_por_campo(cambios, kind, key):
+    for fast in (True, False):
+        validator = PacketValidator()
+        assert check(validator, partes(**cambios), fast) == (kind, None)
+        assert validator.kinds[kind] == 1
+        assert validator.fields[key][kind] == 1
+        assert validator.packets_ok == 0
+
+
+def test_numerico_tiene_prioridad_sobre_rango():
+    validator = PacketValidator()
+    assert check(validator, partes(c0='x', c7='91'))[0] == NUMERICO
+    # Se cuenta el paquete una vez, pero cada campo con su propio error
+    assert validator.kinds[NUMERICO] == 1 and validator.kinds[RANGO] == 0
+    assert validator.fields['ax'][NUMERICO] == 1
+    assert validator.fields['lat'][RANGO] == 1
+
+
+def test_cantidad_de_campos():
+    validator = PacketValidator()
+    assert check(validator, partes()[:-1]) == (CAMPOS, None)
+    assert check(validator, partes() + ['0']) == (CAMPOS, None)
+    assert validator.kinds[CAMPOS] == 2
+
+
+def test_espacios_alrededor_de_numeros():
+    validator = PacketValidator()
+    kind, values = check(validator, partes(c0=' 1.5 ', c1='+2e1'))
+    assert kind == OK
+    assert values[:2] == [1.5, 20.0]
+
+
+def random_packets(n: int, seed: int) -> list:
+    """Paquetes válidos con un campo dañado de vez en cuando."""
+    rng = np.random.default_rng(seed)
+    junk = ['abc', '', 'nan', '1e400', '-5', '1000000', '9' * 40, '1.5.2', '--1']
+    lines = []
+    for i in range(n):
+        tokens = partes(c15=str(i))
+        if rng.random() < 0.4:
+            tokens[int(rng.integers(0, len(tokens)))] = junk[int(rng.integers(len(junk)))]
+        if rng.random() < 0.05:
+            tokens = tokens[:-1]
+        lines.append(','.join(tokens))
+    return lines
+
+
+def test_bloque_igual_que_paquete_por_paquete():
+    lines = random_packets(2000, seed=3)
+    single = PacketValidator()
+    accepted = []
+    for line in lines:
+        kind, values = single.check_fields(line.split(','), line)
+        if kind == OK:
+            accepted.append(line.encode())
+    block = PacketValidator()
+    _, good, _ = parse_block([line.encode() for line in lines], block)
+    assert good == accepted
+    assert block.kinds == single.kinds
+    assert block.fields == single.fields
+    assert block.packets_ok == single.packets_ok
+
+
+def test_check_block_binario():
+    block = np.zeros(3, dtype=PACKET_DTYPE)
+    block['pres'] = 101.3
+    block['lat'][1] = 95.0
+    block['temp'][2] = np.nan
+    validator = PacketValidator()
+    assert validator.check_block(block).tolist() == [True, False, False]
+    assert validator.kinds[RANGO] == 1 and validator.kinds[NUMERICO] == 1
+    assert validator.fields['lat'][RANGO] == 1
+    assert validator.fields['temp'][NUMERICO] == 1
+
+
+def test_reporte_por_intervalo():
+    validator = PacketValidator(interval=5.0)
+    start = validator._last_report
+    check(validator, partes())
+    assert validator.report(start + 1.0) is None  # Antes del intervalo
+    assert validator.report(start + 6.0) is None  # Sin errores
+    check(validator, partes(c7='91'))
+    validator.count(TRAMA, 3)
+    text = validator.report(start + 12.0)
+    assert "4 rechazados" in text and "rango=1" in text and "trama=3" in text
+    assert "lat(rango) x1" in text
+    # Lo ya reportado no se repite
+    assert validator.report(start + 20.0) is None
+    assert validator.rejected == 4
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# tests/test_vehicle.py
+
+import pytest
+from PySide6.QtCore import QCoreApplication
+
+from core.vehicle import VehicleLink, log_name
+
+
+@pytest.fixture(scope='module')
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def connect_and_stop(vehicle: VehicleLink, port_2: str):
+    vehicle.port, vehicle.port_2, vehicle.baud = "gs_no_existe_0", port_2, "115200"
+    vehicle.start()
+    vehicle.request_connection()
+    # stop() invoca en cola bloqueante: lo pedido antes ya se procesó
+    vehicle.stop()
+
+
+def test_un_solo_puerto_sin_merger(app):
+    vehicle = VehicleLink("Booster")
+    connect_and_stop(vehicle, "")
+    assert vehicle.worker.merger is None
+    assert not vehicle.diversity
+
+
+def test_segundo_puerto_activa_la_combinacion(app):
+    vehicle = VehicleLink("Carga útil")
+    connect_and_stop(vehicle, "gs_no_existe_1")
+    assert vehicle.worker.merger is not None
+    assert vehicle.diversity
+
+
+def test_log_name():
+    assert log_name("Carga útil") == "carga_util"
+    assert log_name("") == ""
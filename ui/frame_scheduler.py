@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# ui/frame_scheduler.py
+
+import time
+
+from PySide6.QtCore import QObject, QTimer, Qt
+
+from core.latency import LatencyHistogram
+
+
+class FrameTask:
+    """Una actualización periódica de la GUI registrada en el FrameScheduler."""
+
+    __slots__ = ('name', 'callback', 'period', 'heavy', 'active', 'next_due', 'runs', 'last_ms', 'max_ms')
+
+    def __init__(self, name: str, callback, period_ms: int, heavy: bool):
+        self.name = name
+        self.callback = callback
+        self.period = period_ms / 1000.0
+        self.heavy = heavy
+        self.active = False
+        self.next_due = 0.0
+        self.runs = 0
+        self.last_ms = 0.0
+        self.max_ms = 0.0
+
+
+class FrameScheduler(QObject):
+    """
+    Un solo timer para todas las actualizaciones de la GUI.
+
+    En cada cuadro se ejecutan juntas las tareas a las que ya les toca, de
+    la más atrasada a la más reciente, hasta agotar el presupuesto del
+    cuadro; lo que no alcanza pasa al siguiente. Las tareas pesadas (mapa,
+    gráficas) van de una en una por cuadro para que nunca se amontonen.
+
+    Una tarea devuelve False si no tenía nada nuevo: queda dormida hasta
+    que wake() la despierte. Sin tareas activas el timer se detiene.
+    """
+
+    def __init__(self, frame_ms: int = 16, budget_ms: float = 8.0, parent=None):
+        super().__init__(parent)
+        self.frame_ms = frame_ms
+        self.budget = budget_ms / 1000.0
+        self.tasks = {}
+
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.setInterval(frame_ms)
+        self.timer.timeout.connect(self.run_frame)
+
+        # Estadísticas
+        self.frame_times = LatencyHistogram()      # Duración de cada cuadro
+        self.frame_intervals = LatencyHistogram()  # Tiempo entre cuadros
+        self.frames = 0
+        self.over_budget = 0
+        self.deferred = 0
+        self._last_frame = 0.0
+
+    def add_task(self, name: str, callback, period_ms: int, heavy: bool = False):
+        self.tasks[name] = FrameTask(name, callback, period_ms, heavy)
+
+    def wake(self, *names):
+        """Despierta tareas dormidas; su primera ejecución es en el siguiente cuadro."""
+        now = time.perf_counter()
+        for name in names:
+            task = self.tasks[name]
+            if not task.active:
+                task.active = True
+                task.next_due = now
+        if not self.timer.isActive():
+            self._last_frame = 0.0
+            self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+        for task in self.tasks.values():
+            task.active = False
+
+    def run_frame(self):
+        start = time.perf_counter()
+        if self._last_frame:
+            self.frame_intervals.record(int((start - self._last_frame) * 1e9))
+        self._last_frame = start
+
+        due = sorted(
+            (t for t in self.tasks.values() if t.active and t.next_due <= start),
+            key=lambda t: t.next_due
+        )
+        heavy_done = False
+        ran = 0
+        for task in due:
+            elapsed = time.perf_counter() - start
+            if ran and (elapsed >= self.budget or (task.heavy and heavy_done)):
+                self.deferred += 1  # Conserva su next_due: va primero en el siguiente cuadro
+                continue
+
+            t0 = time.perf_counter()
+            changed = task.callback()
+            task.last_ms = (time.perf_counter() - t0) * 1000.0
+            task.max_ms = max(task.max_ms, task.last_ms)
+            task.runs += 1
+            ran += 1
+            heavy_done = heavy_done or task.heavy
+
+            if changed is False:
+                task.active = False
+            else:
+                # Fase fija respecto al primer disparo: sin deriva acumulada
+                task.next_due += task.period
+                if task.next_due <= start:
+                    task.next_due = start + task.period
+
+        frame_time = time.perf_counter() - start
+        if ran:
+            self.frames += 1
+            self.frame_times.record(int(frame_time * 1e9))
+            if frame_time > self.budget:
+                self.over_budget += 1
+
+        if not any(t.active for t in self.tasks.values()):
+            self.timer.stop()
+
+    def stats(self) -> dict:
+        return {
+            'running': self.timer.isActive(),
+            'frames': self.frames,
+            'over_budget': self.over_budget,
+            'deferred': self.deferred,
+            'frame_ms': self.frame_times.summary(),
+            'interval_ms': self.frame_intervals.summary(),
+            'tasks': {
+                name: {'active': t.active, 'runs': t.runs, 'last_ms': t.last_ms, 'max_ms': t.max_ms}
+                for name, t in self.tasks.items()
+            },
+        }
+
+    def format_report(self) -> str:
+        s = self.stats()
+        f, i = s['frame_ms'], s['interval_ms']
+        lines = [
+            f"cuadros={s['frames']} sobre_presupuesto={s['over_budget']} diferidas={s['deferred']}"
+            f" activo={'sí' if s['running'] else 'no'}",
+            f"{'cuadro':<22}{f['count']:>8}{f['p50_ms']:>10.2f}{f['p99_ms']:>10.2f}{f['max_ms']:>10.2f}",
+            f"{'intervalo':<22}{i['count']:>8}{i['p50_ms']:>10.2f}{i['p99_ms']:>10.2f}{i['max_ms']:>10.2f}",
+        ]
+        for name, t in s['tasks'].items():
+            lines.append(f"  {name:<20}{t['runs']:>8}{t['last_ms']:>10.2f}{'':>10}{t['max_ms']:>10.2f}")
+        return '\n'.join(lines)
@@ -8,12 +8,15 @@
 from PySide6.QtWidgets import (
     QMainWindow, QToolBar, QWidget, 
     QHBoxLayout, QVBoxLayout,
-    QLabel, QComboBox, QLineEdit
+    QLabel, QComboBox, QLineEdit, QFileDialog
 )
-from PySide6.QtGui import QAction
-from PySide6.QtCore import Slot, QSize, Qt, Signal, QTimer
+from PySide6.QtGui import QAction, QKeySequence, QShortcut
+from PySide6.QtCore import Slot, QSize, Qt, Signal, QTimer, QEvent
+
+from core.packet_schema import ETAPAS, TelemetryRecord
 
 # Importar tus módulos de UI
+from ui.frame_scheduler import FrameScheduler
 from ui.theme import PALETTE
 from ui.widgets.panel_superior import PanelSuperior
 from ui.widgets.panel_gps import PanelGPS
@@ -27,102 +30,193 @@ from ui.widgets.panel_calidad_aire import PanelCalidadAire
 
 class GroundStation(QMainWindow):
 
-    # Señales para el Controlador
-    conexion_solicitada = Signal(str, int)
-    desconexion_solicitada = Signal()
+    # Señales para el Controlador (las de cada enlace están en su VehicleLink)
     actualizar_puertos_solicitado = Signal()
-    comando_solicitado = Signal(str)
     
-    def __init__(self):
+    def __init__(self, vehicles: list):
         super().__init__()
-        self.setWindowTitle("Estación Terrena")
+        # Vehículos (core.vehicle.VehicleLink), cada uno con su worker e hilo;
+        # la ventana muestra uno a la vez y los demás siguen grabando
+        self.vehicles = list(vehicles)
+        self.vehicle = self.vehicles[0]
+        # Snapshot del vehículo mostrado: último valor de cada grupo
+        self.snapshot = self.vehicle.snapshot
+        # LatencyTracker del vehículo mostrado (opcional)
+        self.latency = self.vehicle.latency
+        self.update_title()
         self.setGeometry(100, 100, 1800, 950) 
         
-        # Buffer de datos para la actualización por Timers
-        self.data_store = {
-            'cinematica': None,
-            'visor_3d': None,
-            'gps': None,
-            'altimetro': None,
-            'graficas': None,
-            'calidad_aire': None,
-            'baterias': None,
-            'paquetes': None,
-            'estados': None
-        }
+        # Generación de cada grupo ya dibujada / ya avisada
+        self._rendered = {}
+        self._notified = {}
+        self._gps_last_count = 0
 
         self.setup_toolbar()
         self.setup_central_widget()
-        self.setup_ui_timers()
-
-    def setup_ui_timers(self):
-        # 30 Hz -> Visor 3D
-        self.timer_30hz = QTimer(self)
-        self.timer_30hz.timeout.connect(self.update_ui_30hz)
-        self.timer_30hz.start(33)
-
-        # 20 Hz -> Cinemática, Altimetro, Paquetes
-        self.timer_20hz = QTimer(self)
-        self.timer_20hz.timeout.connect(self.update_ui_20hz)
-        self.timer_20hz.start(50)
-
-        # 0.5s -> Gráficas
-        self.timer_05s = QTimer(self)
-        self.timer_05s.timeout.connect(self.update_ui_05s)
-        self.timer_05s.start(500)
-
-        # 5s -> GPS, Textos lentos
-        self.timer_5s = QTimer(self)
-        self.timer_5s.timeout.connect(self.update_ui_5s)
-        self.timer_5s.start(5000)
-
-    # --- SLOTS DE DATOS (Solo guardan) ---
-    @Slot(dict)
-    def on_cinematica_updated(self, data: dict): self.data_store['cinematica'] = data
-    @Slot(float, float, float)
-    def on_visor_3d_updated(self, p, y, r): self.data_store['visor_3d'] = (p, y, r)
-    @Slot(dict)
-    def on_gps_data_updated(self, data: dict): self.data_store['gps'] = data
-    @Slot(int)
-    def on_altimetro_data_updated(self, alt): self.data_store['altimetro'] = alt
-    @Slot(dict)
-    def on_graficas_data_updated(self, data: dict): self.data_store['graficas'] = data
-    @Slot(dict)
-    def on_calidad_aire_updated(self, data: dict): self.data_store['calidad_aire'] = data
-    @Slot(int, int)
-    def on_baterias_data_updated(self, bc, bcam): self.data_store['baterias'] = (bc, bcam)
-    @Slot(int, int)
-    def on_paquetes_data_updated(self, r, l): self.data_store['paquetes'] = (r, l)
-    @Slot(dict)
-    def on_estados_data_updated(self, data: dict): self.data_store['estados'] = data
-
-    # --- ACTUALIZACIÓN UI ---
-    def update_ui_30hz(self):
-        if self.data_store['visor_3d']:
-            self.panel_visor_3d.update_rotation(*self.data_store['visor_3d'])
-
-    def update_ui_20hz(self):
-        if self.data_store['cinematica']: self.panel_cinematica.update_cinematica(self.data_store['cinematica'])
-        if self.data_store['altimetro'] is not None: self.panel_altimetro.update_altitud(self.data_store['altimetro'])
-        if self.data_store['paquetes']: self.panel_inferior.update_packet_summary(*self.data_store['paquetes'])
-
-    def update_ui_05s(self):
-        dg = self.data_store['graficas']
-        if dg and 'time' in dg:
-            self.panel_graficas.update_pressure_graph(dg['time'], dg['pres'])
-            self.panel_graficas.update_temp_graph(dg['time'], dg['temp'])
-            if dg['pres']: self.panel_graficas.update_pressure_label(f"Presión: {dg['pres'][-1]:.2f} KPa")
-            if dg['temp']: self.panel_graficas.update_temp_label(f"Temperatura: {dg['temp'][-1]:.2f} °C")
-        
-        da = self.data_store['calidad_aire']
-        if da and 'time' in da:
-            self.panel_calidad_aire.update_gases_graph(da['time'], da['co2'], da['tvoc'])
-            self.panel_calidad_aire.update_humidity_graph(da['time'], da['hum'])
+        self.setup_frame_scheduler()
+        self.setup_latency_overlay()
+
+        for vehicle in self.vehicles:
+            vehicle.status_update.connect(self.on_connection_status)
+            vehicle.receiver_status.connect(self.on_receiver_status)
+            vehicle.snapshot_updated.connect(self.on_snapshot_updated)
+            vehicle.flight_event.connect(self.on_flight_event)
+
+    def setup_frame_scheduler(self):
+        # Un solo timer para toda la GUI. Cada tarea redibuja sus grupos del
+        # snapshot; sin datos nuevos se duerme y on_snapshot_updated la despierta.
+        self.scheduler = FrameScheduler(frame_ms=16, budget_ms=8.0, parent=self)
+
+        # (nombre, periodo ms, pesada, grupos del snapshot, función)
+        self.ui_tasks = [
+            ('visor_3d', 33, False, ('visor_3d',), self.update_visor_3d),                              # 30 Hz
+            ('rapida', 50, False, ('cinematica', 'altimetro', 'paquetes', 'vuelo'), self.update_rapida),  # 20 Hz
+            ('graficas', 500, True, ('graficas',), self.update_graficas),                             # 2 Hz
+            ('calidad_aire', 500, True, ('calidad_aire',), self.update_calidad_aire),                 # 2 Hz
+            ('gps', 500, False, ('gps', 'aterrizaje'), self.update_gps),                              # 2 Hz (JS, ligero)
+            ('lenta', 5000, False, ('baterias', 'estados'), self.update_lenta),                       # 0.2 Hz
+        ]
+        for name, period, heavy, _, update in self.ui_tasks:
+            self.scheduler.add_task(name, update, period, heavy)
+
+        # Log de mensajes: lo encolado se escribe una vez por cuadro
+        self.scheduler.add_task('mensajes', self.panel_inferior.flush_log, self.scheduler.frame_ms)
+        self.panel_inferior.log_pending.connect(lambda: self.scheduler.wake('mensajes'))
+
+    def setup_latency_overlay(self):
+        # Capa de depuración con las latencias por etapa (F12)
+        self.latency_overlay = QLabel(self)
+        self.latency_overlay.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.latency_overlay.setStyleSheet(
+            f"background-color: rgba(0, 0, 0, 190); color: {PALETTE['TEXT']['PRIMARY']}; "
+            "font-family: monospace; font-size: 11px; padding: 6px;"
+        )
+        self.latency_overlay.hide()
+        self.timer_overlay = QTimer(self)
+        self.timer_overlay.timeout.connect(self.update_latency_overlay)
+        self.shortcut_overlay = QShortcut(QKeySequence(Qt.Key.Key_F12), self)
+        self.shortcut_overlay.activated.connect(self.toggle_latency_overlay)
+
+    @Slot()
+    def toggle_latency_overlay(self):
+        if self.latency_overlay.isVisible():
+            self.timer_overlay.stop()
+            self.latency_overlay.hide()
+            return
+        self.update_latency_overlay()
+        self.latency_overlay.show()
+        self.latency_overlay.raise_()
+        self.timer_overlay.start(500)
+
+    def update_latency_overlay(self):
+        if self.latency:
+            text = self.latency.format_report()
+        else:
+            text = "Medición de latencia desactivada."
+        text += "\n\n" + self.scheduler.format_report()
+        self.latency_overlay.setText(text)
+        self.latency_overlay.adjustSize()
+        self.latency_overlay.move(10, 10)
+
+    def event(self, event):
+        handled = super().event(event)
+        # UpdateRequest: la ventana acaba de pintar su backing store
+        if self.latency and event.type() == QEvent.Type.UpdateRequest:
+            self.latency.painted()
+        return handled
+
+    def _applied(self, *groups):
+        if self.latency:
+            for group in groups: self.latency.applied(group)
+
+    # --- AVISO DEL SNAPSHOT ---
+    @Slot(object)
+    def on_snapshot_updated(self, vehicle):
+        vehicle.snapshot.acknowledge()
+        if vehicle is not self.vehicle:
+            return  # Solo se dibuja el vehículo mostrado
+        generations = self.snapshot.generations()
+        if self.latency:
+            for group, gen in generations.items():
+                if gen != self._notified.get(group, 0):
+                    self._notified[group] = gen
+                    self.latency.stored(group)
+        # Despertar las tareas con grupos nuevos (se dibujan en el siguiente cuadro)
+        self.scheduler.wake(*[
+            name for name, _, _, groups, _ in self.ui_tasks
+            if any(generations[g] != self._rendered.get(g, 0) for g in groups)
+        ])
+
+    # --- Registro -> dict que espera cada panel ---
+    @staticmethod
+    def cinematica_dict(rec: TelemetryRecord) -> dict:
+        return {'ax': rec.ax, 'ay': rec.ay, 'az': rec.az, 'vel': rec.velocidad_z,
+                'sigma_vel': rec.sigma_vz, 'yaw': rec.compass}
+
+    @staticmethod
+    def gps_dict(rec: TelemetryRecord) -> dict:
+        return {'location': [rec.lat, rec.lon], 'start_time': rec.hora_gps, 'flight_time': rec.t_mision}
+
+    @staticmethod
+    def estados_dict(rec: TelemetryRecord) -> dict:
+        return {
+            'etapa': ETAPAS.get(rec.etapa_id, "DESCONOCIDO"),
+            'lanzamiento': rec.led_lanz, 'carga1': rec.led_p1,
+            'carga2': rec.led_p2, 'carga3': rec.led_p3,
+            'camara': rec.led_cam, 'sd': rec.led_sd
+        }
+
+    # --- ACTUALIZACIÓN UI (solo grupos con generación nueva) ---
+    # Devuelven False si no había nada nuevo (la tarea se duerme).
+    def update_visor_3d(self) -> bool:
+        changed = self.snapshot.changed(self._rendered, ('visor_3d',))
+        if 'visor_3d' in changed:
+            self.panel_visor_3d.update_rotation(*changed['visor_3d'])
+            self._applied('visor_3d')
+        return bool(changed)
+
+    def update_rapida(self) -> bool:
+        changed = self.snapshot.changed(self._rendered, ('cinematica', 'altimetro', 'paquetes', 'vuelo'))
+        if 'cinematica' in changed: self.panel_cinematica.update_cinematica(self.cinematica_dict(changed['cinematica'])); self._applied('cinematica')
+        if 'altimetro' in changed: self.panel_altimetro.update_altitud(changed['altimetro']); self._applied('altimetro')
+        if 'paquetes' in changed: self.panel_inferior.update_packet_summary(*changed['paquetes']); self._applied('paquetes')
+        if 'vuelo' in changed: self.panel_estados.update_vuelo(changed['vuelo']); self._applied('vuelo')
+        return bool(changed)
+
+    def update_graficas(self) -> bool:
+        changed = self.snapshot.changed(self._rendered, ('graficas',))
+        dg = changed.get('graficas')
+        if dg and dg['history'] is not None:
+            self.panel_graficas.update_history(dg['history'], dg['time'])
+            self.panel_graficas.update_pressure_label(f"Presión: {dg['pres']:.2f} KPa")
+            self.panel_graficas.update_temp_label(f"Temperatura: {dg['temp']:.2f} °C")
+            self._applied('graficas')
+        return bool(changed)
+
+    def update_calidad_aire(self) -> bool:
+        changed = self.snapshot.changed(self._rendered, ('calidad_aire',))
+        da = changed.get('calidad_aire')
+        if da and da['history'] is not None:
+            self.panel_calidad_aire.update_history(da['history'], da['time'])
+            self._applied('calidad_aire')
+        return bool(changed)
 
-    def update_ui_5s(self):
-        if self.data_store['gps']: self.panel_gps.update_data(self.data_store['gps'])
-        if self.data_store['baterias']: self.panel_inferior.update_bateria_cohete(self.data_store['baterias'][0]); self.panel_inferior.update_bateria_camara(self.data_store['baterias'][1])
-        if self.data_store['estados']: self.panel_estados.update_data(self.data_store['estados'])
+    def update_gps(self) -> bool:
+        changed = self.snapshot.changed(self._rendered, ('gps', 'aterrizaje'))
+        rec = changed.get('gps')
+        if rec:
+            # Contador GS menor: nueva conexión o reproducción, se borra la trayectoria
+            if rec.gs_packet_count < self._gps_last_count: self.panel_gps.clear_track()
+            self._gps_last_count = rec.gs_packet_count
+            self.panel_gps.update_data(self.gps_dict(rec)); self._applied('gps')
+        if 'aterrizaje' in changed: self.panel_gps.update_landing(changed['aterrizaje']); self._applied('aterrizaje')
+        return bool(changed)
+
+    def update_lenta(self) -> bool:
+        changed = self.snapshot.changed(self._rendered, ('baterias', 'estados'))
+        if 'baterias' in changed: self.panel_inferior.update_bateria_cohete(changed['baterias'][0]); self.panel_inferior.update_bateria_camara(changed['baterias'][1]); self._applied('baterias')
+        if 'estados' in changed: self.panel_estados.update_data(self.estados_dict(changed['estados'])); self._applied('estados')
+        return bool(changed)
 
     # --- CONFIGURACIÓN UI ---
     def setup_central_widget(self):
@@ -183,12 +277,21 @@ class GroundStation(QMainWindow):
         self.addToolBar(Qt.ToolBarArea.BottomToolBarArea, self.toolbar)
         self.toolbar.setFloatable(False); self.toolbar.setMovable(False)
         
+        label_vehiculo = QLabel("Vehículo: ")
+        self.vehiculo_opts = QComboBox()
+        self.vehiculo_opts.addItems([vehicle.name for vehicle in self.vehicles])
+        self.vehiculo_opts.currentIndexChanged.connect(self.on_vehiculo_cambiado)
+
         label_baud = QLabel("Baudrate: ")
         self.baud_opts = QComboBox()
         self.baud_opts.addItems(['9600', '19200', '31250', '38400', '57600', '74880', '115200', '230400', '250000', '460800', '500000', '921600', '1000000', '2000000'])
         self.baud_opts.setCurrentText("115200")
         self.serial_opts = QComboBox() 
         label_serial = QLabel("Puertos Disponibles: ") 
+        # Receptor redundante (diversidad): vacío = solo un receptor
+        label_receptor2 = QLabel("Receptor 2: ")
+        self.serial_opts_2 = QComboBox()
+        self.serial_opts_2.setToolTip("Segundo radio escuchando al mismo vehículo (opcional)")
         label_canal = QLabel("Canal: ") 
         self.canal = QLineEdit(); self.canal.setFixedWidth(60) 
         
@@ -200,6 +303,11 @@ class GroundStation(QMainWindow):
         self.boton_calib_altura = QAction("Calibrar Altura")
         self.boton_tiempo_vuelo = QAction("Comenzar Tiempo de Vuelo")
         self.boton_act_canal = QAction("Actualizar Canal")
+        self.boton_reproducir = QAction("Reproducir Log")
+        self.boton_detener_rep = QAction("Detener Reproducción")
+        label_velocidad = QLabel("Velocidad: ")
+        self.velocidad_opts = QComboBox()
+        self.velocidad_opts.addItems(['1x', '2x', '5x', '10x', 'Máx'])
         
         self.boton_conec_ser.setEnabled(False)
         self.boton_descon.setEnabled(False)
@@ -213,13 +321,21 @@ class GroundStation(QMainWindow):
         self.boton_calib_altura.triggered.connect(self.on_calib_altura_click)
         self.boton_tiempo_vuelo.triggered.connect(self.on_tiempo_vuelo_click)
         self.boton_act_canal.triggered.connect(self.on_actualizar_canal_click)
+        self.boton_reproducir.triggered.connect(self.on_reproducir_click)
+        self.boton_detener_rep.triggered.connect(self.on_detener_reproduccion_click)
 
+        if len(self.vehicles) > 1:
+            self.toolbar.addWidget(label_vehiculo)
+            self.toolbar.addWidget(self.vehiculo_opts)
+            self.toolbar.addSeparator()
         self.toolbar.addAction(self.boton_actualizar)
         self.toolbar.addSeparator()
         self.toolbar.addWidget(label_serial)
         self.toolbar.addWidget(self.serial_opts)
         self.toolbar.addWidget(label_baud)
         self.toolbar.addWidget(self.baud_opts)
+        self.toolbar.addWidget(label_receptor2)
+        self.toolbar.addWidget(self.serial_opts_2)
         self.toolbar.addAction(self.boton_conec_ser)
         self.toolbar.addAction(self.boton_descon)
         self.toolbar.addSeparator()
@@ -232,18 +348,36 @@ class GroundStation(QMainWindow):
         self.toolbar.addSeparator()
         self.toolbar.addAction(self.boton_calib_altura)
         self.toolbar.addAction(self.boton_tiempo_vuelo)
+        self.toolbar.addSeparator()
+        self.toolbar.addAction(self.boton_reproducir)
+        self.toolbar.addWidget(label_velocidad)
+        self.toolbar.addWidget(self.velocidad_opts)
+        self.toolbar.addAction(self.boton_detener_rep)
     
     # --- SLOTS DE BOTONES ---
     @Slot()
-    def on_calib_altura_click(self): self.comando_solicitado.emit("66\n")
+    def on_calib_altura_click(self): self.vehicle.comando_solicitado.emit("66\n")
     @Slot()
-    def on_tiempo_vuelo_click(self): self.comando_solicitado.emit("30\n"); self.boton_tiempo_vuelo.setEnabled(False)
+    def on_tiempo_vuelo_click(self): self.vehicle.comando_solicitado.emit("30\n"); self.vehicle.flight_timer = True; self.boton_tiempo_vuelo.setEnabled(False)
     @Slot()
     def on_actualizar_canal_click(self):
         if not self.canal.text().isdigit() or not (0 <= int(self.canal.text()) <= 126):
             self.panel_inferior.add_log_message("Canal inválido.", "danger"); return
-        self.comando_solicitado.emit(f"{self.canal.text()}\n")
-        self.panel_inferior.add_log_message(f"Canal {self.canal.text()}...", "info")
+        self.vehicle.comando_solicitado.emit(f"{self.canal.text()}\n")
+        self.log(self.vehicle, f"Canal {self.canal.text()}...", "info")
+
+    @Slot()
+    def on_reproducir_click(self):
+        if self.vehicle.connected:
+            self.panel_inferior.add_log_message("Desconecte el puerto antes de reproducir.", "danger"); return
+        path, _ = QFileDialog.getOpenFileName(self, "Reproducir log de vuelo", "", "Logs de vuelo (log_vuelo_*.csv);;CSV (*.csv)")
+        if not path: return
+        texto = self.velocidad_opts.currentText()
+        speed = 0.0 if texto == 'Máx' else float(texto.rstrip('x'))
+        self.vehicle.reproduccion_solicitada.emit(path, speed)
+
+    @Slot()
+    def on_detener_reproduccion_click(self): self.vehicle.detener_reproduccion_solicitada.emit()
 
     @Slot(list)
     def update_port_list(self, ports: list):
@@ -251,47 +385,112 @@ class GroundStation(QMainWindow):
         self.serial_opts.clear()
         self.serial_opts.addItems(ports)
         if cur in ports: self.serial_opts.setCurrentText(cur)
+        cur_2 = self.serial_opts_2.currentText()
+        self.serial_opts_2.clear()
+        self.serial_opts_2.addItems([""] + ports)
+        if cur_2 in ports: self.serial_opts_2.setCurrentText(cur_2)
         if not self.boton_descon.isEnabled(): self.boton_conec_ser.setEnabled(len(ports) > 0)
 
     @Slot()
     def on_conectar_click(self):
-        if not self.serial_opts.currentText(): return
-        self.conexion_solicitada.emit(self.serial_opts.currentText(), int(self.baud_opts.currentText()))
-        self.boton_conec_ser.setEnabled(False)
-        self.boton_actualizar.setEnabled(False)
-        self.serial_opts.setEnabled(False)
-        self.baud_opts.setEnabled(False)
-        self.boton_descon.setEnabled(True)
+        port = self.serial_opts.currentText()
+        if not port: return
+        # Un puerto solo puede pertenecer a un vehículo
+        for other in self.vehicles:
+            if other is not self.vehicle and other.connected and port in (other.port, other.port_2):
+                self.panel_inferior.add_log_message(f"{port} ya está en uso por {other.name}.", "danger"); return
+        vehicle = self.vehicle
+        port_2 = self.serial_opts_2.currentText()
+        vehicle.port = port
+        vehicle.port_2 = port_2 if port_2 != port else ""
+        vehicle.baud = self.baud_opts.currentText()
+        vehicle.request_connection()
+        vehicle.connected = True
+        self.sync_toolbar()
 
     @Slot()
     def on_desconectar_click(self):
-        self.desconexion_solicitada.emit()
-        self.boton_conec_ser.setEnabled(self.serial_opts.count() > 0)
-        self.boton_actualizar.setEnabled(True)
-        self.serial_opts.setEnabled(True)
-        self.baud_opts.setEnabled(True)
-        self.boton_descon.setEnabled(False)
-        self.boton_calib_altura.setEnabled(False)
-        self.boton_tiempo_vuelo.setEnabled(False)
-        self.boton_act_canal.setEnabled(False)
+        self.disconnect_vehicle(self.vehicle)
+
+    def disconnect_vehicle(self, vehicle):
+        vehicle.desconexion_solicitada.emit()
+        vehicle.connected = vehicle.online = False
+        if vehicle is self.vehicle: self.sync_toolbar()
+
+    def sync_toolbar(self):
+        """Habilita los controles según la conexión del vehículo mostrado."""
+        vehicle = self.vehicle
+        libre = not vehicle.connected
+        self.boton_conec_ser.setEnabled(libre and self.serial_opts.count() > 0)
+        self.boton_actualizar.setEnabled(libre)
+        self.serial_opts.setEnabled(libre)
+        self.serial_opts_2.setEnabled(libre)
+        self.baud_opts.setEnabled(libre)
+        self.boton_descon.setEnabled(vehicle.connected)
+        self.boton_calib_altura.setEnabled(vehicle.online)
+        self.boton_tiempo_vuelo.setEnabled(vehicle.online and not vehicle.flight_timer)
+        self.boton_act_canal.setEnabled(vehicle.online)
+
+    def update_title(self):
+        title = "Estación Terrena"
+        self.setWindowTitle(f"{title} - {self.vehicle.name}" if len(self.vehicles) > 1 else title)
+
+    @Slot(int)
+    def on_vehiculo_cambiado(self, index: int):
+        """Muestra otro vehículo: todos los paneles se redibujan desde su snapshot."""
+        if index < 0 or self.vehicles[index] is self.vehicle: return
+        vehicle = self.vehicle = self.vehicles[index]
+        self.snapshot = vehicle.snapshot
+        self.latency = vehicle.latency
+        if self.latency: self.latency.clear_pending()
+        self._rendered = {}
+        self._notified = {}
+        self._gps_last_count = 0
+        self.panel_gps.clear_track()
+        self.panel_estados.set_flight_events(vehicle.events)
+        if vehicle.connected:
+            self.serial_opts.setCurrentText(vehicle.port)
+            self.serial_opts_2.setCurrentText(vehicle.port_2)
+            self.baud_opts.setCurrentText(vehicle.baud)
+        self.sync_toolbar()
+        self.update_title()
+        self.scheduler.wake(*[name for name, _, _, _, _ in self.ui_tasks])
+
+    def log(self, vehicle, message: str, status_type: str):
+        """Mensaje al log; con varios vehículos lleva el nombre del de origen."""
+        if len(self.vehicles) > 1:
+            message = f"[{vehicle.name}] {message}"
+        self.panel_inferior.add_log_message(message, status_type)
+
+    @Slot(object, object)
+    def on_flight_event(self, vehicle, event):
+        """Evento de vuelo detectado por la estación (llega en cuanto ocurre)."""
+        if vehicle is self.vehicle:
+            self.panel_estados.add_flight_event(event)
+
+    @Slot(object, str, str)
+    def on_receiver_status(self, vehicle, message: str, status_type: str):
+        """Estado del receptor de diversidad: solo se registra (no cambia la conexión principal)."""
+        self.log(vehicle, f"[Receptor 2] {message}", status_type)
 
     # --- ¡AQUÍ ESTÁ LA CORRECCIÓN! ---
-    @Slot(str, str)
-    def on_connection_status(self, message: str, status_type: str):
+    @Slot(object, str, str)
+    def on_connection_status(self, vehicle, message: str, status_type: str):
         """Recibe el estado. SOLO desconecta si es manual o físico."""
-        self.panel_inferior.add_log_message(message, status_type)
+        self.log(vehicle, message, status_type)
         
         if status_type == "success":
-            self.boton_calib_altura.setEnabled(True)
-            self.boton_tiempo_vuelo.setEnabled(True)
-            self.boton_act_canal.setEnabled(True)
+            vehicle.online = True
+            vehicle.flight_timer = False
+            if vehicle is self.vehicle: self.sync_toolbar()
             
         # Lógica estricta: Solo desconectar UI si el mensaje es de desconexión
         elif message == "Desconectado." or "Puerto desconectado" in message:
-            self.on_desconectar_click()
+            self.disconnect_vehicle(vehicle)
             
         # Otros errores "danger" (parseo, etc.) NO entran aquí y no desconectan.
 
     def closeEvent(self, event):
-        self.desconexion_solicitada.emit() 
+        for vehicle in self.vehicles:
+            vehicle.desconexion_solicitada.emit()
         event.accept()
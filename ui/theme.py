@@ -118,13 +118,13 @@ def get_stylesheet(font_family_name: str = "sans-serif") -> str:
         }}
         
         /* --- Entradas de texto y ComboBox --- */
-        QLineEdit, QTextEdit, QComboBox {{
+        QLineEdit, QTextEdit, QPlainTextEdit, QComboBox {{
             background-color: {PALETTE['BACKGROUND']['MAIN']};
             border: 1px solid {PALETTE['BORDER']['DEFAULT']};
             border-radius: 3px;
             padding: 5px;
         }}
-        QLineEdit:focus, QTextEdit:focus, QComboBox:focus {{
+        QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus, QComboBox:focus {{
             border-color: {PALETTE['ACCENT']['ACTIVE']};
         }}
         
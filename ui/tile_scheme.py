@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# ui/tile_scheme.py
+
+import base64
+
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice, QTimer, QUrl
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
+from PySide6.QtWebEngineCore import (
+    QWebEngineProfile, QWebEngineUrlRequestJob, QWebEngineUrlScheme, QWebEngineUrlSchemeHandler
+)
+
+from core.tile_cache import TILE_URL, USER_AGENT, asset_mime, tile_mime
+
+# gstiles://esri/{z}/{y}/{x}   -> tesela de la caché (o de internet si falta)
+# gstiles://asset/<url base64> -> JS/CSS de la página del mapa
+SCHEME = b"gstiles"
+TILE_TEMPLATE = "gstiles://esri/{z}/{y}/{x}"
+# Tiempo máximo que una tesela nueva queda sin confirmar en la caché (ms)
+FLUSH_DELAY_MS = 2000
+
+
+def register_tile_scheme():
+    """Registra el esquema. Debe llamarse ANTES de crear QApplication."""
+    scheme = QWebEngineUrlScheme(SCHEME)
+    scheme.setSyntax(QWebEngineUrlScheme.Syntax.Host)
+    scheme.setFlags(
+        QWebEngineUrlScheme.Flag.SecureScheme
+        | QWebEngineUrlScheme.Flag.CorsEnabled
+        | QWebEngineUrlScheme.Flag.LocalAccessAllowed
+    )
+    QWebEngineUrlScheme.registerScheme(scheme)
+
+
+def tile_handler_installed() -> bool:
+    return QWebEngineProfile.defaultProfile().urlSchemeHandler(SCHEME) is not None
+
+
+def asset_url(url: str) -> str:
+    return "gstiles://asset/" + base64.urlsafe_b64encode(url.encode()).decode().rstrip('=')
+
+
+def _decode_asset(path: str) -> str:
+    key = path.strip('/')
+    return base64.urlsafe_b64decode(key + '=' * (-len(key) % 4)).decode()
+
+
+class TileSchemeHandler(QWebEngineUrlSchemeHandler):
+    """
+    Atiende gstiles:// desde la TileCache. Lo que falta se pide a internet
+    sin bloquear (QNetworkAccessManager) y se guarda; sin conexión la
+    petición simplemente falla y Leaflet deja la tesela vacía.
+
+    La caché confirma en grupo; un temporizador llama a flush() poco
+    después de la primera escritura pendiente, así el hilo de la GUI no
+    espera un commit por cada tesela mientras el mapa carga.
+    """
+
+    def __init__(self, cache, online: bool = True, parent=None):
+        super().__init__(parent)
+        self.cache = cache
+        self.online = online
+        self.network = QNetworkAccessManager(self)
+        self._pending = {}  # QNetworkReply -> (job, tipo, llave)
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(FLUSH_DELAY_MS)
+        self._flush_timer.timeout.connect(self.cache.flush)
+
+    def install(self, profile: QWebEngineProfile = None):
+        (profile or QWebEngineProfile.defaultProfile()).installUrlSchemeHandler(SCHEME, self)
+
+    def requestStarted(self, job: QWebEngineUrlRequestJob):
+        url = job.requestUrl()
+        host = url.host()
+        try:
+            if host == "asset":
+                source = _decode_asset(url.path())
+                found = self.cache.get_asset(source)
+                if found:
+                    self._reply(job, found[0], found[1])
+                else:
+                    self._fetch(job, source, ("asset", source))
+            elif host == "esri":
+                z, y, x = (int(p) for p in url.path().strip('/').split('/'))
+                data = self.cache.get(z, x, y)
+                if data is not None:
+                    self._schedule_flush()  # get() pudo actualizar la marca LRU
+                    self._reply(job, tile_mime(data), data)
+                else:
+                    self._fetch(job, TILE_URL.format(z=z, x=x, y=y), ("tile", (z, x, y)))
+            else:
+                job.fail(QWebEngineUrlRequestJob.Error.UrlNotFound)
+        except (ValueError, UnicodeDecodeError):
+            job.fail(QWebEngineUrlRequestJob.Error.UrlInvalid)
+
+    def _schedule_flush(self):
+        if self.cache.pending and not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _reply(self, job, mime: str, data: bytes):
+        buffer = QBuffer(job)  # Se libera junto con la petición
+        buffer.setData(QByteArray(data))
+        buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+        job.reply(mime.encode(), buffer)
+
+    def _fetch(self, job, source: str, key: tuple):
+        if not self.online:
+            job.fail(QWebEngineUrlRequestJob.Error.UrlNotFound)
+            return
+        request = QNetworkRequest(QUrl(source))
+        request.setHeader(QNetworkRequest.KnownHeaders.UserAgentHeader, USER_AGENT)
+        reply = self.network.get(request)
+        self._pending[reply] = (job, key)
+        # Si la página cancela la petición (zoom, cierre) se aborta la descarga
+        job.destroyed.connect(reply.abort)
+        reply.finished.connect(lambda: self._on_fetched(reply))
+
+    def _on_fetched(self, reply: QNetworkReply):
+        job, (kind, key) = self._pending.pop(reply)
+        reply.deleteLater()
+        if reply.error() == QNetworkReply.NetworkError.OperationCanceledError:
+            return  # La petición ya no existe
+        try:
+            job.destroyed.disconnect(reply.abort)
+        except (RuntimeError, TypeError):
+            pass
+        if reply.error() != QNetworkReply.NetworkError.NoError:
+            job.fail(QWebEngineUrlRequestJob.Error.RequestFailed)
+            return
+
+        data = reply.readAll().data()
+        if kind == "tile":
+            self.cache.put(*key, data)
+            mime = tile_mime(data)
+        else:
+            mime = asset_mime(key, reply.header(QNetworkRequest.KnownHeaders.ContentTypeHeader) or "")
+            self.cache.put_asset(key, mime, data)
+        self._schedule_flush()
+        self._reply(job, mime, data)
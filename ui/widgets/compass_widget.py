@@ -10,8 +10,8 @@ import os
 import math
 
 from PySide6.QtWidgets import QWidget
-from PySide6.QtGui import QPolygon, QPolygonF, QColor, QPen, QFont, QPainter, QFontMetrics, QConicalGradient, QRadialGradient, QFontDatabase
-from PySide6.QtCore import Qt, QTimer, QPoint, QPointF, QRect, QSize, QObject, Signal
+from PySide6.QtGui import QPolygon, QPolygonF, QColor, QPen, QFont, QPainter, QFontMetrics, QConicalGradient, QRadialGradient, QFontDatabase, QPixmap
+from PySide6.QtCore import Qt, QTimer, QPoint, QPointF, QRect, QSize, QObject, Signal, QEvent
 
 # (Asumiendo que tienes un módulo de log)
 def logInfo(self, msg):
@@ -30,6 +30,12 @@ class Compass(QWidget):
 
         self.use_timer_event = False 
 
+        # Capas estáticas (carátula y centro de la aguja) pintadas una sola vez
+        # en QPixmap; se regeneran al cambiar tamaño o estilo
+        self._paint_target = self
+        self._static_layer = None
+        self._center_layer = None
+
         # --- Tema Integrado ---
         TEXT_PRIMARY = QColor(PALETTE['TEXT']['PRIMARY'])
         TEXT_SECONDARY = QColor(PALETTE['TEXT']['SECONDARY'])
@@ -110,15 +116,25 @@ class Compass(QWidget):
         self.rescale_method()
 
     def setScaleFontFamily(self, font):
+        self.invalidate_static_layers()
         self.scale_fontname = str(font)
 
     def setValueFontFamily(self, font):
+        self.invalidate_static_layers()
         self.value_fontname = str(font)
 
+    def setUnits(self, units):
+        self.invalidate_static_layers()
+        self.units = units
+        if not self.use_timer_event:
+            self.update()
+
     def setBigScaleColor(self, color):
+        self.invalidate_static_layers()
         self.bigScaleMarker = QColor(color)     
 
     def setFineScaleColor(self, color):
+        self.invalidate_static_layers()
         self.fineScaleColor = QColor(color)     
 
     def setGaugeTheme(self, Theme = 1):
@@ -137,6 +153,7 @@ class Compass(QWidget):
         pass
 
     def rescale_method(self):
+        self.invalidate_static_layers()
         if self.width() <= self.height():
             self.widget_diameter = self.width()
         else:
@@ -168,6 +185,7 @@ class Compass(QWidget):
             self.update()
 
     def updateValue(self, value, mouse_controlled = False):
+        previous = self.value
         if value <= self.minValue:
             self.value = self.minValue
         elif value >= self.maxValue:
@@ -175,10 +193,12 @@ class Compass(QWidget):
         else:
             self.value = value
         self.valueChanged.emit(int(value))
-        if not self.use_timer_event:
+        # Mismo valor: la aguja no se mueve, no hay que repintar
+        if not self.use_timer_event and self.value != previous:
             self.update()
 
     def updateAngleOffset(self, offset):
+        self.invalidate_static_layers()
         self.angle_offset = offset
         if not self.use_timer_event:
             self.update()
@@ -201,16 +221,19 @@ class Compass(QWidget):
             self.update()
 
     def setScaleValueColor(self, R=50, G=50, B=50, Transparency=255):
+        self.invalidate_static_layers()
         self.ScaleValueColor = QColor(R, G, B, Transparency)
         if not self.use_timer_event:
             self.update()
 
     def setDisplayValueColor(self, R=50, G=50, B=50, Transparency=255):
+        self.invalidate_static_layers()
         self.DisplayValueColor = QColor(R, G, B, Transparency)
         if not self.use_timer_event:
             self.update()
 
     def set_CenterPointColor(self, R=50, G=50, B=50, Transparency=255):
+        self.invalidate_static_layers()
         self.CenterPointColor = QColor(R, G, B, Transparency)
         if not self.use_timer_event:
             self.update()
@@ -221,41 +244,49 @@ class Compass(QWidget):
             self.update()
 
     def setEnableScaleText(self, enable = True):
+        self.invalidate_static_layers()
         self.enable_scale_text = enable
         if not self.use_timer_event:
             self.update()
 
     def setEnableBarGraph(self, enable = True):
+        self.invalidate_static_layers()
         self.enableBarGraph = enable
         if not self.use_timer_event:
             self.update()
 
     def setEnableValueText(self, enable = True):
+        self.invalidate_static_layers()
         self.enable_value_text = enable
         if not self.use_timer_event:
             self.update()
 
     def setEnableCenterPoint(self, enable = True):
+        self.invalidate_static_layers()
         self.enable_CenterPoint = enable
         if not self.use_timer_event:
             self.update()
 
     def setEnableScalePolygon(self, enable = True):
+        self.invalidate_static_layers()
         self.enable_filled_Polygon = enable
         if not self.use_timer_event:
             self.update()
 
     def setEnableBigScaleGrid(self, enable = True):
+        self.invalidate_static_layers()
         self.enable_big_scaled_marker = enable
         if not self.use_timer_event:
             self.update()
 
     def setEnableFineScaleGrid(self, enable = True):
+        self.invalidate_static_layers()
         self.enable_fine_scaled_marker = enable
         if not self.use_timer_event:
             self.update()
 
     def setScalaCount(self, count):
+        self.invalidate_static_layers()
         if count < 1:
             count = 1
         self.scalaCount = count
@@ -263,6 +294,7 @@ class Compass(QWidget):
             self.update()
 
     def setMinValue(self, min):
+        self.invalidate_static_layers()
         if self.value < min:
             self.value = min
         if min >= self.maxValue:
@@ -273,6 +305,7 @@ class Compass(QWidget):
             self.update()
 
     def setMaxValue(self, max):
+        self.invalidate_static_layers()
         if self.value > max:
             self.value = max
         if max <= self.minValue:
@@ -283,26 +316,31 @@ class Compass(QWidget):
             self.update()
 
     def setScaleStartAngle(self, value):
+        self.invalidate_static_layers()
         self.scale_angle_start_value = value
         if not self.use_timer_event:
             self.update()
 
     def setTotalScaleAngleSize(self, value):
+        self.invalidate_static_layers()
         self.scale_angle_size = value
         if not self.use_timer_event:
             self.update()
 
     def setGaugeColorOuterRadiusFactor(self, value):
+        self.invalidate_static_layers()
         self.gauge_color_outer_radius_factor = float(value) / 1000
         if not self.use_timer_event:
             self.update()
 
     def setGaugeColorInnerRadiusFactor(self, value):
+        self.invalidate_static_layers()
         self.gauge_color_inner_radius_factor = float(value) / 1000
         if not self.use_timer_event:
             self.update()
 
     def set_scale_polygon_colors(self, color_array):
+        self.invalidate_static_layers()
         if 'list' in str(type(color_array)):
             self.scale_polygon_colors = color_array
         elif color_array == None:
@@ -338,7 +376,7 @@ class Compass(QWidget):
 
     def draw_filled_polygon(self, outline_pen_with=0):
         if not self.scale_polygon_colors == None:
-            painter_filled_polygon = QPainter(self)
+            painter_filled_polygon = QPainter(self._paint_target)
             painter_filled_polygon.setRenderHint(QPainter.Antialiasing)
             painter_filled_polygon.translate(self.width() / 2, self.height() / 2)
             painter_filled_polygon.setPen(Qt.NoPen)
@@ -361,7 +399,7 @@ class Compass(QWidget):
         pass
 
     def draw_big_scaled_marker(self):
-        my_painter = QPainter(self)
+        my_painter = QPainter(self._paint_target)
         my_painter.setRenderHint(QPainter.Antialiasing)
         my_painter.translate(self.width() / 2, self.height() / 2)
         self.pen = QPen(self.bigScaleMarker)
@@ -376,7 +414,7 @@ class Compass(QWidget):
             my_painter.rotate(steps_size)
 
     def create_scale_marker_values_text(self):
-        painter = QPainter(self)
+        painter = QPainter(self._paint_target)
         painter.setRenderHint(QPainter.Antialiasing)
         painter.translate(self.width() / 2, self.height() / 2)
         font = QFont(self.scale_fontname, self.scale_fontsize, QFont.Bold)
@@ -409,7 +447,7 @@ class Compass(QWidget):
             painter.drawText(text[0], text[1], text[2], text[3], text[4], text[5])
 
     def create_fine_scaled_marker(self):
-        my_painter = QPainter(self)
+        my_painter = QPainter(self._paint_target)
         my_painter.setRenderHint(QPainter.Antialiasing)
         my_painter.translate(self.width() / 2, self.height() / 2)
         my_painter.setPen(self.fineScaleColor)
@@ -422,7 +460,7 @@ class Compass(QWidget):
             my_painter.rotate(steps_size)
 
     def create_values_text(self):
-        painter = QPainter(self)
+        painter = QPainter(self._paint_target)
         try:
             painter.setRenderHint(QPainter.HighQualityAntialiasing)
         except AttributeError:
@@ -451,7 +489,7 @@ class Compass(QWidget):
         painter.drawText(text[0], text[1], text[2], text[3], text[4], text[5])
 
     def create_units_text(self):
-        painter = QPainter(self)
+        painter = QPainter(self._paint_target)
         try:
             painter.setRenderHint(QPainter.HighQualityAntialiasing)
         except AttributeError:
@@ -480,7 +518,7 @@ class Compass(QWidget):
         painter.drawText(text[0], text[1], text[2], text[3], text[4], text[5])
 
     def draw_big_needle_center_point(self, diameter=30):
-        painter = QPainter(self)
+        painter = QPainter(self._paint_target)
         painter.setRenderHint(QPainter.Antialiasing)
         painter.translate(self.width() / 2, self.height() / 2)
         painter.setPen(Qt.NoPen)
@@ -495,7 +533,7 @@ class Compass(QWidget):
         painter.drawPolygon(colored_scale_polygon)
 
     def draw_outer_circle(self, diameter=30):
-        painter = QPainter(self)
+        painter = QPainter(self._paint_target)
         painter.setRenderHint(QPainter.Antialiasing)
         painter.translate(self.width() / 2, self.height() / 2)
         painter.setPen(Qt.NoPen)
@@ -511,7 +549,7 @@ class Compass(QWidget):
         painter.drawPolygon(colored_scale_polygon)
 
     def draw_needle(self):
-        painter = QPainter(self)
+        painter = QPainter(self._paint_target)
         painter.setRenderHint(QPainter.Antialiasing)
         painter.translate(self.width() / 2, self.height() / 2)
         painter.setPen(Qt.NoPen)
@@ -521,7 +559,7 @@ class Compass(QWidget):
         painter.drawConvexPolygon(self.value_needle[0])
 
     def draw_needle_2(self):
-        painter = QPainter(self)
+        painter = QPainter(self._paint_target)
         painter.setRenderHint(QPainter.Antialiasing)
         painter.translate(self.width() / 2, self.height() / 2)
         painter.setPen(Qt.NoPen)
@@ -530,25 +568,67 @@ class Compass(QWidget):
                         (self.maxValue - self.minValue)) - 90 + self.scale_angle_start_value)
         painter.drawConvexPolygon(self.value_needle[0])
 
+    def invalidate_static_layers(self):
+        """Descarta las capas en caché; se vuelven a pintar en el siguiente paintEvent."""
+        self._static_layer = None
+        self._center_layer = None
+
+    def _render_layer(self, *draw_methods) -> QPixmap:
+        """Pinta los métodos dados sobre un QPixmap transparente del tamaño del widget."""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(max(1, round(self.width() * dpr)), max(1, round(self.height() * dpr)))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        self._paint_target = pixmap
+        try:
+            for draw in draw_methods:
+                draw()
+        finally:
+            self._paint_target = self
+        return pixmap
+
+    def build_static_layers(self):
+        """Carátula (círculo, escala, marcas, letras y unidades) y centro de la aguja."""
+        static = [self.draw_outer_circle, self.draw_icon_image]
+        # Con la barra proporcional al valor (enableBarGraph=False) el polígono cambia en cada valor
+        if self.enable_filled_Polygon and self.enableBarGraph:
+            static.append(self.draw_filled_polygon)
+        if self.enable_fine_scaled_marker:
+            static.append(self.create_fine_scaled_marker)
+        if self.enable_big_scaled_marker:
+            static.append(self.draw_big_scaled_marker)
+        if self.enable_scale_text:
+            static.append(self.create_scale_marker_values_text)
+        if self.enable_value_text:
+            static.append(self.create_units_text)
+        self._static_layer = self._render_layer(*static)
+        self._center_layer = self._render_layer(
+            lambda: self.draw_big_needle_center_point(diameter=(self.widget_diameter / 6))
+        ) if self.enable_CenterPoint else None
+
+    def changeEvent(self, event):
+        if event.type() in (QEvent.Type.StyleChange, QEvent.Type.PaletteChange, QEvent.Type.FontChange):
+            self.invalidate_static_layers()
+        super().changeEvent(event)
+
     def resizeEvent(self, event):
         self.rescale_method()
 
     def paintEvent(self, event):
-        self.draw_outer_circle()
-        self.draw_icon_image()
-        if self.enable_filled_Polygon:
+        if self._static_layer is None or self._static_layer.devicePixelRatio() != self.devicePixelRatioF():
+            self.build_static_layers()
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._static_layer)
+        painter.end()
+        # Solo la aguja y el texto del valor cambian con cada updateValue
+        if self.enable_filled_Polygon and not self.enableBarGraph:
             self.draw_filled_polygon()
-        if self.enable_fine_scaled_marker:
-            self.create_fine_scaled_marker()
-        if self.enable_big_scaled_marker:
-            self.draw_big_scaled_marker()
-        if self.enable_scale_text:
-            self.create_scale_marker_values_text()
         if self.enable_value_text:
             self.create_values_text()
-            self.create_units_text()
         if self.enable_Needle_Polygon:
             self.draw_needle()
             self.draw_needle_2()
-        if self.enable_CenterPoint:
-            self.draw_big_needle_center_point(diameter=(self.widget_diameter / 6))
+        if self._center_layer is not None:
+            painter = QPainter(self)
+            painter.drawPixmap(0, 0, self._center_layer)
+            painter.end()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# AÑO: 2025 CREADOR: Christian Yael Ramírez León
+
+# ui/widgets/history_plot.py
+
+import math
+
+import pyqtgraph as pg
+from PySide6.QtCore import Slot
+
+
+class HistoryPlot(pg.PlotWidget):
+    """
+    Gráfica del historial completo de la misión (core.mission_history).
+
+    Solo se dibuja el rango visible, decimado a ~1 par mínimo/máximo por
+    pixel, así se puede alejar hasta el vuelo completo sin que se alente.
+
+    Modos del eje X:
+      - "seguir": bloques de 15 s que avanzan con el tiempo (como antes).
+      - "completa": toda la misión.
+      - "manual": el operador hizo zoom o desplazó con el mouse.
+    Doble clic alterna entre "seguir" y "completa" (desde "manual" vuelve a
+    "seguir"). El eje Y se ajusta solo a lo visible.
+    """
+
+    SEGUIR = "seguir"
+    COMPLETA = "completa"
+    MANUAL = "manual"
+
+    def __init__(self, window_size: float = 15.0, parent=None):
+        super().__init__(parent)
+        self.window_size = window_size
+        self.mode = self.SEGUIR
+        self.history = None
+        self.current_time = 0.0
+        self._curves = []  # (curva, columna)
+        self._setting_range = False
+
+        item = self.getPlotItem()
+        item.setMenuEnabled(False)
+        item.hideButtons()
+        self.setXRange(0, window_size, padding=0)
+        self.setMouseEnabled(x=True, y=False)
+        view_box = item.getViewBox()
+        view_box.enableAutoRange(y=True)
+        view_box.setAutoVisible(y=True)
+        view_box.sigRangeChangedManually.connect(self._on_manual_range)
+        view_box.sigXRangeChanged.connect(self._on_x_range_changed)
+        self.setToolTip("Rueda/arrastrar: zoom y desplazamiento · Doble clic: seguir / misión completa")
+
+    def add_curve(self, column: str, **kwargs):
+        """Crea una curva que dibuja la columna 'column' del historial."""
+        curve = self.plot(**kwargs)
+        self._curves.append((curve, column))
+        return curve
+
+    @Slot(object, float)
+    def show_history(self, history, current_time: float):
+        """Hay datos nuevos: mueve el eje X según el modo y redibuja."""
+        self.history = history
+        self.current_time = current_time
+        self._apply_mode()
+        self.redraw()
+
+    def redraw(self):
+        if self.history is None:
+            return
+        x0, x1 = self.getPlotItem().getViewBox().viewRange()[0]
+        max_points = max(int(self.getPlotItem().getViewBox().width()), 100)
+        for curve, column in self._curves:
+            curve.setData(*self.history.query(column, x0, x1, max_points))
+
+    def _apply_mode(self):
+        if self.mode == self.SEGUIR:
+            # Mismos bloques que la paginación anterior (también tras reiniciar)
+            current_max_x = max(math.ceil(self.current_time / self.window_size), 1) * self.window_size
+            self._set_x_range(current_max_x - self.window_size, current_max_x)
+        elif self.mode == self.COMPLETA and self.history is not None:
+            span = self.history.time_range()
+            if span and span[1] > span[0]:
+                self._set_x_range(*span)
+
+    def _set_x_range(self, x0: float, x1: float):
+        self._setting_range = True
+        try:
+            self.setXRange(x0, x1, padding=0)
+        finally:
+            self._setting_range = False
+
+    def _on_manual_range(self, *args):
+        self.mode = self.MANUAL
+
+    def _on_x_range_changed(self, *args):
+        # Zoom o desplazamiento del operador: se vuelve a pedir el rango visible
+        if not self._setting_range:
+            self.redraw()
+
+    def mouseDoubleClickEvent(self, event):
+        super().mouseDoubleClickEvent(event)
+        self.mode = self.COMPLETA if self.mode == self.SEGUIR else self.SEGUIR
+        self._apply_mode()
+        self.redraw()
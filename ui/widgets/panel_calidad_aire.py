@@ -14,6 +14,7 @@ from PySide6.QtGui import QColor
 
 # Importamos la paleta y numpy para los datos
 from ui.theme import PALETTE
+from ui.widgets.history_plot import HistoryPlot
 
 # (Configuramos el tema de pyqtgraph)
 pg.setConfigOption('background', None) 
@@ -23,18 +24,13 @@ pg.setConfigOption('antialias', True)
 class PanelCalidadAire(QFrame):
     """
     Panel que muestra las gráficas de Calidad del Aire (CO2/TVOC)
-    y Humedad con paginación automática del eje X.
+    y Humedad con el historial completo de la misión (ver HistoryPlot).
     """
     def __init__(self, parent=None):
         super().__init__(parent)
         # 1. El QFrame exterior obtiene el estilo
         self.setProperty("isPanel", True)
         
-        # --- VARIABLES PARA LA PAGINACIÓN (SCROLL) ---
-        self.current_max_x = 15.0  # Límite actual
-        self.window_size = 15.0    # Tamaño de ventana
-        # --------------------------------------------
-        
         # Layout principal (sin márgenes)
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -56,23 +52,20 @@ class PanelCalidadAire(QFrame):
         container_layout.addWidget(titulo)
 
         # --- 1. Gráfica Superior (CO2 y TVOC) ---
-        self.plot_gases = pg.PlotWidget()
+        self.plot_gases = HistoryPlot()
         self.plot_gases.showGrid(x=True, y=True, alpha=0.3)
         self.plot_gases.setLabel('left', 'Gases', units='ppm')
         self.plot_gases.setLabel('bottom', 'Tiempo', units='s')
-        self.plot_gases.getPlotItem().setMenuEnabled(False)
-        
-        # Configuración de Ejes
-        self.plot_gases.setXRange(0, 15)
-        self.plot_gases.setMouseEnabled(x=False, y=True) # Bloquear zoom X manual
         
         self.plot_gases.addLegend(offset=(10, 5))
 
-        self.line_co2 = self.plot_gases.plot(
+        self.line_co2 = self.plot_gases.add_curve(
+            'co2',
             pen=pg.mkPen(PALETTE['ACCENT']['ACTIVE'], width=2), 
             name="CO2"
         )
-        self.line_tvoc = self.plot_gases.plot(
+        self.line_tvoc = self.plot_gases.add_curve(
+            'tvoc',
             pen=pg.mkPen(PALETTE['STATUS']['WARNING'], width=2),
             name="TVOC"
         )
@@ -80,21 +73,17 @@ class PanelCalidadAire(QFrame):
         container_layout.addWidget(self.plot_gases, 1)
 
         # --- 2. Gráfica Inferior (Humedad) ---
-        self.plot_humedad = pg.PlotWidget()
+        self.plot_humedad = HistoryPlot()
         self.plot_humedad.showGrid(x=True, y=True, alpha=0.3)
         self.plot_humedad.setLabel('left', 'Humedad', units='%')
         self.plot_humedad.setLabel('bottom', 'Tiempo', units='s')
-        self.plot_humedad.getPlotItem().setMenuEnabled(False)
-        
-        # Configuración de Ejes
-        self.plot_humedad.setXRange(0, 15)
-        self.plot_humedad.setMouseEnabled(x=False, y=True) # Bloquear zoom X manual
         self.plot_humedad.getPlotItem().setAspectLocked(False)
         
         pen_hum = pg.mkPen(PALETTE['STATUS']['INFO'], width=2)
         brush_hum = (*QColor(PALETTE['STATUS']['INFO']).getRgb()[:3], 50)
         
-        self.line_humedad = self.plot_humedad.plot(
+        self.line_humedad = self.plot_humedad.add_curve(
+            'hum',
             pen=pen_hum,
             fillLevel=0, 
             brush=brush_hum
@@ -102,41 +91,13 @@ class PanelCalidadAire(QFrame):
         
         container_layout.addWidget(self.plot_humedad, 1)
 
-    # --- Lógica de Paginación del Eje X ---
-    def check_and_scroll_xaxis(self, current_time):
-        """
-        Verifica si el tiempo actual ha superado el límite.
-        Si es así, desplaza ambas gráficas al siguiente bloque de 15s.
-        """
-        if current_time > self.current_max_x:
-            while current_time > self.current_max_x:
-                self.current_max_x += self.window_size
-            
-            min_x = self.current_max_x - self.window_size
-            max_x = self.current_max_x
-            
-            # Aplicar a AMBAS gráficas para mantener sincronía
-            self.plot_gases.setXRange(min_x, max_x)
-            self.plot_humedad.setXRange(min_x, max_x)
-
     # --- SLOTS DE ACTUALIZACIÓN ---
 
-    @Slot(list, list, list)
-    def update_gases_graph(self, x_data: list, co2_data: list, tvoc_data: list):
-        """
-        Actualiza la gráfica superior con nuevos datos de CO2 y TVOC.
-        """
-        if x_data:
-            self.check_and_scroll_xaxis(x_data[-1])
-            self.line_co2.setData(x_data, co2_data)
-            self.line_tvoc.setData(x_data, tvoc_data)
-    
-    @Slot(list, list)
-    def update_humidity_graph(self, x_data: list, humidity_data: list):
+    @Slot(object, float)
+    def update_history(self, history, current_time: float):
         """
-        Actualiza la gráfica inferior con nuevos datos de Humedad.
+        Redibuja ambas gráficas (CO2/TVOC y Humedad) desde el historial
+        completo de la misión.
         """
-        if x_data:
-            # (La comprobación ya se hace arriba, pero no daña repetirla si llegan desfasados)
-            self.check_and_scroll_xaxis(x_data[-1])
-            self.line_humedad.setData(x_data, humidity_data)
+        self.plot_gases.show_history(history, current_time)
+        self.plot_humedad.show_history(history, current_time)
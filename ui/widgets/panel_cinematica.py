@@ -127,7 +127,10 @@ class PanelCinematica(QFrame):
             
         if 'vel' in data:
             val_vel = data['vel']
-            self.label_vel.setText(f"{val_vel:.1f} m/s")
+            if 'sigma_vel' in data:
+                self.label_vel.setText(f"{val_vel:.1f} ± {data['sigma_vel']:.1f} m/s")
+            else:
+                self.label_vel.setText(f"{val_vel:.1f} m/s")
             self.vel_bar.setValue(int(val_vel))
             
         if 'yaw' in data:
@@ -6,16 +6,84 @@
 # ui/widgets/panel_estados.py
 
 from PySide6.QtWidgets import QWidget, QLabel, QFrame, QVBoxLayout, QGridLayout
-from PySide6.QtCore import Slot, Qt, QSize
-from PySide6.QtGui import QColor
+from PySide6.QtCore import Slot, Qt, QSize, QRectF, QPointF
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen, QPixmap, QRadialGradient
 from ui.theme import PALETTE
 
 # (Importamos los colores de tu tema si los necesitas,
 # pero usaremos los colores de estado estándar que ya definimos)
 
+# Degradados del LED: (centro, borde)
+LED_COLORES = {
+    True: ("#8BC34A", "#4CAF50"),   # Verde
+    False: ("#E45349", "#8E1D15"),  # Rojo
+}
+
+# Colores del recuadro de etapa: (fondo, texto, borde)
+ETAPA_COLORES = {
+    "LANZAMIENTO": (PALETTE['STATUS']['DANGER'], "black", PALETTE['STATUS']['DANGER']),
+    "ASCENSO": (PALETTE['STATUS']['WARNING'], "black", PALETTE['STATUS']['WARNING']),
+    "APOGEO": (PALETTE['ACCENT']['ACTIVE'], "black", PALETTE['ACCENT']['ACTIVE']),
+    "RECUPERACION": (PALETTE['STATUS']['SUCCESS'], "black", PALETTE['STATUS']['SUCCESS']),
+    # Fases que detecta la estación (core.flight_events)
+    "PROPULSADO": (PALETTE['STATUS']['DANGER'], "black", PALETTE['STATUS']['DANGER']),
+    "COSTEO": (PALETTE['STATUS']['WARNING'], "black", PALETTE['STATUS']['WARNING']),
+    "DESCENSO": (PALETTE['ACCENT']['ACTIVE'], "black", PALETTE['ACCENT']['ACTIVE']),
+    "PARACAIDAS": (PALETTE['STATUS']['INFO'], "black", PALETTE['STATUS']['INFO']),
+    "ATERRIZADO": (PALETTE['STATUS']['SUCCESS'], "black", PALETTE['STATUS']['SUCCESS']),
+}
+ETAPA_DEFAULT = (PALETTE['BACKGROUND']['MAIN'], PALETTE['TEXT']['PRIMARY'], PALETTE['BORDER']['DEFAULT'])
+
 # --- 1. El Widget Reutilizable para el LED ---
 # (Puedes poner esta clase en el mismo archivo, arriba de PanelEstados)
 
+class LedLight(QWidget):
+    """
+    Círculo del LED pintado con QPainter (sin hojas de estilo).
+    Los dos estados se pintan una vez en QPixmap compartidos por todos
+    los LEDs; cambiar de estado solo elige otro pixmap y repinta.
+    """
+    _cache = {}  # (activo, tamaño, devicePixelRatio) -> QPixmap
+
+    def __init__(self, size: int = 25, parent=None):
+        super().__init__(parent)
+        self.setFixedSize(size, size)
+        self.active = False
+
+    def set_active(self, active: bool):
+        active = bool(active)
+        if active != self.active:
+            self.active = active
+            self.update()
+
+    def _pixmap(self) -> QPixmap:
+        dpr = self.devicePixelRatioF()
+        key = (self.active, self.width(), dpr)
+        pixmap = LedLight._cache.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            color_center, color_edge = LED_COLORES[self.active]
+            # Mismo degradado que la hoja de estilo anterior (radius 0.8, esquinas de 10px)
+            rect = QRectF(0, 0, self.width(), self.height())
+            gradient = QRadialGradient(rect.center(), 0.8 * self.width(), rect.center())
+            gradient.setColorAt(0, QColor(color_center))
+            gradient.setColorAt(1, QColor(color_edge))
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(gradient)
+            painter.drawRoundedRect(rect, 10, 10)
+            painter.end()
+            LedLight._cache[key] = pixmap
+        return pixmap
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._pixmap())
+
+
 class LedIndicator(QWidget):
     """
     Un widget simple que muestra un círculo (LED)
@@ -30,42 +98,68 @@ class LedIndicator(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(5)
         
-        self.led = QWidget()
-        self.led.setFixedSize(25, 25)
+        self.led = LedLight(25)
         
         self.label = QLabel(text)
         self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         layout.addWidget(self.led, alignment=Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.label)
-        
-        self.set_active(False)
 
     def set_active(self, active: bool):
         """
-        Cambia el color del LED con un degradado radial.
+        Cambia el color del LED (verde/rojo). Si el estado no cambió no
+        hace nada.
         """
-        
-        if active:
-            # Colores para el degradado VERDE
-            color_center = "#8BC34A" # Verde más claro para el centro
-            color_edge = "#4CAF50"   # Verde más oscuro para el borde
-        else:
-            # Colores para el degradado ROJO
-            color_center = "#E45349" # Rojo más claro para el centro
-            color_edge = "#8E1D15"   # Rojo más oscuro para el borde
-            
-        self.led.setStyleSheet(f"""
-            QWidget {{
-                /* Degradado Radial: desde el centro hacia afuera */
-                background: qradialgradient(
-                    cx: 0.5, cy: 0.5, radius: 0.8, fx: 0.5, fy: 0.5, 
-                    stop: 0 {color_center}, 
-                    stop: 1 {color_edge}
-                );
-                border-radius: 10px; /* La mitad del FixedSize para un círculo perfecto */
-            }}
-        """)        # --- 2. El Panel de Estados Principal ---
+        self.led.set_active(active)
+
+
+class StageBadge(QWidget):
+    """
+    Recuadro de color con la etapa de la misión, pintado con QPainter.
+    set_stage() no hace nada si la etapa no cambió.
+    """
+    def __init__(self, text: str = "EN ESPERA", parent=None):
+        super().__init__(parent)
+        self.stage = None
+        self._colors = ETAPA_DEFAULT
+        self.set_stage(text)
+
+    def set_stage(self, text: str):
+        text = text.upper()
+        if text == self.stage:
+            return
+        self.stage = text
+        self._colors = ETAPA_COLORES.get(text, ETAPA_DEFAULT)
+        self.update()
+
+    def _bold_font(self) -> QFont:
+        font = QFont(self.font())
+        font.setBold(True)
+        return font
+
+    def sizeHint(self) -> QSize:
+        # Ancho de la etapa más larga: cambiar de etapa no mueve el layout
+        fm = QFontMetrics(self._bold_font())
+        width = max(fm.horizontalAdvance(t) for t in (*ETAPA_COLORES, "EN ESPERA", self.stage))
+        return QSize(width + 16, fm.height() + 6)
+
+    def minimumSizeHint(self) -> QSize:
+        return self.sizeHint()
+
+    def paintEvent(self, event):
+        background, text_color, border = self._colors
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        rect = QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5)
+        painter.setPen(QPen(QColor(border), 1))
+        painter.setBrush(QColor(background))
+        painter.drawRoundedRect(rect, 4, 4)
+        painter.setPen(QColor(text_color))
+        painter.setFont(self._bold_font())
+        painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, self.stage)
+
+# --- 2. El Panel de Estados Principal ---
 
 class PanelEstados(QFrame): 
     
@@ -116,23 +210,29 @@ class PanelEstados(QFrame):
         label_titulo_etapa.setStyleSheet("font-weight: bold; font-size: 14;")
         main_layout.addWidget(label_titulo_etapa)
         
-        # 4. Recuadro de color para la Etapa
-        self.label_etapa_mision = QLabel("EN ESPERA") 
-        self.label_etapa_mision.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        # Estilo inicial
-        self.label_etapa_mision.setStyleSheet(f"""
-            QLabel {{
-                background-color: {PALETTE['BACKGROUND']['MAIN']};
-                color: {PALETTE['TEXT']['PRIMARY']};
-                font-weight: bold;
-                border: 1px solid {PALETTE['BORDER']['DEFAULT']};
-                border-radius: 4px;
-            }}
-        """) 
+        # 4. Recuadro de color para la Etapa (pintado, sin setStyleSheet por cambio)
+        self.label_etapa_mision = StageBadge("EN ESPERA")
         main_layout.addSpacing(30)
         main_layout.addWidget(self.label_etapa_mision)
         # --- --- --- --- --- --- --- ---
+
+        # 5. Fase detectada por la estación, apogeo previsto y eventos
+        main_layout.addSpacing(20)
+        label_titulo_fase = QLabel("Fase (estación):")
+        label_titulo_fase.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        label_titulo_fase.setStyleSheet("font-weight: bold; font-size: 14;")
+        main_layout.addWidget(label_titulo_fase)
+        self.badge_fase = StageBadge("EN RAMPA")
+        main_layout.addWidget(self.badge_fase)
+
+        self.label_apogeo = QLabel("Apogeo previsto: --")
+        self.label_apogeo.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        main_layout.addWidget(self.label_apogeo)
+        self.label_eventos = QLabel("")
+        self.label_eventos.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        main_layout.addWidget(self.label_eventos)
+        self._eventos = []
+        self._apogeo_text = None
         
         # Espacio flexible al final para empujar todo hacia arriba
         main_layout.addStretch(1) 
@@ -141,6 +241,7 @@ class PanelEstados(QFrame):
     def update_data(self, data: dict):
         """
         Slot público para actualizar los LEDs Y la etapa de la misión.
+        Los LEDs y el recuadro solo se repintan si su estado cambió.
         """
         
         # --- 1. Lógica de LEDs (existente) ---
@@ -157,38 +258,36 @@ class PanelEstados(QFrame):
         if 'sd' in data:
             self.led_sd.set_active(data['sd'])
             
-        # --- 2. Lógica de Etapa de Misión (MODIFICADA) ---
+        # --- 2. Lógica de Etapa de Misión ---
+        # (StageBadge ignora la etapa si es la misma que ya muestra)
         if 'etapa' in data:
-            etapa_texto = data['etapa'].upper()
-            color = PALETTE['BACKGROUND']['MAIN']
-            texto_color = PALETTE['TEXT']['PRIMARY']
-            
-            if etapa_texto == "LANZAMIENTO":
-                color = PALETTE['STATUS']['DANGER']
-                texto_color = "black"
-            elif etapa_texto == "ASCENSO":
-                color = PALETTE['STATUS']['WARNING']
-                texto_color = "black"
-            elif etapa_texto == "APOGEO":
-                color = PALETTE['ACCENT']['ACTIVE']
-                texto_color = "black"
-            elif etapa_texto == "RECUPERACION":
-                color = PALETTE['STATUS']['SUCCESS']
-                texto_color = "black"
-            elif etapa_texto == "EN ESPERA":
-                color = PALETTE['BACKGROUND']['MAIN']
-                texto_color = PALETTE['TEXT']['PRIMARY']
-            
-            # Actualizar el texto del RECUADRO
-            self.label_etapa_mision.setText(f"{etapa_texto}")
-            
-            # Actualizar el estilo
-            self.label_etapa_mision.setStyleSheet(f"""
-                QLabel {{
-                    background-color: {color};
-                    color: {texto_color};
-                    font-weight: bold;
-                    border: 1px solid {color if etapa_texto != "EN ESPERA" else PALETTE['BORDER']['DEFAULT']};
-                    border-radius: 4px;
-                }}
-            """)
+            self.label_etapa_mision.set_stage(data['etapa'])
+
+    @Slot(object)
+    def update_vuelo(self, prediction):
+        """Fase de la estación y apogeo previsto (ApogeePrediction, 20 Hz)."""
+        self.badge_fase.set_stage(prediction.phase)
+        if prediction.phase in ("PROPULSADO", "COSTEO") and prediction.time_to_apogee > 0:
+            text = f"Apogeo previsto: {prediction.apogee_alt:.0f} m en {prediction.time_to_apogee:.1f} s"
+        elif prediction.phase == "EN RAMPA":
+            text = "Apogeo previsto: --"
+        else:
+            text = f"Apogeo: {prediction.max_alt:.0f} m"
+        if text != self._apogeo_text:
+            self._apogeo_text = text
+            self.label_apogeo.setText(text)
+
+    @Slot(object)
+    def add_flight_event(self, event):
+        """Agrega un evento detectado (FlightEvent); un despegue inicia la lista."""
+        if event.name == "DESPEGUE":
+            self._eventos = []
+        self._eventos.append(f"{event.name}  t={event.t:.1f} s  {event.alt:.0f} m")
+        self.label_eventos.setText("\n".join(self._eventos))
+
+    def set_flight_events(self, events: list):
+        """Reemplaza la lista de eventos (p. ej. al cambiar de vehículo)."""
+        self._eventos = []
+        self.label_eventos.setText("")
+        for event in events:
+            self.add_flight_event(event)
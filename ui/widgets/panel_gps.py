@@ -4,8 +4,11 @@
 # AÑO: 2025 CREADOR: Christian Yael Ramírez León
 
 import io
+import json
 
 import folium
+from branca.element import MacroElement
+from jinja2 import Template
 from PySide6.QtCore import Qt, Slot
 from PySide6.QtWebEngineWidgets import QWebEngineView
 from PySide6.QtWidgets import (
@@ -17,6 +20,10 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from ui.tile_scheme import TILE_TEMPLATE, asset_url, tile_handler_installed
+
+ESRI_TILES = "https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}"
+
 
 class PanelGPS(QWidget):
 
@@ -44,7 +51,12 @@ class PanelGPS(QWidget):
         main_layout.addWidget(self.gps_frame, 3)  # 75% ancho
         main_layout.addWidget(self.info_panel, 1)  # 25% ancho
 
-        # Cargar mapa inicial
+        # El mapa se carga una sola vez; después solo se le envía JavaScript
+        self._page_ready = False
+        self._pending_points = []
+        self._last_point = None
+        self._pending_landing = None
+        self.gps_w.loadFinished.connect(self._on_load_finished)
         self._renderizar_mapa([19.4284, -99.1276], init=True)
 
     def _crear_panel_info(self) -> QFrame:
@@ -73,6 +85,8 @@ class PanelGPS(QWidget):
         label_lon_static = QLabel("Longitud:")
         label_start_static = QLabel("T. de inicio:")
         label_flight_static = QLabel("T. de vuelo:")
+        label_landing_static = QLabel("Aterrizaje:")
+        label_ellipse_static = QLabel("Elipse 95 %:")
 
         label_lat_static.setAlignment(
             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
@@ -86,12 +100,20 @@ class PanelGPS(QWidget):
         label_flight_static.setAlignment(
             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
         )
+        label_landing_static.setAlignment(
+            Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        )
+        label_ellipse_static.setAlignment(
+            Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        )
 
         # --- Etiquetas de Datos (Columna 1) ---
         self.label_lat_data = QLabel("--")
         self.label_lon_data = QLabel("--")
         self.label_start_time_data = QLabel("--")
         self.label_flight_time_data = QLabel("--")
+        self.label_landing_data = QLabel("--")
+        self.label_ellipse_data = QLabel("--")
 
         # --- Añadir al Grid (con filas modificadas) ---
         # Fila 0: Latitud
@@ -111,6 +133,12 @@ class PanelGPS(QWidget):
         # Fila 4: T. de vuelo
         data_layout.addWidget(label_flight_static, 4, 0)
         data_layout.addWidget(self.label_flight_time_data, 4, 1)
+        # Fila 5: Zona de aterrizaje prevista (solo en el descenso)
+        data_layout.addWidget(label_landing_static, 5, 0)
+        data_layout.addWidget(self.label_landing_data, 5, 1)
+        # Fila 6: Tamaño de la elipse y tiempo restante
+        data_layout.addWidget(label_ellipse_static, 6, 0)
+        data_layout.addWidget(self.label_ellipse_data, 6, 1)
 
         # Añadir el grid al layout principal del panel
         main_panel_layout.addLayout(data_layout)
@@ -122,26 +150,57 @@ class PanelGPS(QWidget):
         return panel
 
     def _renderizar_mapa(self, location: list, init=False):
-        """Función interna para actualizar el mapa Folium."""
+        """
+        Genera la página del mapa (Folium) una sola vez. Agrega el marcador,
+        la trayectoria y la función gsUpdate() que usa update_data().
+        """
+        # Con la caché de teselas instalada, teselas y Leaflet salen del disco
+        offline = tile_handler_installed()
         m = folium.Map(
             location=location,
             zoom_start=18 if not init else 6,
-            tiles="https://server.arcgisonline.com/ArcGIS/rest/services/World_Imagery/MapServer/tile/{z}/{y}/{x}",
+            tiles=TILE_TEMPLATE if offline else ESRI_TILES,
             attr="Esri World Imagery",
+            max_zoom=19,
         )
-        if not init:
-            folium.CircleMarker(
-                location=location,
-                radius=6,
-                color="red",
-                fill=True,
-                border=True,
-                opacity=1,
-            ).add_to(m)
+        if offline:
+            m.default_js = [(name, asset_url(url)) for name, url in folium.Map.default_js]
+            m.default_css = [(name, asset_url(url)) for name, url in folium.Map.default_css]
+        m.add_child(_SeguimientoGPS())
         data = io.BytesIO()
         m.save(data, close_file=False)
+        self._page_ready = False
         self.gps_w.setHtml(data.getvalue().decode())
 
+    @Slot(bool)
+    def _on_load_finished(self, ok: bool):
+        self._page_ready = ok
+        if ok and self._pending_points:
+            self._enviar_puntos(self._pending_points)
+            self._pending_points = []
+        if ok and self._pending_landing:
+            self._enviar_aterrizaje(self._pending_landing)
+            self._pending_landing = None
+
+    def _enviar_puntos(self, points: list):
+        self.gps_w.page().runJavaScript(f"gsUpdate({json.dumps(points)});")
+
+    def _enviar_aterrizaje(self, prediction):
+        center = [round(prediction.lat, 7), round(prediction.lon, 7)]
+        self.gps_w.page().runJavaScript(
+            f"gsLanding({json.dumps(center)}, {json.dumps(prediction.polygon)});"
+        )
+
+    def clear_track(self):
+        """Borra la trayectoria, el marcador y la zona de aterrizaje (nueva sesión)."""
+        self._pending_points = []
+        self._last_point = None
+        self._pending_landing = None
+        self.label_landing_data.setText("--")
+        self.label_ellipse_data.setText("--")
+        if self._page_ready:
+            self.gps_w.page().runJavaScript("gsClear();")
+
     @Slot(dict)
     def update_data(self, data: dict):
         """
@@ -149,9 +208,15 @@ class PanelGPS(QWidget):
         y las etiquetas de datos separadas.
         """
 
-        # Actualizar Mapa
+        # Actualizar Mapa (solo si la posición cambió)
         if "location" in data:
-            self._renderizar_mapa(data["location"])
+            point = [round(data["location"][0], 7), round(data["location"][1], 7)]
+            if point != self._last_point:
+                self._last_point = point
+                if self._page_ready:
+                    self._enviar_puntos([point])
+                else:
+                    self._pending_points.append(point)
 
             # --- Actualizar las etiquetas de DATOS ---
             self.label_lat_data.setText(f"{data['location'][0]:.6f}")
@@ -164,3 +229,66 @@ class PanelGPS(QWidget):
         # Actualizar T. de vuelo
         if "flight_time" in data:
             self.label_flight_time_data.setText(f"{data['flight_time']:.2f} s")
+
+    @Slot(object)
+    def update_landing(self, prediction):
+        """Dibuja la elipse de aterrizaje prevista (core.landing.LandingPrediction)."""
+        self.label_landing_data.setText(f"{prediction.lat:.6f}, {prediction.lon:.6f}")
+        self.label_ellipse_data.setText(
+            f"{prediction.semi_major:.0f} x {prediction.semi_minor:.0f} m, {prediction.time_to_landing:.0f} s"
+        )
+        if self._page_ready:
+            self._enviar_aterrizaje(prediction)
+        else:
+            self._pending_landing = prediction
+
+
+class _SeguimientoGPS(MacroElement):
+    """
+    Script que Folium inserta después de crear el mapa.
+    gsUpdate([[lat, lon], ...]) agrega puntos a la trayectoria, mueve el
+    marcador y solo desplaza el mapa si la posición sale del área central.
+    gsLanding(centro, polígono) dibuja la elipse de aterrizaje prevista.
+    """
+
+    _template = Template("""
+{% macro script(this, kwargs) %}
+var gsMap = {{ this._parent.get_name() }};
+var gsTrack = L.polyline([], {color: '#00E5FF', weight: 2, opacity: 0.8}).addTo(gsMap);
+var gsMarker = L.circleMarker([0, 0], {radius: 6, color: 'red', fill: true, opacity: 1});
+var gsCentered = false;
+var gsLandingZone = L.polygon([], {color: '#FFEB3B', weight: 2, fillOpacity: 0.15, dashArray: '6 4'});
+var gsLandingPoint = L.circleMarker([0, 0], {radius: 4, color: '#FFEB3B', fill: true, fillOpacity: 1});
+window.gsUpdate = function (points) {
+    for (var i = 0; i < points.length; i++) {
+        gsTrack.addLatLng(points[i]);
+    }
+    var last = points[points.length - 1];
+    gsMarker.setLatLng(last);
+    if (!gsMap.hasLayer(gsMarker)) {
+        gsMarker.addTo(gsMap);
+    }
+    if (!gsCentered) {
+        gsMap.setView(last, 18);
+        gsCentered = true;
+    } else if (!gsMap.getBounds().pad(-0.25).contains(last)) {
+        gsMap.panTo(last);
+    }
+};
+window.gsLanding = function (center, polygon) {
+    gsLandingZone.setLatLngs(polygon);
+    gsLandingPoint.setLatLng(center);
+    if (!gsMap.hasLayer(gsLandingZone)) {
+        gsLandingZone.addTo(gsMap);
+        gsLandingPoint.addTo(gsMap);
+    }
+};
+window.gsClear = function () {
+    gsTrack.setLatLngs([]);
+    gsMarker.remove();
+    gsLandingZone.remove();
+    gsLandingPoint.remove();
+    gsCentered = false;
+};
+{% endmacro %}
+""")
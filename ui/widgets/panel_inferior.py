@@ -5,12 +5,16 @@
 
 # ui/widgets/panel_inferior.py
 
+from collections import deque
+
 from PySide6.QtWidgets import (
     QWidget, QFrame, QHBoxLayout, QVBoxLayout, QGridLayout,
-    QLabel, QProgressBar, QGroupBox, QTextEdit, QPushButton
+    QLabel, QProgressBar, QGroupBox, QPlainTextEdit, QPushButton
+)
+from PySide6.QtCore import Signal, Slot, Qt, QSize, QRectF, QTime
+from PySide6.QtGui import (
+    QPainter, QColor, QPen, QBrush, QRadialGradient, QTextCharFormat, QTextCursor
 )
-from PySide6.QtCore import Slot, Qt, QSize, QRectF, QTime
-from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QRadialGradient
 
 # Importamos la paleta para los colores de la gráfica
 from ui.theme import PALETTE
@@ -66,10 +70,103 @@ class PieChartWidget(QWidget):
         painter.drawPie(rect, start_angle, int(angle_received))
 
 # --- --- --- --- --- --- --- --- --- --- ---
-# --- 2. TU PANEL INFERIOR (Modificado) ---
+# --- 2. WIDGET: Log de mensajes acotado ---
+# --- --- --- --- --- --- --- --- --- --- ---
+
+class MessageLog(QPlainTextEdit):
+    """
+    Log de mensajes de solo lectura con un máximo de líneas.
+
+    add_message() solo encola; flush() agrega todo lo pendiente de una vez
+    (lo llama el FrameScheduler una vez por cuadro). Los mensajes repetidos
+    seguidos se juntan en una sola línea con un contador "xN".
+    """
+    MAX_LINES = 500
+
+    def __init__(self, max_lines: int = MAX_LINES, parent=None):
+        super().__init__(parent)
+        self.setReadOnly(True)
+        self.setMaximumBlockCount(max_lines)
+        self.setUndoRedoEnabled(False)
+        # Lo pendiente nunca supera lo que cabe en pantalla
+        self._pending = deque(maxlen=max_lines)  # [hora, mensaje, tipo, repeticiones]
+        self._last_key = None
+        self._last_count = 0
+        self._time_format = QTextCharFormat()
+        self._time_format.setForeground(QColor(PALETTE['TEXT']['SECONDARY']))
+        self._formats = {}
+
+    def _format(self, status_type: str) -> QTextCharFormat:
+        fmt = self._formats.get(status_type)
+        if fmt is None:
+            # Color según el tipo de estado
+            if status_type == "danger":
+                color = PALETTE['STATUS']['DANGER']
+            elif status_type == "success":
+                color = PALETTE['STATUS']['SUCCESS']
+            elif status_type == "info":
+                color = PALETTE['TEXT']['SECONDARY']
+            else:
+                color = PALETTE['TEXT']['PRIMARY']
+            fmt = self._formats[status_type] = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+        return fmt
+
+    def add_message(self, message: str, status_type: str) -> bool:
+        """Encola un mensaje. Devuelve True si la cola estaba vacía."""
+        timestamp = QTime.currentTime().toString("hh:mm:ss")
+        was_empty = not self._pending
+        last = self._pending[-1] if self._pending else None
+        if last and last[1] == message and last[2] == status_type:
+            last[0] = timestamp
+            last[3] += 1
+        else:
+            self._pending.append([timestamp, message, status_type, 1])
+        return was_empty
+
+    def flush(self) -> bool:
+        """Escribe lo pendiente en un solo bloque de edición. False si no había nada."""
+        if not self._pending:
+            return False
+        scrollbar = self.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum()
+        cursor = QTextCursor(self.document())
+        cursor.beginEditBlock()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        while self._pending:
+            timestamp, message, status_type, count = self._pending.popleft()
+            if (message, status_type) == self._last_key:
+                # Mismo mensaje que la última línea: se reescribe con el contador
+                self._last_count += count
+                cursor.movePosition(QTextCursor.MoveOperation.StartOfBlock, QTextCursor.MoveMode.KeepAnchor)
+                cursor.removeSelectedText()
+            else:
+                self._last_key = (message, status_type)
+                self._last_count = count
+                if not self.document().isEmpty():
+                    cursor.insertBlock()
+            cursor.insertText(f"[{timestamp}] ", self._time_format)
+            text = message if self._last_count == 1 else f"{message}  x{self._last_count}"
+            cursor.insertText(text, self._format(status_type))
+        cursor.endEditBlock()
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+        return True
+
+    def clear(self):
+        super().clear()
+        self._pending.clear()
+        self._last_key = None
+        self._last_count = 0
+
+# --- --- --- --- --- --- --- --- --- --- ---
+# --- 3. TU PANEL INFERIOR (Modificado) ---
 # --- --- --- --- --- --- --- --- --- --- ---
 
 class PanelInferior(QFrame):
+    # Hay mensajes en cola: la GUI debe programar un flush_log()
+    log_pending = Signal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFrameShape(QFrame.Shape.StyledPanel)
@@ -98,8 +195,7 @@ class PanelInferior(QFrame):
         layout_izquierdo.addLayout(baterias_layout)
         grupo_emergencia = QGroupBox("Mensajes")
         layout_emergencia = QVBoxLayout(grupo_emergencia)
-        self.log_emergencia = QTextEdit()
-        self.log_emergencia.setReadOnly(True)
+        self.log_emergencia = MessageLog()
         self.log_emergencia.setPlaceholderText("Esperando mensajes...")
         layout_emergencia.addWidget(self.log_emergencia)
         layout_izquierdo.addWidget(grupo_emergencia)
@@ -192,30 +288,18 @@ class PanelInferior(QFrame):
     
     @Slot(str)
     def add_mensaje_emergencia(self, mensaje: str):
-        self.log_emergencia.append(f"[ERROR] {mensaje}") 
+        self.add_log_message(f"[ERROR] {mensaje}", "danger")
 
     def add_log_message(self, message: str, status_type: str):
         """
-        Añade un mensaje al log de mensajes, con formato y color.
+        Encola un mensaje para el log (se escribe en el siguiente flush_log).
         """
-        timestamp = QTime.currentTime().toString("hh:mm:ss")
-        
-        # Asignar color basado en el tipo de estado
-        if status_type == "danger":
-            color = PALETTE['STATUS']['DANGER']
-        elif status_type == "success":
-            color = PALETTE['STATUS']['SUCCESS']
-        elif status_type == "info":
-            color = PALETTE['TEXT']['SECONDARY']
-        else:
-            color = PALETTE['TEXT']['PRIMARY']
-        
-        # Usamos HTML simple para el color
-        log_entry = f"""
-            <span style="color: {PALETTE['TEXT']['SECONDARY']};">[{timestamp}] </span>
-            <span style="color: {color};">{message}</span>
-        """
-        self.log_emergencia.append(log_entry)
+        if self.log_emergencia.add_message(message, status_type):
+            self.log_pending.emit()
+
+    def flush_log(self) -> bool:
+        """Escribe los mensajes en cola. False si no había ninguno."""
+        return self.log_emergencia.flush()
         
     @Slot(int, int)
     def update_packet_summary(self, received: int, lost: int):